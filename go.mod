@@ -19,6 +19,7 @@ require (
 	github.com/tidwall/gjson v1.17.1
 	github.com/vitali-fedulov/imagehash2 v1.0.3
 	github.com/vitali-fedulov/images4 v1.3.1
+	golang.org/x/net v0.47.0
 	golang.org/x/oauth2 v0.24.0
 	google.golang.org/api v0.210.0
 	google.golang.org/genai v1.43.0
@@ -90,7 +91,6 @@ require (
 	go.opentelemetry.io/otel/trace v1.29.0 // indirect
 	golang.org/x/crypto v0.44.0 // indirect
 	golang.org/x/exp v0.0.0-20250218142911-aa4b98e5adaa // indirect
-	golang.org/x/net v0.47.0 // indirect
 	golang.org/x/sys v0.38.0 // indirect
 	golang.org/x/text v0.31.0 // indirect
 	google.golang.org/appengine v1.6.8 // indirect
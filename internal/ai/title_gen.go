@@ -662,10 +662,13 @@ func GetAPIKey() string {
 	return key
 }
 
+// factHTTPClient is reused across GetRandomFact calls so repeated lookups keep
+// a warm connection to the facts API instead of building a client per call.
+var factHTTPClient = &http.Client{Timeout: 5 * time.Second}
+
 // GetRandomFact retrieves a random fact from a public API
 func GetRandomFact(ctx context.Context) string {
 	// Try to get a fact from uselessfacts API
-	client := &http.Client{Timeout: 5 * time.Second}
 	req, err := http.NewRequestWithContext(ctx, "GET", "https://uselessfacts.jsph.pl/random.json?language=en", nil)
 	if err != nil {
 		return "Did you know? Meme videos are the best! 🎬"
@@ -673,7 +676,7 @@ func GetRandomFact(ctx context.Context) string {
 
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
 
-	resp, err := client.Do(req)
+	resp, err := factHTTPClient.Do(req)
 	if err != nil {
 		return "Did you know? Meme videos are the best! 🎬"
 	}
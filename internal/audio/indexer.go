@@ -5,7 +5,6 @@ import (
 	"crypto/sha256"
 	"encoding/hex"
 	"fmt"
-	"io"
 	"math/rand"
 	"os"
 	"os/exec"
@@ -63,13 +62,30 @@ func (idx *Indexer) EnsureSongs(ctx context.Context) error {
 
 	idx.log.Infof("audio: found %d playlists", len(playlists))
 
-	cookiesFile, err := idx.fetchCookiesFile(ctx)
-	if err != nil {
-		idx.log.Warnf("audio: could not load youtube_cookies.txt from S3 (%v), proceeding without cookies", err)
-	} else if cookiesFile != "" {
-		defer os.Remove(cookiesFile)
-		idx.log.Infof("audio: loaded youtube cookies from S3")
+	// Cookies are only needed by yt-dlp, so they are fetched once, on the
+	// first new song — most runs find nothing new and skip the S3 read and
+	// temp file entirely.
+	var cookiesFile string
+	cookiesLoaded := false
+	loadCookies := func() string {
+		if cookiesLoaded {
+			return cookiesFile
+		}
+		cookiesLoaded = true
+		f, err := idx.fetchCookiesFile(ctx)
+		if err != nil {
+			idx.log.Warnf("audio: could not load youtube_cookies.txt from S3 (%v), proceeding without cookies", err)
+		} else if f != "" {
+			cookiesFile = f
+			idx.log.Infof("audio: loaded youtube cookies from S3")
+		}
+		return cookiesFile
 	}
+	defer func() {
+		if cookiesFile != "" {
+			os.Remove(cookiesFile)
+		}
+	}()
 
 	client := youtube.Client{}
 	newSongsCount := 0
@@ -87,7 +103,7 @@ func (idx *Indexer) EnsureSongs(ctx context.Context) error {
 				continue
 			}
 			idx.log.Infof("audio: downloading new song: %s (%s)", entry.Title, entry.ID)
-			if err := idx.downloadAndStoreSong(ctx, entry, &songsIdx, cookiesFile); err != nil {
+			if err := idx.downloadAndStoreSong(ctx, entry, &songsIdx, loadCookies()); err != nil {
 				idx.log.Errorf("download song %s: %v", entry.ID, err)
 			} else {
 				newSongsCount++
@@ -152,7 +168,7 @@ func (idx *Indexer) downloadSongAttempt(ctx context.Context, entry *youtube.Play
 
 	idx.log.Infof("audio: downloading stream via yt-dlp for %s", entry.ID)
 	var stderr strings.Builder
-	cmd := exec.CommandContext(ctx, "yt-dlp", args...)
+	cmd := exec.CommandContext(ctx, ytdlpBin(), args...)
 	cmd.Stderr = &stderr
 	if err := cmd.Run(); err != nil {
 		return fmt.Errorf("yt-dlp: %w (stderr: %s)", err, strings.TrimSpace(stderr.String()))
@@ -160,7 +176,7 @@ func (idx *Indexer) downloadSongAttempt(ctx context.Context, entry *youtube.Play
 	idx.log.Infof("audio: stream downloaded successfully: %s", entry.ID)
 
 	var probeStderr strings.Builder
-	probeCmd := exec.CommandContext(ctx, "ffprobe",
+	probeCmd := exec.CommandContext(ctx, ffprobeBin(),
 		"-v", "error",
 		"-select_streams", "a:0",
 		"-show_entries", "stream=duration",
@@ -343,7 +359,7 @@ func (idx *Indexer) DownloadSongToTemp(ctx context.Context, song *model.Song) (s
 	}
 	defer f.Close()
 
-	written, err := io.Copy(f, reader.Reader)
+	written, err := reader.WriteTo(f)
 	if err != nil {
 		os.Remove(tmpFile)
 		return "", fmt.Errorf("copy from S3 stream: %w", err)
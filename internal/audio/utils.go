@@ -2,11 +2,23 @@ package audio
 
 import (
 	"math/rand"
-	"time"
+	"os/exec"
+	"sync"
 )
 
-func init() {
-	rand.Seed(time.Now().UnixNano())
+// The yt-dlp and ffprobe binaries are resolved on PATH once per process
+// instead of on every download (as in the video package). If the lookup
+// fails the bare name is kept so exec reports the usual error at run time.
+var (
+	ytdlpBin   = sync.OnceValue(func() string { return lookBin("yt-dlp") })
+	ffprobeBin = sync.OnceValue(func() string { return lookBin("ffprobe") })
+)
+
+func lookBin(name string) string {
+	if p, err := exec.LookPath(name); err == nil {
+		return p
+	}
+	return name
 }
 
 func randomIndex(n int) int {
@@ -1,32 +1,69 @@
 package bot
 
 import (
-	"bufio"
+	"bytes"
+	"io"
 	"os"
+	"strings"
 )
 
+// tailWindow is how much of the file TailLastNLines reads first; the window
+// doubles until it holds n complete lines or covers the whole file.
+const tailWindow = 256 * 1024
+
 func TailLastNLines(path string, n int) ([]string, error) {
+	if n <= 0 {
+		return nil, nil
+	}
+
 	f, err := os.Open(path)
 	if err != nil {
 		return nil, err
 	}
 	defer f.Close()
 
-	// Simple approach: scan all lines, keep last n.
-	// errors.log is expected to stay small-ish; if it grows, we can optimize later.
-	buf := make([]string, 0, n)
-	s := bufio.NewScanner(f)
-	for s.Scan() {
-		line := s.Text()
-		if len(buf) < n {
-			buf = append(buf, line)
-			continue
+	size, err := f.Seek(0, io.SeekEnd)
+	if err != nil {
+		return nil, err
+	}
+	if size == 0 {
+		return []string{}, nil
+	}
+
+	// Read only the tail of the file and locate line breaks with byte search
+	// instead of scanning every line from the start.
+	var buf []byte
+	for window := int64(tailWindow); ; window *= 2 {
+		start := size - window
+		if start < 0 {
+			start = 0
+		}
+		buf = make([]byte, size-start)
+		if _, err := f.ReadAt(buf, start); err != nil && err != io.EOF {
+			return nil, err
+		}
+		// Only the newline ending the last line is a terminator; blank
+		// lines before it are kept, as bufio.Scanner would.
+		buf = bytes.TrimSuffix(buf, []byte("\n"))
+		// With n newlines in the window, the last n lines all start inside it.
+		if start == 0 || bytes.Count(buf, []byte("\n")) >= n {
+			break
 		}
-		copy(buf, buf[1:])
-		buf[n-1] = line
 	}
-	if err := s.Err(); err != nil {
-		return nil, err
+
+	cut := len(buf)
+	for found := 0; found < n; found++ {
+		i := bytes.LastIndexByte(buf[:cut], '\n')
+		if i < 0 {
+			cut = -1
+			break
+		}
+		cut = i
+	}
+
+	lines := strings.Split(string(buf[cut+1:]), "\n")
+	for i, line := range lines {
+		lines[i] = strings.TrimSuffix(line, "\r")
 	}
-	return buf, nil
+	return lines, nil
 }
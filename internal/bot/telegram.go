@@ -128,7 +128,7 @@ func (b *TelegramBot) Run(ctx context.Context) error {
 			if upd.Message != nil && upd.Message.IsCommand() {
 				b.handleCommand(ctx, upd.Message)
 			} else if upd.Message != nil && upd.Message.Document != nil {
-				b.handleDocument(ctx, upd.Message)
+				go b.handleDocument(ctx, upd.Message)
 			} else if upd.Message != nil && upd.Message.Text != "" {
 				// Check if user is in track search mode
 				chatID := upd.Message.Chat.ID
@@ -172,6 +172,8 @@ func (b *TelegramBot) handleCommand(ctx context.Context, msg *tgbotapi.Message)
 	// Save POSTS_CHAT_ID on any command (if not already set)
 	go b.savePostsChatIDIfNeeded(ctx, chatID)
 
+	// Long-running commands (S3 sweeps, AI calls, file transfers) run in their
+	// own goroutine so the update loop keeps serving other messages.
 	switch cmd {
 	case "start":
 		b.replyText(chatID, "Привет! Я бот для генерации мем-видео. Наберите /help для списка команд.")
@@ -184,7 +186,7 @@ func (b *TelegramBot) handleCommand(ctx context.Context, msg *tgbotapi.Message)
 	case "idea":
 		b.cmdIdea(ctx, chatID, msg.CommandArguments())
 	case "aidea":
-		b.cmdAidea(ctx, chatID)
+		go b.cmdAidea(ctx, chatID)
 	case "status":
 		b.cmdStatus(ctx, chatID)
 	case "chatid":
@@ -196,17 +198,17 @@ func (b *TelegramBot) handleCommand(ctx context.Context, msg *tgbotapi.Message)
 	case "setnext":
 		b.cmdSetNext(ctx, chatID, msg.CommandArguments())
 	case "runscheduled":
-		b.cmdRunScheduled(ctx, chatID)
+		go b.cmdRunScheduled(ctx, chatID)
 	case "clearschedule":
 		b.cmdClearSchedule(ctx, chatID)
 	case "clearsources":
-		b.cmdClearSources(ctx, chatID)
+		go b.cmdClearSources(ctx, chatID)
 	case "clearmemes":
-		b.cmdClearMemes(ctx, chatID)
+		go b.cmdClearMemes(ctx, chatID)
 	case "sync":
-		b.cmdSync(ctx, chatID)
+		go b.cmdSync(ctx, chatID)
 	case "forcecheck":
-		b.cmdForceCheck(ctx, chatID)
+		go b.cmdForceCheck(ctx, chatID)
 	case "checkfiles":
 		b.cmdCheckFiles(chatID)
 	case "uploadtoken":
@@ -214,9 +216,9 @@ func (b *TelegramBot) handleCommand(ctx context.Context, msg *tgbotapi.Message)
 	case "uploadclient":
 		b.cmdUploadClient(chatID)
 	case "syncfiles":
-		b.cmdSyncFiles(ctx, chatID)
+		go b.cmdSyncFiles(ctx, chatID)
 	case "downloadfiles":
-		b.cmdDownloadFiles(ctx, chatID)
+		go b.cmdDownloadFiles(ctx, chatID)
 	case "song":
 		b.cmdSong(ctx, chatID, msg.CommandArguments())
 	case "songs":
@@ -303,7 +305,7 @@ func (b *TelegramBot) handleCallback(ctx context.Context, cb *tgbotapi.CallbackQ
 		b.handleDislikeSlider(ctx, chatID, cb.Message.MessageID)
 	case "ideagen":
 		// memeID here is actually songID
-		b.handleIdeaGeneration(ctx, chatID, memeID)
+		go b.handleIdeaGeneration(ctx, chatID, memeID)
 	case "idealist":
 		// memeID here is actually offset
 		offset := 0
@@ -362,17 +364,24 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 		// Send status message "Publishing..."
 		statusMsgID := b.replyText(chatID, "⏳ Публикую на все платформы...")
 
-		// Initialize YouTube uploader from S3 if not already done
-		if _, err := b.svc.GetUploadersManager().GetUploader("youtube"); err != nil {
-			b.log.Infof("handlePublish: YouTube uploader not found, attempting to load from S3")
-			if err := b.svc.InitializeYouTubeUploaderFromS3(context.Background()); err != nil {
-				b.log.Warnf("handlePublish: failed to load YouTube uploader from S3: %v", err)
+		// Initialize YouTube uploader from S3 if not already done. This is a
+		// handful of S3 reads, so it runs alongside the media downloads below
+		// and is awaited only right before the parallel platform uploads.
+		ytReady := make(chan struct{})
+		go func() {
+			defer close(ytReady)
+			if _, err := b.svc.GetUploadersManager().GetUploader("youtube"); err != nil {
+				b.log.Infof("handlePublish: YouTube uploader not found, attempting to load from S3")
+				if err := b.svc.InitializeYouTubeUploaderFromS3(context.Background()); err != nil {
+					b.log.Warnf("handlePublish: failed to load YouTube uploader from S3: %v", err)
+				} else {
+					b.log.Infof("handlePublish: YouTube uploader loaded successfully from S3")
+				}
 			} else {
-				b.log.Infof("handlePublish: YouTube uploader loaded successfully from S3")
+				b.log.Infof("handlePublish: YouTube uploader already initialized")
 			}
-		} else {
-			b.log.Infof("handlePublish: YouTube uploader already initialized")
-		}
+		}()
+		defer func() { <-ytReady }()
 
 		// Get meme from storage
 		meme, err := b.svc.GetMemeByID(context.Background(), memeID)
@@ -382,7 +391,30 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 			return
 		}
 
-		// Download video and thumbnail from S3
+		// The thumbnail download and the description fact lookup are
+		// independent of the video download, so all three run at once
+		// instead of back to back.
+		var thumbPath string
+		thumbDone := make(chan struct{})
+		go func() {
+			defer close(thumbDone)
+			p, err := b.svc.DownloadFileToTemp(context.Background(), meme.ThumbKey, "thumb")
+			if err != nil {
+				b.log.Warnf("handlePublish: failed to download thumbnail: %v (continuing without thumb)", err)
+				return
+			}
+			thumbPath = p
+		}()
+		defer func() {
+			<-thumbDone
+			if thumbPath != "" {
+				os.Remove(thumbPath)
+			}
+		}()
+		fact := make(chan string, 1)
+		go func() { fact <- ai.GetRandomFact(context.Background()) }()
+
+		// Download video from S3
 		videoPath, err := b.svc.Impl().DownloadMemeToTemp(context.Background(), meme)
 		if err != nil {
 			b.log.Errorf("handlePublish: failed to download video: %v", err)
@@ -391,16 +423,6 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 		}
 		defer os.Remove(videoPath)
 
-		// Download thumbnail
-		thumbPath, err := b.svc.DownloadFileToTemp(context.Background(), meme.ThumbKey, "thumb")
-		if err != nil {
-			b.log.Warnf("handlePublish: failed to download thumbnail: %v (continuing without thumb)", err)
-			thumbPath = ""
-		}
-		if thumbPath != "" {
-			defer os.Remove(thumbPath)
-		}
-
 		// Prepare upload request
 		uploaders := b.svc.GetUploadersManager()
 		if uploaders == nil {
@@ -409,16 +431,18 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 			return
 		}
 
+		<-thumbDone
 		uploadReq := &uploaders_types.UploadRequest{
 			VideoPath:     videoPath,
 			ThumbnailPath: thumbPath,
 			Title:         meme.Title,
-			Description:   ai.GetRandomFact(context.Background()),
+			Description:   <-fact,
 			Caption:       meme.Title,
 			Privacy:       "public",
 		}
 
 		// Upload to all platforms
+		<-ytReady
 		b.log.Infof("handlePublish: uploading to all platforms")
 		results := uploaders.UploadToAll(context.Background(), uploadReq)
 
@@ -428,17 +452,12 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 		var resultLines []string
 
 		for platform, result := range results {
+			resultLines = append(resultLines, uploadResultLine(platform, result))
 			if result.Success {
 				success++
-				if result.URL != "" {
-					resultLines = append(resultLines, fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", strings.ToUpper(platform), result.URL))
-				} else {
-					resultLines = append(resultLines, fmt.Sprintf("✅ %s: загружено", strings.ToUpper(platform)))
-				}
 				b.log.Infof("handlePublish: ✓ %s uploaded successfully", platform)
 			} else {
 				failed++
-				resultLines = append(resultLines, fmt.Sprintf("❌ %s: %s", strings.ToUpper(platform), result.Error))
 				b.log.Errorf("handlePublish: ✗ %s failed: %s", platform, result.Error)
 				if len(result.Details) > 0 {
 					for k, v := range result.Details {
@@ -453,6 +472,11 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 		if success > 0 {
 			b.log.Infof("handlePublish: COMPLETE - success=%d, failed=%d", success, failed)
 
+			// Show the upload results right away; the S3 cleanup (file
+			// deletes + memes.json rewrite) runs after and appends its status.
+			resultsMsg := fmt.Sprintf("📤 Результаты публикации:\n\n%s", strings.Join(resultLines, "\n"))
+			b.editMessageHTML(chatID, statusMsgID, resultsMsg+"\n\n🗑 Удаляю мем из S3...")
+
 			// Delete meme from S3 after successful publish
 			b.log.Infof("handlePublish: deleting meme from S3 after publish: %s", memeID)
 			deleteErr := b.svc.Impl().DeleteMeme(context.Background(), memeID)
@@ -469,7 +493,7 @@ func (b *TelegramBot) handlePublish(ctx context.Context, chatID int64, memeID st
 				b.deleteOtherBatchMemes(context.Background(), chatID, memeID)
 			}
 
-			finalMsg = fmt.Sprintf("📤 Результаты публикации:\n\n%s%s", strings.Join(resultLines, "\n"), deleteStatus)
+			finalMsg = resultsMsg + deleteStatus
 			b.editMessageHTML(chatID, statusMsgID, finalMsg)
 		} else {
 			finalMsg = fmt.Sprintf("❌ Ошибка публикации:\n\n%s", strings.Join(resultLines, "\n"))
@@ -1043,8 +1067,21 @@ func (b *TelegramBot) sendMemeSelectionButtons(chatID int64, memes []*model.Meme
 	b.tg.Send(msg)
 }
 
+// htmlEscaper and tempNameReplacer are built once: a strings.Replacer compiles
+// its lookup table on first use, so constructing one per call redid that work
+// every time.
+var (
+	htmlEscaper = strings.NewReplacer(
+		"&", "&amp;",
+		"<", "&lt;",
+		">", "&gt;",
+		"\"", "&quot;",
+	)
+	tempNameReplacer = strings.NewReplacer("/", "_", "\\", "_", ":", "_", "*", "_", "?", "_", "\"", "_", "<", "_", ">", "_", "|", "_")
+)
+
 func tempFilePath(prefix, name string) string {
-	safe := strings.NewReplacer("/", "_", "\\", "_", ":", "_", "*", "_", "?", "_", "\"", "_", "<", "_", ">", "_", "|", "_").Replace(name)
+	safe := tempNameReplacer.Replace(name)
 	return filepath.Join(os.TempDir(), fmt.Sprintf("%s-%s", prefix, safe))
 }
 
@@ -1087,7 +1124,7 @@ func (b *TelegramBot) runSchedulePoster(ctx context.Context) {
 			return
 		case <-ticker.C:
 			now := time.Now()
-			tomskNow := now.In(time.FixedZone("Asia/Tomsk", 7*3600))
+			tomskNow := now.In(scheduler.Tomsk)
 
 			// Always get fresh schedule from service (in case it was updated via /setnext)
 			currentSched := b.svc.GetSchedule()
@@ -1168,7 +1205,7 @@ func (b *TelegramBot) runMixtapePoster(ctx context.Context) {
 			return
 		case <-ticker.C:
 			now := time.Now()
-			tomskNow := now.In(time.FixedZone("Asia/Tomsk", 7*3600))
+			tomskNow := now.In(scheduler.Tomsk)
 
 			currentSched := b.svc.GetMixtapeSchedule()
 			if currentSched == nil {
@@ -1231,7 +1268,7 @@ func (b *TelegramBot) sendScheduledMixtape(ctx context.Context, adminChatID int6
 		return
 	}
 
-	tomsk := time.FixedZone("Asia/Tomsk", 7*3600)
+	tomsk := scheduler.Tomsk
 	nowHour := time.Now().In(tomsk).Hour()
 	silent := nowHour < 10 // 00:00–09:59 → silent
 
@@ -1239,11 +1276,13 @@ func (b *TelegramBot) sendScheduledMixtape(ctx context.Context, adminChatID int6
 	if title == "" {
 		title = mixtape_pkg.TopLabelText()
 	}
+	// Caption and description are the same track list; build it once.
+	text := mixtapeText(m)
 	uploadReq := &uploaders_types.UploadRequest{
 		VideoPath:   videoPath,
 		Title:       title,
-		Caption:     mixtapeCaption(m),
-		Description: b.buildMixtapeDescription(ctx, m),
+		Caption:     text,
+		Description: text,
 		Privacy:     "public",
 		Silent:      silent,
 	}
@@ -1253,16 +1292,11 @@ func (b *TelegramBot) sendScheduledMixtape(ctx context.Context, adminChatID int6
 	success := 0
 	var resultLines []string
 	for platform, result := range results {
+		resultLines = append(resultLines, uploadResultLine(platform, result))
 		if result.Success {
 			success++
-			if result.URL != "" {
-				resultLines = append(resultLines, fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", strings.ToUpper(platform), result.URL))
-			} else {
-				resultLines = append(resultLines, fmt.Sprintf("✅ %s: загружено", strings.ToUpper(platform)))
-			}
 			b.log.Infof("sendScheduledMixtape: ✓ %s uploaded successfully", platform)
 		} else {
-			resultLines = append(resultLines, fmt.Sprintf("❌ %s: %s", strings.ToUpper(platform), result.Error))
 			b.log.Errorf("sendScheduledMixtape: ✗ %s failed: %s", platform, result.Error)
 		}
 	}
@@ -1307,11 +1341,7 @@ func (b *TelegramBot) cmdSetMixtapes(ctx context.Context, chatID int64, args str
 			lines = append(lines, fmt.Sprintf("#%d — %s %s", i+1, entry.Time.Format("15:04"), status))
 		}
 		ec := b.svc.GetEngagementConfig()
-		loc, err := time.LoadLocation("Asia/Tomsk")
-		if err != nil {
-			loc = time.FixedZone("UTC+7", 7*3600)
-		}
-		nowTomsk := time.Now().In(loc)
+		nowTomsk := time.Now().In(scheduler.Tomsk)
 
 		bestofStatus := "выкл"
 		if ec.BestOf.Enabled {
@@ -1319,7 +1349,7 @@ func (b *TelegramBot) cmdSetMixtapes(ctx context.Context, chatID int64, args str
 			if ec.BestOf.LastPostedAt.IsZero() {
 				nextBestOf = nowTomsk // never posted → due now
 			} else {
-				nextBestOf = ec.BestOf.LastPostedAt.In(loc).Add(time.Duration(ec.BestOf.IntervalDays) * 24 * time.Hour)
+				nextBestOf = ec.BestOf.LastPostedAt.In(scheduler.Tomsk).Add(time.Duration(ec.BestOf.IntervalDays) * 24 * time.Hour)
 			}
 			var nextBestOfLabel string
 			if !nextBestOf.After(nowTomsk) {
@@ -1336,7 +1366,7 @@ func (b *TelegramBot) cmdSetMixtapes(ctx context.Context, chatID int64, args str
 
 		teaserStatus := "выкл"
 		if ec.Teaser.Enabled {
-			teaserToday := time.Date(nowTomsk.Year(), nowTomsk.Month(), nowTomsk.Day(), ec.Teaser.Hour, ec.Teaser.Minute, 0, 0, loc)
+			teaserToday := time.Date(nowTomsk.Year(), nowTomsk.Month(), nowTomsk.Day(), ec.Teaser.Hour, ec.Teaser.Minute, 0, 0, scheduler.Tomsk)
 			teaserDay := "сегодня"
 			if !teaserToday.After(nowTomsk) {
 				teaserToday = teaserToday.Add(24 * time.Hour)
@@ -1497,11 +1527,7 @@ func (b *TelegramBot) cmdSetMixtapesEngagement(ctx context.Context, chatID int64
 			}
 			var nextPost string
 			if !ec.BestOf.LastPostedAt.IsZero() {
-				loc2, err2 := time.LoadLocation("Asia/Tomsk")
-				if err2 != nil {
-					loc2 = time.FixedZone("UTC+7", 7*3600)
-				}
-				nextPost = ec.BestOf.LastPostedAt.In(loc2).Add(time.Duration(ec.BestOf.IntervalDays) * 24 * time.Hour).Format("02.01 15:04") + " (Tomsk)"
+				nextPost = ec.BestOf.LastPostedAt.In(scheduler.Tomsk).Add(time.Duration(ec.BestOf.IntervalDays) * 24 * time.Hour).Format("02.01 15:04") + " (Tomsk)"
 			} else {
 				nextPost = "при первом запуске"
 			}
@@ -1697,7 +1723,7 @@ func (b *TelegramBot) sendBestOfMixtape(ctx context.Context, chatID int64) {
 	}
 	defer os.Remove(videoPath)
 
-	tomsk := time.FixedZone("Asia/Tomsk", 7*3600)
+	tomsk := scheduler.Tomsk
 	silent := time.Now().In(tomsk).Hour() < 10
 
 	mgr := b.svc.GetUploadersManager()
@@ -1730,24 +1756,18 @@ func (b *TelegramBot) sendBestOfMixtape(ctx context.Context, chatID int64) {
 	results := mgr.UploadToAll(ctx, uploadReq)
 	success := 0
 	var lines []string
-	esc := strings.NewReplacer(
-		"&", "&amp;",
-		"<", "&lt;",
-		">", "&gt;",
-		"\"", "&quot;",
-	)
 	for platform, r := range results {
-		p := esc.Replace(strings.ToUpper(platform))
+		p := htmlEscaper.Replace(strings.ToUpper(platform))
 		if r.Success {
 			success++
 			if r.URL != "" {
-				url := esc.Replace(r.URL)
+				url := htmlEscaper.Replace(r.URL)
 				lines = append(lines, fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", p, url))
 			} else {
 				lines = append(lines, fmt.Sprintf("✅ %s: загружено", p))
 			}
 		} else {
-			lines = append(lines, fmt.Sprintf("❌ %s: %s", p, esc.Replace(r.Error)))
+			lines = append(lines, fmt.Sprintf("❌ %s: %s", p, htmlEscaper.Replace(r.Error)))
 		}
 	}
 	if success > 0 {
@@ -1787,7 +1807,7 @@ func (b *TelegramBot) runTeaserPoster(ctx context.Context) {
 	ticker := time.NewTicker(10 * time.Second)
 	defer ticker.Stop()
 
-	tomsk := time.FixedZone("Asia/Tomsk", 7*3600)
+	tomsk := scheduler.Tomsk
 	var running atomic.Bool
 
 	teaserDue := func() bool {
@@ -1845,7 +1865,7 @@ func (b *TelegramBot) sendWannaKnowTeaser(ctx context.Context, chatID int64) {
 	}
 	defer os.Remove(videoPath)
 
-	tomsk := time.FixedZone("Asia/Tomsk", 7*3600)
+	tomsk := scheduler.Tomsk
 	silent := time.Now().In(tomsk).Hour() < 10
 
 	caption := ""
@@ -1882,24 +1902,18 @@ func (b *TelegramBot) sendWannaKnowTeaser(ctx context.Context, chatID int64) {
 	results := mgr.UploadToAll(ctx, uploadReq)
 	success := 0
 	var lines []string
-	esc := strings.NewReplacer(
-		"&", "&amp;",
-		"<", "&lt;",
-		">", "&gt;",
-		"\"", "&quot;",
-	)
 	for platform, r := range results {
-		p := esc.Replace(strings.ToUpper(platform))
+		p := htmlEscaper.Replace(strings.ToUpper(platform))
 		if r.Success {
 			success++
 			if r.URL != "" {
-				url := esc.Replace(r.URL)
+				url := htmlEscaper.Replace(r.URL)
 				lines = append(lines, fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", p, url))
 			} else {
 				lines = append(lines, fmt.Sprintf("✅ %s: загружено", p))
 			}
 		} else {
-			lines = append(lines, fmt.Sprintf("❌ %s: %s", p, esc.Replace(r.Error)))
+			lines = append(lines, fmt.Sprintf("❌ %s: %s", p, htmlEscaper.Replace(r.Error)))
 		}
 	}
 	if success > 0 {
@@ -1958,28 +1972,31 @@ func (b *TelegramBot) getCachedOrDownloadMeme(ctx context.Context, meme *model.M
 // Should be called periodically to free disk space
 // Runs every 1 minute to clean up old files
 func (b *TelegramBot) clearExpiredMemeCache() {
-	b.memeCacheMux.Lock()
-	defer b.memeCacheMux.Unlock()
-
+	// Collect expired entries under the lock, unlink after releasing it so
+	// cache lookups from concurrent sends never wait on filesystem syscalls.
 	now := time.Now()
-	expiredCount := 0
+	var expired []string
 
+	b.memeCacheMux.Lock()
 	for memeID, expireTime := range b.memeCacheTTL {
 		if now.After(expireTime) {
-			// Remove expired file
 			if filePath, ok := b.memeFileCache[memeID]; ok {
-				if err := os.Remove(filePath); err != nil {
-					b.log.Errorf("clearExpiredMemeCache: failed to remove file %s: %v", filePath, err)
-				}
+				expired = append(expired, filePath)
 				delete(b.memeFileCache, memeID)
-				expiredCount++
 			}
 			delete(b.memeCacheTTL, memeID)
 		}
 	}
+	b.memeCacheMux.Unlock()
 
-	if expiredCount > 0 {
-		b.log.Infof("clearExpiredMemeCache: removed %d expired cached files (freeing disk space)", expiredCount)
+	for _, filePath := range expired {
+		if err := os.Remove(filePath); err != nil && !os.IsNotExist(err) {
+			b.log.Errorf("clearExpiredMemeCache: failed to remove file %s: %v", filePath, err)
+		}
+	}
+
+	if len(expired) > 0 {
+		b.log.Infof("clearExpiredMemeCache: removed %d expired cached files (freeing disk space)", len(expired))
 	}
 }
 
@@ -2072,6 +2089,20 @@ func (b *TelegramBot) sendScheduledMemes(ctx context.Context, chatID int64) {
 	// Note: DO NOT defer cleanup - files are managed by meme cache with TTL
 	// Cache cleanup happens via clearExpiredMemeCache() called periodically
 
+	// Resolve track links with one songs.json read for the whole slider
+	// instead of a GetSongByID round trip per meme.
+	songURLs := make(map[string]string, len(memes))
+	if songs, err := b.svc.GetAllSongs(ctx); err == nil {
+		for _, m := range memes {
+			songURLs[m.SongID] = ""
+		}
+		for _, song := range songs {
+			if _, ok := songURLs[song.ID]; ok {
+				songURLs[song.ID] = song.SourceURL
+			}
+		}
+	}
+
 	// Build media group (up to 3 videos as slider)
 	mediaGroup := make([]interface{}, 0, len(videos))
 	for idx, videoPath := range videos {
@@ -2086,10 +2117,8 @@ func (b *TelegramBot) sendScheduledMemes(ctx context.Context, chatID int64) {
 
 		// Create caption with slider counter, title, and link to full track
 		caption := fmt.Sprintf("%d/%d — %s", idx+1, len(videos), meme.Title)
-		if meme.SongID != "" {
-			if song, err := b.svc.GetSongByID(ctx, meme.SongID); err == nil && song.SourceURL != "" {
-				caption += "\n🔗 " + song.SourceURL
-			}
+		if url := songURLs[meme.SongID]; meme.SongID != "" && url != "" {
+			caption += "\n🔗 " + url
 		}
 
 		video := tgbotapi.NewInputMediaVideo(tgbotapi.FileReader{
@@ -2824,12 +2853,13 @@ func (b *TelegramBot) cmdCheckFiles(chatID int64) {
 			status = fmt.Sprintf("✅ найден (%d байт)", stat.Size())
 		}
 
-		// Check S3 file
+		// Check S3 file with a HEAD — downloading the body just to see
+		// whether the object is there was wasted transfer.
 		s3Key := fmt.Sprintf("%s/%s", b.s3BucketDir, label)
-		_, _, s3Err := s3Client.GetBytes(ctx, s3Key)
+		inS3, _ := s3Client.Exists(ctx, s3Key)
 		var s3Status string
 
-		if s3Err == nil {
+		if inS3 {
 			s3Status = "✅ в S3"
 		} else {
 			s3Status = "❌ нет в S3"
@@ -2947,14 +2977,31 @@ func (b *TelegramBot) downloadFile(ctx context.Context, url string) (io.ReadClos
 	return response.Body, nil
 }
 
+// saveFile writes to a temp file next to path and renames it into place, so
+// a crash or failed copy never leaves a truncated token/credentials file.
 func (b *TelegramBot) saveFile(path string, reader io.Reader) error {
-	file, err := os.Create(path)
+	file, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".tmp-*")
 	if err != nil {
 		return err
 	}
-	defer file.Close()
+	tmpPath := file.Name()
 
 	_, err = io.Copy(file, reader)
+	if err == nil {
+		err = file.Sync()
+	}
+	if closeErr := file.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Chmod(tmpPath, 0o644)
+	}
+	if err == nil {
+		err = os.Rename(tmpPath, path)
+	}
+	if err != nil {
+		os.Remove(tmpPath)
+	}
 	return err
 }
 
@@ -3029,7 +3076,7 @@ func (b *TelegramBot) cmdDownloadFiles(ctx context.Context, chatID int64) {
 		}
 
 		// Save locally
-		if err := os.WriteFile(fileName, fileContent, 0644); err != nil {
+		if err := b.saveFile(fileName, bytes.NewReader(fileContent)); err != nil {
 			b.log.Errorf("failed to save file locally: %s - %v", fileName, err)
 			failedCount++
 			continue
@@ -3307,13 +3354,7 @@ func (b *TelegramBot) cmdIdea(ctx context.Context, chatID int64, args string) {
 	}
 
 	// Filter to only eenfinit songs (excluding dee bill)
-	var filteredSongs []*model.Song
-	for _, song := range songs {
-		author := strings.ToLower(song.Author)
-		if strings.Contains(author, "eenfinit") && !strings.Contains(author, "dee bill") {
-			filteredSongs = append(filteredSongs, song)
-		}
-	}
+	filteredSongs := b.svc.FilterSongsForIdea(songs)
 
 	if len(filteredSongs) == 0 {
 		b.replyText(chatID, "❌ Ошибка: нет доступных песен от eenfinit")
@@ -3453,10 +3494,12 @@ func (b *TelegramBot) handleIdeaGeneration(ctx context.Context, chatID int64, so
 					b.log.Errorf("handleIdeaGeneration: failed to create temp file for generated video: %v", err)
 					b.replyText(chatID, "⚠️ Не удалось подготовить временный файл для видео")
 				} else {
+					// Each temp file gets one deferred unlink instead of a
+					// remove on every error branch below.
 					generatedVideoPath := generatedVideoTemp.Name()
+					defer os.Remove(generatedVideoPath)
 					if _, err := io.Copy(generatedVideoTemp, generatedVideoBody); err != nil {
 						generatedVideoTemp.Close()
-						os.Remove(generatedVideoPath)
 						b.log.Errorf("handleIdeaGeneration: failed to save generated video: %v", err)
 						b.replyText(chatID, "⚠️ Не удалось сохранить сгенерированное видео")
 					} else {
@@ -3464,7 +3507,6 @@ func (b *TelegramBot) handleIdeaGeneration(ctx context.Context, chatID int64, so
 
 						songPath, err := b.svc.Impl().DownloadSongToTemp(ctx, song)
 						if err != nil {
-							os.Remove(generatedVideoPath)
 							b.log.Errorf("handleIdeaGeneration: failed to download song for mux: %v", err)
 							b.replyText(chatID, fmt.Sprintf("⚠️ Не удалось скачать трек для добавления музыки: %v", err))
 						} else {
@@ -3472,22 +3514,18 @@ func (b *TelegramBot) handleIdeaGeneration(ctx context.Context, chatID int64, so
 
 							finalVideoTemp, err := os.CreateTemp("", fmt.Sprintf("idea_%s_final_*.mp4", song.ID))
 							if err != nil {
-								os.Remove(generatedVideoPath)
 								b.log.Errorf("handleIdeaGeneration: failed to create temp file for final video: %v", err)
 								b.replyText(chatID, "⚠️ Не удалось подготовить итоговый видеофайл")
 							} else {
 								finalVideoPath := finalVideoTemp.Name()
 								finalVideoTemp.Close()
+								defer os.Remove(finalVideoPath)
 
 								muxErr := video.MuxVideoWithAudio(ctx, generatedVideoPath, songPath, finalVideoPath, b.log)
-								os.Remove(generatedVideoPath)
 								if muxErr != nil {
-									os.Remove(finalVideoPath)
 									b.log.Errorf("handleIdeaGeneration: failed to mux audio into video: %v", muxErr)
 									b.replyText(chatID, fmt.Sprintf("⚠️ Видео с музыкой не удалось собрать: %v", muxErr))
 								} else {
-									defer os.Remove(finalVideoPath)
-
 									finalFile, err := os.Open(finalVideoPath)
 									if err != nil {
 										b.log.Errorf("handleIdeaGeneration: failed to open final video: %v", err)
@@ -3827,6 +3865,20 @@ func (b *TelegramBot) editMessage(chatID int64, messageID int, text string) erro
 	return err
 }
 
+// uploadResultLine formats one platform's line of a publish report. The
+// platform label is upper-cased once for whichever branch is taken.
+func uploadResultLine(platform string, result *uploaders_types.UploadResult) string {
+	name := strings.ToUpper(platform)
+	switch {
+	case !result.Success:
+		return fmt.Sprintf("❌ %s: %s", name, result.Error)
+	case result.URL != "":
+		return fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", name, result.URL)
+	default:
+		return fmt.Sprintf("✅ %s: загружено", name)
+	}
+}
+
 // mixtapeText builds the shared title + numbered song list used for YouTube and Telegram.
 // YouTube uses Title=m.Title and Description=mixtapeText; Telegram caption = mixtapeText.
 func mixtapeText(m *mixtape_pkg.Mixtape) string {
@@ -3845,13 +3897,7 @@ func mixtapeText(m *mixtape_pkg.Mixtape) string {
 	return strings.Join(lines, "\n")
 }
 
-func mixtapeCaption(m *mixtape_pkg.Mixtape) string { return mixtapeText(m) }
-
-func (b *TelegramBot) buildMixtapeDescription(ctx context.Context, m *mixtape_pkg.Mixtape) string {
-	return mixtapeText(m)
-}
-
-// cmdTestMixDesc picks a random mixtape and prints its full description (track list + AI blurb).
+// cmdTestMixDesc picks a random mixtape and prints the description it would be published with.
 func (b *TelegramBot) cmdTestMixDesc(ctx context.Context, chatID int64) {
 	gen := b.svc.GetMixtapeGenerator()
 	m, err := gen.GetRandom(ctx)
@@ -3859,7 +3905,7 @@ func (b *TelegramBot) cmdTestMixDesc(ctx context.Context, chatID int64) {
 		b.replyText(chatID, fmt.Sprintf("❌ No mixtapes available: %v", err))
 		return
 	}
-	desc := b.buildMixtapeDescription(ctx, m)
+	desc := mixtapeText(m)
 	b.replyText(chatID, desc)
 }
 
@@ -3927,7 +3973,7 @@ func (b *TelegramBot) handleMixtapeCommand(ctx context.Context, chatID int64) {
 	}
 	defer f.Close()
 
-	caption := mixtapeCaption(m)
+	caption := mixtapeText(m)
 
 	msg := tgbotapi.NewVideo(chatID, tgbotapi.FileReader{Name: "mixtape.mp4", Reader: f})
 	msg.Caption = caption
@@ -3982,8 +4028,9 @@ func (b *TelegramBot) handleSendMixtape(ctx context.Context, chatID int64, mixta
 	if ytTitle == "" {
 		ytTitle = mixtape_pkg.TopLabelText()
 	}
-	ytDescription := b.buildMixtapeDescription(ctx, m)
-	caption := mixtapeCaption(m)
+	// Caption and description are the same track list; build it once.
+	caption := mixtapeText(m)
+	ytDescription := caption
 
 	uploadReq := &uploaders_types.UploadRequest{
 		VideoPath:   videoPath,
@@ -3999,17 +4046,12 @@ func (b *TelegramBot) handleSendMixtape(ctx context.Context, chatID int64, mixta
 	failed := 0
 	var resultLines []string
 	for platform, result := range results {
+		resultLines = append(resultLines, uploadResultLine(platform, result))
 		if result.Success {
 			success++
-			if result.URL != "" {
-				resultLines = append(resultLines, fmt.Sprintf("✅ %s: <a href=\"%s\">смотреть</a>", strings.ToUpper(platform), result.URL))
-			} else {
-				resultLines = append(resultLines, fmt.Sprintf("✅ %s: загружено", strings.ToUpper(platform)))
-			}
 			b.log.Infof("handleSendMixtape: ✓ %s uploaded successfully", platform)
 		} else {
 			failed++
-			resultLines = append(resultLines, fmt.Sprintf("❌ %s: %s", strings.ToUpper(platform), result.Error))
 			b.log.Errorf("handleSendMixtape: ✗ %s failed: %s", platform, result.Error)
 		}
 	}
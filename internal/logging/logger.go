@@ -4,10 +4,12 @@ import (
 	"io"
 	"log"
 	"os"
+	"strings"
 	"sync"
 )
 
 type Logger struct {
+	debug bool
 	info  *log.Logger
 	warn  *log.Logger
 	err   *log.Logger
@@ -16,25 +18,20 @@ type Logger struct {
 }
 
 func New(errorsPath string) (*Logger, error) {
-	// Clear the log file on startup
-	if err := os.Truncate(errorsPath, 0); err != nil && !os.IsNotExist(err) {
-		// If file doesn't exist, that's fine, we'll create it below
-		if !os.IsNotExist(err) {
-			return nil, err
-		}
-	}
-
-	f, err := os.OpenFile(errorsPath, os.O_CREATE|os.O_APPEND|os.O_WRONLY, 0o644)
+	// Clear the log file on startup: O_TRUNC empties an existing file and
+	// O_CREATE covers a missing one, so no separate truncate call is needed.
+	f, err := os.OpenFile(errorsPath, os.O_CREATE|os.O_TRUNC|os.O_APPEND|os.O_WRONLY, 0o644)
 	if err != nil {
 		return nil, err
 	}
 	// Write errors to both stdout and file
 	errWriter := io.MultiWriter(os.Stdout, f)
 	l := &Logger{
-		info: log.New(os.Stdout, "INFO ", log.LstdFlags|log.Lmicroseconds),
-		warn: log.New(os.Stdout, "WARN ", log.LstdFlags|log.Lmicroseconds),
-		err:  log.New(errWriter, "ERROR ", log.LstdFlags|log.Lmicroseconds|log.Lshortfile),
-		errW: f,
+		debug: strings.EqualFold(os.Getenv("LOG_LEVEL"), "debug"),
+		info:  log.New(os.Stdout, "INFO ", log.LstdFlags|log.Lmicroseconds),
+		warn:  log.New(os.Stdout, "WARN ", log.LstdFlags|log.Lmicroseconds),
+		err:   log.New(errWriter, "ERROR ", log.LstdFlags|log.Lmicroseconds|log.Lshortfile),
+		errW:  f,
 	}
 	return l, nil
 }
@@ -48,6 +45,15 @@ func (l *Logger) Close() error {
 	return nil
 }
 
+// Debugf logs step-by-step traces only when LOG_LEVEL=debug. The level check
+// runs before formatting, so disabled calls cost no Sprintf or write.
+func (l *Logger) Debugf(format string, args ...any) {
+	if !l.debug {
+		return
+	}
+	l.info.Printf("DEBUG "+format, args...)
+}
+
 func (l *Logger) Infof(format string, args ...any) {
 	l.info.Printf(format, args...)
 }
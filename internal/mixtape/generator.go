@@ -13,6 +13,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"meme-video-gen/internal"
@@ -50,10 +51,37 @@ var topLabelVariants = []string{
 
 // TopLabelText returns a random question label for mixtape overlays and descriptions.
 func TopLabelText() string {
-	r := rand.New(rand.NewSource(time.Now().UnixNano()))
-	return topLabelVariants[r.Intn(len(topLabelVariants))]
+	return topLabelVariants[rand.Intn(len(topLabelVariants))]
+}
+
+// removeScratchAsync deletes a build's scratch directory, plus the song
+// downloads that live outside it, in one background pass. Every output is
+// read into memory before a build returns, so nothing waits on the segment,
+// thumbnail and audio files being unlinked.
+func removeScratchAsync(dir string, files ...string) {
+	go func() {
+		for _, f := range files {
+			os.Remove(f)
+		}
+		os.RemoveAll(dir)
+	}()
 }
 
+// ffmpegBin resolves ffmpeg on PATH once per process rather than on every
+// segment encode; the bare name is kept if the lookup fails.
+var ffmpegBin = sync.OnceValue(func() string {
+	if p, err := exec.LookPath("ffmpeg"); err == nil {
+		return p
+	}
+	return "ffmpeg"
+})
+
+// thumbHTTPClient is used for thumbnail downloads instead of http.DefaultClient,
+// which has no timeout and could hang a build on a stalled img.youtube.com
+// response. Non-200 replies are drained before the fallback URL is tried, so
+// the connection can be reused.
+var thumbHTTPClient = &http.Client{Timeout: 30 * time.Second}
+
 // ffmpeg semaphore — one encoding process at a time
 var ffmpegSem = make(chan struct{}, 1)
 
@@ -126,8 +154,7 @@ func (g *Generator) GetRandom(ctx context.Context) (*Mixtape, error) {
 	if len(idx.Items) == 0 {
 		return nil, fmt.Errorf("no mixtapes available")
 	}
-	r := rand.New(rand.NewSource(time.Now().UnixNano()))
-	return &idx.Items[r.Intn(len(idx.Items))], nil
+	return &idx.Items[rand.Intn(len(idx.Items))], nil
 }
 
 // GetByID returns a mixtape by ID.
@@ -194,7 +221,7 @@ func (g *Generator) DownloadVideoToTemp(ctx context.Context, m *Mixtape) (string
 	}
 	defer f.Close()
 
-	if _, err := io.Copy(f, reader.Reader); err != nil {
+	if _, err := reader.WriteTo(f); err != nil {
 		os.Remove(f.Name())
 		return "", err
 	}
@@ -212,9 +239,12 @@ func (g *Generator) generate(ctx context.Context) (*Mixtape, error) {
 	if err != nil {
 		return nil, err
 	}
-	defer os.RemoveAll(tmpDir)
+	var audioPaths []string
+	defer func() { removeScratchAsync(tmpDir, audioPaths...) }()
 
 	// Shuffle color palette so each segment in this mixtape gets a unique color.
+	// The same generator drives every random choice of this mixtape; seeding a
+	// fresh ~5 KB source per segment bought nothing but allocations.
 	palette := []string{"yellow", "0x00FFFF", "0xFF6600", "0xFF44FF", "0x00FF88", "0xFF2255", "0xAAFF00", "0xFF9900"}
 	rMain := rand.New(rand.NewSource(time.Now().UnixNano()))
 	rMain.Shuffle(len(palette), func(i, j int) { palette[i], palette[j] = palette[j], palette[i] })
@@ -228,32 +258,26 @@ func (g *Generator) generate(ctx context.Context) (*Mixtape, error) {
 	for i, song := range songs {
 		g.log.Infof("mixtape: building segment %d — %s", i+1, song.Title)
 
-		thumbPath, err := g.downloadThumbnail(ctx, song.ID, tmpDir, i)
-		if err != nil {
-			return nil, fmt.Errorf("download thumbnail for %s: %w", song.ID, err)
-		}
-
-		audioPath, err := g.audio.DownloadSongToTemp(ctx, song)
+		thumbPath, audioPath, err := g.fetchSegmentInputs(ctx, song, tmpDir, i)
 		if err != nil {
-			return nil, fmt.Errorf("download audio for %s: %w", song.ID, err)
+			return nil, err
 		}
-		defer os.Remove(audioPath)
+		audioPaths = append(audioPaths, audioPath)
 
 		// Determine valid start offset, staying out of the final 25% to avoid fade-outs/silence.
 		duration := song.DurationS
 		if duration <= float64(segmentDuration)+1 {
 			duration = float64(segmentDuration) + 2
 		}
-		r := rand.New(rand.NewSource(time.Now().UnixNano() + int64(i)))
 		safeEnd := duration * 0.75
 		maxStart := safeEnd - float64(segmentDuration)
 		if maxStart < 0 {
 			maxStart = 0
 		}
-		startOffset := r.Float64() * maxStart
+		startOffset := rMain.Float64() * maxStart
 
 		segPath := filepath.Join(tmpDir, fmt.Sprintf("seg%d.mp4", i))
-		if err := g.buildSegment(ctx, thumbPath, audioPath, segPath, startOffset, segmentDuration, r, i+1, song.Author, song.Title, palette[i%len(palette)], mixtapeTitle, ""); err != nil {
+		if err := g.buildSegment(ctx, thumbPath, audioPath, segPath, startOffset, segmentDuration, rMain, i+1, song.Author, song.Title, palette[i%len(palette)], mixtapeTitle, ""); err != nil {
 			return nil, fmt.Errorf("build segment %d: %w", i, err)
 		}
 		segmentPaths = append(segmentPaths, segPath)
@@ -284,11 +308,8 @@ func (g *Generator) generate(ctx context.Context) (*Mixtape, error) {
 	videoKey := mixtapesPrefix + id + ".mp4"
 	thumbKey := mixtapesPrefix + id + "_thumb.jpg"
 
-	if err := g.s3.PutBytes(ctx, videoKey, videoBytes, "video/mp4"); err != nil {
-		return nil, fmt.Errorf("upload video: %w", err)
-	}
-	if err := g.s3.PutBytes(ctx, thumbKey, thumbBytes, "image/jpeg"); err != nil {
-		return nil, fmt.Errorf("upload thumb: %w", err)
+	if err := g.uploadVideoAndThumb(ctx, "", videoKey, videoBytes, thumbKey, thumbBytes); err != nil {
+		return nil, err
 	}
 
 	return &Mixtape{
@@ -323,8 +344,7 @@ func (g *Generator) pickSongs(ctx context.Context, n int) ([]*model.Song, error)
 		return nil, fmt.Errorf("no songs by eenfinit or dee bill found in index")
 	}
 
-	r := rand.New(rand.NewSource(time.Now().UnixNano()))
-	r.Shuffle(len(pool), func(i, j int) { pool[i], pool[j] = pool[j], pool[i] })
+	rand.Shuffle(len(pool), func(i, j int) { pool[i], pool[j] = pool[j], pool[i] })
 
 	result := make([]*model.Song, n)
 	for i := range result {
@@ -347,26 +367,91 @@ func (g *Generator) downloadThumbnail(ctx context.Context, videoID, dir string,
 		if err != nil {
 			continue
 		}
-		resp, err := http.DefaultClient.Do(req)
-		if err != nil || resp.StatusCode != http.StatusOK {
-			if resp != nil {
-				resp.Body.Close()
-			}
+		resp, err := thumbHTTPClient.Do(req)
+		if err != nil {
+			continue
+		}
+		if resp.StatusCode != http.StatusOK {
+			// Drain the (small) error page so the connection goes back to
+			// the pool for the hqdefault retry.
+			io.Copy(io.Discard, io.LimitReader(resp.Body, 64*1024))
+			resp.Body.Close()
 			continue
 		}
-		data, err := io.ReadAll(resp.Body)
+		// Stream straight to disk rather than buffering the image first.
+		err = writeBodyToFile(destPath, resp.Body)
 		resp.Body.Close()
 		if err != nil {
 			continue
 		}
-		if err := os.WriteFile(destPath, data, 0644); err != nil {
-			return "", err
-		}
 		return destPath, nil
 	}
 	return "", fmt.Errorf("could not download thumbnail for video %s", videoID)
 }
 
+// uploadVideoAndThumb puts a build's video and thumbnail to S3 side by side,
+// so the thumbnail PUT does not queue behind the multi-MB video. kind
+// prefixes the error messages ("best-of ", "teaser ", or empty).
+func (g *Generator) uploadVideoAndThumb(ctx context.Context, kind, videoKey string, video []byte, thumbKey string, thumb []byte) error {
+	thumbErr := make(chan error, 1)
+	go func() {
+		thumbErr <- g.s3.PutBytes(ctx, thumbKey, thumb, "image/jpeg")
+	}()
+
+	if err := g.s3.PutBytes(ctx, videoKey, video, "video/mp4"); err != nil {
+		// Don't leave a thumbnail behind for a video that never landed.
+		if <-thumbErr == nil {
+			_ = g.s3.Delete(ctx, thumbKey)
+		}
+		return fmt.Errorf("upload %svideo: %w", kind, err)
+	}
+	if err := <-thumbErr; err != nil {
+		return fmt.Errorf("upload %sthumb: %w", kind, err)
+	}
+	return nil
+}
+
+// writeBodyToFile copies r into a new file at path, removing the partial
+// file if the copy fails.
+func writeBodyToFile(path string, r io.Reader) error {
+	f, err := os.Create(path)
+	if err != nil {
+		return err
+	}
+	_, err = io.Copy(f, r)
+	if cerr := f.Close(); err == nil {
+		err = cerr
+	}
+	if err != nil {
+		os.Remove(path)
+	}
+	return err
+}
+
+// fetchSegmentInputs downloads a song's thumbnail and audio side by side —
+// the two fetches are independent and both are mostly network wait.
+func (g *Generator) fetchSegmentInputs(ctx context.Context, song *model.Song, dir string, idx int) (thumbPath, audioPath string, err error) {
+	thumbDone := make(chan struct{})
+	var thumbErr error
+	go func() {
+		defer close(thumbDone)
+		thumbPath, thumbErr = g.downloadThumbnail(ctx, song.ID, dir, idx)
+	}()
+
+	audioPath, err = g.audio.DownloadSongToTemp(ctx, song)
+	<-thumbDone
+	if thumbErr != nil {
+		if err == nil {
+			os.Remove(audioPath)
+		}
+		return "", "", fmt.Errorf("download thumbnail for %s: %w", song.ID, thumbErr)
+	}
+	if err != nil {
+		return "", "", fmt.Errorf("download audio for %s: %w", song.ID, err)
+	}
+	return thumbPath, audioPath, nil
+}
+
 // wrapText wraps s to at most maxChars per line on word boundaries.
 func wrapText(s string, maxChars int) string {
 	words := strings.Fields(s)
@@ -391,11 +476,12 @@ func wrapText(s string, maxChars int) string {
 // escapeFfmpegPath escapes a file path for use inside a single-quoted FFmpeg filter option
 // (e.g. textfile='...'). Only backslash and colon need escaping for typical temp paths.
 func escapeFfmpegPath(p string) string {
-	p = strings.ReplaceAll(p, `\`, `\\`)
-	p = strings.ReplaceAll(p, `:`, `\:`)
-	return p
+	return ffmpegPathEscaper.Replace(p)
 }
 
+// ffmpegPathEscaper escapes both characters in a single pass.
+var ffmpegPathEscaper = strings.NewReplacer(`\`, `\\`, `:`, `\:`)
+
 // panStyle describes one distinct animation pattern for a segment.
 type panStyle struct {
 	xExpr string
@@ -503,7 +589,7 @@ func (g *Generator) buildSegment(ctx context.Context, thumbPath, audioPath, outP
 	audioFilter := fmt.Sprintf("afade=t=in:d=0.5,afade=t=out:st=%.3f:d=0.5", fadeOutStart)
 
 	var stderr bytes.Buffer
-	cmd := exec.CommandContext(ctx, "ffmpeg",
+	cmd := exec.CommandContext(ctx, ffmpegBin(),
 		"-hide_banner",
 		"-loglevel", "error",
 		"-threads", "1",
@@ -578,12 +664,13 @@ func (g *Generator) concatenate(ctx context.Context, segments []string, outPath
 		"-b:a", "128k",
 		"-pix_fmt", "yuv420p",
 		"-r", "30",
+		"-movflags", "+faststart",
 		"-y",
 		outPath,
 	)
 
 	var stderr bytes.Buffer
-	cmd := exec.CommandContext(ctx, "ffmpeg", args...)
+	cmd := exec.CommandContext(ctx, ffmpegBin(), args...)
 	cmd.Stderr = &stderr
 
 	if err := cmd.Run(); err != nil {
@@ -647,8 +734,7 @@ func (g *Generator) pickSongsByAuthor(ctx context.Context, author string, n int)
 		return nil, fmt.Errorf("no songs found for author %q", author)
 	}
 
-	r := rand.New(rand.NewSource(time.Now().UnixNano()))
-	r.Shuffle(len(pool), func(i, j int) { pool[i], pool[j] = pool[j], pool[i] })
+	rand.Shuffle(len(pool), func(i, j int) { pool[i], pool[j] = pool[j], pool[i] })
 
 	result := make([]*model.Song, n)
 	for i := range result {
@@ -672,7 +758,8 @@ func (g *Generator) GenerateBestOf(ctx context.Context, author string, segCount
 	if err != nil {
 		return nil, err
 	}
-	defer os.RemoveAll(tmpDir)
+	var audioPaths []string
+	defer func() { removeScratchAsync(tmpDir, audioPaths...) }()
 
 	palette := []string{"yellow", "0x00FFFF", "0xFF6600", "0xFF44FF", "0x00FF88", "0xFF2255", "0xAAFF00", "0xFF9900"}
 	rMain := rand.New(rand.NewSource(time.Now().UnixNano()))
@@ -686,31 +773,25 @@ func (g *Generator) GenerateBestOf(ctx context.Context, author string, segCount
 	for i, song := range songs {
 		g.log.Infof("bestof: building segment %d/%d — %s", i+1, segCount, song.Title)
 
-		thumbPath, err := g.downloadThumbnail(ctx, song.ID, tmpDir, i)
-		if err != nil {
-			return nil, fmt.Errorf("download thumbnail for %s: %w", song.ID, err)
-		}
-
-		audioPath, err := g.audio.DownloadSongToTemp(ctx, song)
+		thumbPath, audioPath, err := g.fetchSegmentInputs(ctx, song, tmpDir, i)
 		if err != nil {
-			return nil, fmt.Errorf("download audio for %s: %w", song.ID, err)
+			return nil, err
 		}
-		defer os.Remove(audioPath)
+		audioPaths = append(audioPaths, audioPath)
 
 		duration := song.DurationS
 		if duration <= float64(segmentDuration)+1 {
 			duration = float64(segmentDuration) + 2
 		}
-		r := rand.New(rand.NewSource(time.Now().UnixNano() + int64(i)))
 		safeEnd := duration * 0.75
 		maxStart := safeEnd - float64(segmentDuration)
 		if maxStart < 0 {
 			maxStart = 0
 		}
-		startOffset := r.Float64() * maxStart
+		startOffset := rMain.Float64() * maxStart
 
 		segPath := filepath.Join(tmpDir, fmt.Sprintf("seg%d.mp4", i))
-		if err := g.buildSegment(ctx, thumbPath, audioPath, segPath, startOffset, segmentDuration, r, i+1, song.Author, song.Title, palette[i%len(palette)], topLabel, ""); err != nil {
+		if err := g.buildSegment(ctx, thumbPath, audioPath, segPath, startOffset, segmentDuration, rMain, i+1, song.Author, song.Title, palette[i%len(palette)], topLabel, ""); err != nil {
 			return nil, fmt.Errorf("build segment %d: %w", i, err)
 		}
 		segmentPaths = append(segmentPaths, segPath)
@@ -737,11 +818,8 @@ func (g *Generator) GenerateBestOf(ctx context.Context, author string, segCount
 	videoKey := mixtapesPrefix + id + ".mp4"
 	thumbKey := mixtapesPrefix + id + "_thumb.jpg"
 
-	if err := g.s3.PutBytes(ctx, videoKey, videoBytes, "video/mp4"); err != nil {
-		return nil, fmt.Errorf("upload best-of video: %w", err)
-	}
-	if err := g.s3.PutBytes(ctx, thumbKey, thumbBytes, "image/jpeg"); err != nil {
-		return nil, fmt.Errorf("upload best-of thumb: %w", err)
+	if err := g.uploadVideoAndThumb(ctx, "best-of ", videoKey, videoBytes, thumbKey, thumbBytes); err != nil {
+		return nil, err
 	}
 
 	return &Mixtape{
@@ -769,18 +847,14 @@ func (g *Generator) GenerateTeaser(ctx context.Context) (*Mixtape, error) {
 	if err != nil {
 		return nil, err
 	}
-	defer os.RemoveAll(tmpDir)
+	var audioPaths []string
+	defer func() { removeScratchAsync(tmpDir, audioPaths...) }()
 
-	thumbPath, err := g.downloadThumbnail(ctx, song.ID, tmpDir, 0)
+	thumbPath, audioPath, err := g.fetchSegmentInputs(ctx, song, tmpDir, 0)
 	if err != nil {
-		return nil, fmt.Errorf("download thumbnail: %w", err)
-	}
-
-	audioPath, err := g.audio.DownloadSongToTemp(ctx, song)
-	if err != nil {
-		return nil, fmt.Errorf("download audio: %w", err)
+		return nil, err
 	}
-	defer os.Remove(audioPath)
+	audioPaths = append(audioPaths, audioPath)
 
 	duration := song.DurationS
 	if duration <= float64(segmentDuration)+1 {
@@ -812,11 +886,8 @@ func (g *Generator) GenerateTeaser(ctx context.Context) (*Mixtape, error) {
 	videoKey := mixtapesPrefix + id + ".mp4"
 	thumbKey := mixtapesPrefix + id + "_thumb.jpg"
 
-	if err := g.s3.PutBytes(ctx, videoKey, videoBytes, "video/mp4"); err != nil {
-		return nil, fmt.Errorf("upload teaser video: %w", err)
-	}
-	if err := g.s3.PutBytes(ctx, thumbKey, thumbBytes, "image/jpeg"); err != nil {
-		return nil, fmt.Errorf("upload teaser thumb: %w", err)
+	if err := g.uploadVideoAndThumb(ctx, "teaser ", videoKey, videoBytes, thumbKey, thumbBytes); err != nil {
+		return nil, err
 	}
 
 	return &Mixtape{
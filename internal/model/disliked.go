@@ -20,32 +20,34 @@ func (idx *DislikedSourceIndex) IsBlacklisted(sourceID string) bool {
 	if idx == nil {
 		return false
 	}
-	now := time.Now()
+	now := time.Now().Unix()
 	for _, item := range idx.Items {
-		if item.SourceID == sourceID {
-			// Check if ban period has expired
-			expiresAt := item.DislikedAt.Add(time.Duration(item.Duration) * time.Second)
-			if now.Before(expiresAt) {
-				return true // Still blacklisted
-			}
+		if item.SourceID == sourceID && item.activeAt(now) {
+			return true // Still blacklisted
 		}
 	}
 	return false
 }
 
+// activeAt reports whether the ban is still in effect at the given Unix time.
+// Comparing plain seconds avoids building an expiry time.Time per item.
+func (d *DislikedSource) activeAt(now int64) bool {
+	return d.DislikedAt.Unix()+d.Duration > now
+}
+
 // CleanupExpired removes sources whose ban period has expired
 func (idx *DislikedSourceIndex) CleanupExpired() {
 	if idx == nil {
 		return
 	}
 	now := time.Now()
+	cutoff := now.Unix()
 	filtered := make([]DislikedSource, 0, len(idx.Items))
-	for _, item := range idx.Items {
-		expiresAt := item.DislikedAt.Add(time.Duration(item.Duration) * time.Second)
-		if now.Before(expiresAt) {
-			filtered = append(filtered, item)
+	for i := range idx.Items {
+		if idx.Items[i].activeAt(cutoff) {
+			filtered = append(filtered, idx.Items[i])
 		}
 	}
 	idx.Items = filtered
-	idx.UpdatedAt = time.Now()
+	idx.UpdatedAt = now
 }
@@ -78,3 +78,17 @@ type VideoHashIndex struct {
 	UpdatedAt time.Time `json:"updated_at"`
 	Hashes    []uint64  `json:"hashes"` // Perceptual hashes of video thumbnails
 }
+
+// Set returns the blacklisted hashes as a membership set.
+func (idx *ImageHashIndex) Set() map[uint64]struct{} { return hashSet(idx.Hashes) }
+
+// Set returns the blacklisted hashes as a membership set.
+func (idx *VideoHashIndex) Set() map[uint64]struct{} { return hashSet(idx.Hashes) }
+
+func hashSet(hashes []uint64) map[uint64]struct{} {
+	set := make(map[uint64]struct{}, len(hashes))
+	for _, h := range hashes {
+		set[h] = struct{}{}
+	}
+	return set
+}
@@ -5,9 +5,13 @@ import (
 	"context"
 	"encoding/json"
 	"errors"
+	"fmt"
 	"io"
 	"net/url"
+	"os"
 	"strings"
+	"sync"
+	"time"
 
 	awsconfig "github.com/aws/aws-sdk-go-v2/config"
 	"github.com/aws/aws-sdk-go-v2/credentials"
@@ -24,6 +28,7 @@ type Client interface {
 	GetReader(ctx context.Context, key string) (*ObjectReader, error)
 	Exists(ctx context.Context, key string) (bool, error)
 	Delete(ctx context.Context, key string) error
+	DeleteMany(ctx context.Context, keys []string) error
 	List(ctx context.Context, prefix string) ([]ObjectInfo, error)
 
 	ReadJSON(ctx context.Context, key string, out any) (bool, error)
@@ -33,7 +38,7 @@ type Client interface {
 type ObjectInfo struct {
 	Key          string
 	Size         int64
-	LastModified *string
+	LastModified time.Time // zero if the listing didn't report it
 	ETag         string
 }
 
@@ -42,6 +47,43 @@ type ObjectReader struct {
 	Size   int64
 }
 
+// copyBufPool holds 1 MiB buffers for streaming objects to disk. Buffers are
+// only held for the duration of a copy, so the pool stays as small as the
+// number of concurrent downloads.
+var copyBufPool = sync.Pool{New: func() any { b := make([]byte, 1<<20); return &b }}
+
+// WriteTo streams the object into w through a pooled 1 MiB buffer. A read
+// from the network body returns only what has arrived on the socket (often
+// 16-32 KiB), so io.Copy issues one write per read whatever its buffer size;
+// here the buffer is filled before each write, so a multi-MB video is
+// written in a handful of syscalls instead of hundreds.
+func (r *ObjectReader) WriteTo(w io.Writer) (int64, error) {
+	bp := copyBufPool.Get().(*[]byte)
+	defer copyBufPool.Put(bp)
+	buf := *bp
+
+	var written int64
+	for {
+		n, err := io.ReadFull(r.Reader, buf)
+		if n > 0 {
+			nw, werr := w.Write(buf[:n])
+			written += int64(nw)
+			if werr != nil {
+				return written, werr
+			}
+			if nw != n {
+				return written, io.ErrShortWrite
+			}
+		}
+		if err == io.EOF || err == io.ErrUnexpectedEOF {
+			return written, nil
+		}
+		if err != nil {
+			return written, err
+		}
+	}
+}
+
 type s3Client struct {
 	bucket string
 	api    *awss3.Client
@@ -97,10 +139,16 @@ func (c *s3Client) GetBytes(ctx context.Context, key string) ([]byte, string, er
 		return nil, "", err
 	}
 	defer out.Body.Close()
-	b, err := io.ReadAll(out.Body)
-	if err != nil {
+	// Size the buffer from Content-Length so the body lands in a single
+	// allocation instead of io.ReadAll's repeated grow-and-copy.
+	var buf bytes.Buffer
+	if out.ContentLength != nil && *out.ContentLength > 0 {
+		buf.Grow(int(*out.ContentLength) + bytes.MinRead)
+	}
+	if _, err := buf.ReadFrom(out.Body); err != nil {
 		return nil, "", err
 	}
+	b := buf.Bytes()
 	ct := ""
 	if out.ContentType != nil {
 		ct = *out.ContentType
@@ -147,6 +195,51 @@ func (c *s3Client) Delete(ctx context.Context, key string) error {
 	return err
 }
 
+// deleteConcurrency bounds parallel DeleteObject calls in DeleteMany.
+const deleteConcurrency = 8
+
+// DeleteMany deletes keys with bounded parallelism instead of one round trip
+// after another. Empty keys are skipped; missing objects are not an error
+// (DeleteObject is idempotent), so callers need no existence pre-check.
+func (c *s3Client) DeleteMany(ctx context.Context, keys []string) error {
+	var (
+		wg   sync.WaitGroup
+		mu   sync.Mutex
+		errs []error
+		sem  = make(chan struct{}, deleteConcurrency)
+	)
+	for _, key := range keys {
+		if key == "" {
+			continue
+		}
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(key string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			if err := c.Delete(ctx, key); err != nil {
+				mu.Lock()
+				errs = append(errs, fmt.Errorf("delete %s: %w", key, err))
+				mu.Unlock()
+			}
+		}(key)
+	}
+	wg.Wait()
+	return errors.Join(errs...)
+}
+
+// DeleteFailures returns how many keys a DeleteMany error reports as not
+// deleted (0 for nil).
+func DeleteFailures(err error) int {
+	if err == nil {
+		return 0
+	}
+	if joined, ok := err.(interface{ Unwrap() []error }); ok {
+		return len(joined.Unwrap())
+	}
+	return 1
+}
+
 func (c *s3Client) List(ctx context.Context, prefix string) ([]ObjectInfo, error) {
 	var out []ObjectInfo
 	p := awss3.NewListObjectsV2Paginator(c.api, &awss3.ListObjectsV2Input{Bucket: &c.bucket, Prefix: &prefix})
@@ -155,16 +248,20 @@ func (c *s3Client) List(ctx context.Context, prefix string) ([]ObjectInfo, error
 		if err != nil {
 			return nil, err
 		}
+		if out == nil {
+			out = make([]ObjectInfo, 0, len(page.Contents))
+		}
+		// Entries are copied as-is; callers mostly need only the key, so
+		// nothing is formatted per object.
 		for _, obj := range page.Contents {
-			lm := ""
+			info := ObjectInfo{Key: *obj.Key, ETag: deref(obj.ETag)}
 			if obj.LastModified != nil {
-				lm = obj.LastModified.Format("2006-01-02T15:04:05Z07:00")
+				info.LastModified = *obj.LastModified
 			}
-			sz := int64(0)
 			if obj.Size != nil {
-				sz = *obj.Size
+				info.Size = *obj.Size
 			}
-			out = append(out, ObjectInfo{Key: *obj.Key, Size: sz, LastModified: &lm, ETag: deref(obj.ETag)})
+			out = append(out, info)
 		}
 	}
 	return out, nil
@@ -181,8 +278,20 @@ func (c *s3Client) ReadJSON(ctx context.Context, key string, out any) (bool, err
 	return true, json.Unmarshal(b, out)
 }
 
+// prettyJSON enables indented index files for manual inspection (DEBUG_PRETTY_JSON=1).
+// Indexes are machine-read, so compact output is the default — indenting
+// memes.json/sources.json on every write costs CPU and S3 bytes for nothing.
+// Read on first write, after cmd/main.go has loaded .env.
+var prettyJSON = sync.OnceValue(func() bool { return os.Getenv("DEBUG_PRETTY_JSON") == "1" })
+
 func (c *s3Client) WriteJSON(ctx context.Context, key string, v any) error {
-	b, err := json.MarshalIndent(v, "", "  ")
+	var b []byte
+	var err error
+	if prettyJSON() {
+		b, err = json.MarshalIndent(v, "", "  ")
+	} else {
+		b, err = json.Marshal(v)
+	}
 	if err != nil {
 		return err
 	}
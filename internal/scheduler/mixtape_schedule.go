@@ -102,7 +102,7 @@ type DailyMixtapeSchedule struct {
 func BuildDailyMixtapeSchedule(date time.Time, count int) []time.Time {
 	const minGapSeconds = 7200 // 2 h minimum between posts
 
-	loc := time.FixedZone("Asia/Tomsk", 7*3600)
+	loc := Tomsk
 	start := time.Date(date.Year(), date.Month(), date.Day(), 0, 0, 0, 0, loc)
 	end := time.Date(date.Year(), date.Month(), date.Day(), 23, 59, 59, 0, loc)
 
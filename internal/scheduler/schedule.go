@@ -21,10 +21,15 @@ type DailySchedule struct {
 	UpdatedAt time.Time       `json:"updated_at"`
 }
 
+// Tomsk is the UTC+7 zone all schedules and posting windows use. It is built
+// once here instead of on every call (Tomsk has had no DST since 2016, so a
+// fixed zone matches the tz database without reading it from disk).
+var Tomsk = time.FixedZone("Asia/Tomsk", 7*3600)
+
 // BuildDailySchedule creates N evenly distributed times within the window [10:00, 24:00)
 // with random jitter to avoid clustering
 func BuildDailySchedule(date time.Time, count int) []time.Time {
-	loc := time.FixedZone("Asia/Tomsk", 7*3600) // UTC+7
+	loc := Tomsk
 
 	// Window: 10:00 to 23:59:59
 	start := time.Date(date.Year(), date.Month(), date.Day(), 10, 0, 0, 0, loc)
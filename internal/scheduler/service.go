@@ -11,6 +11,7 @@ import (
 	"time"
 
 	"github.com/robfig/cron/v3"
+	"github.com/tidwall/gjson"
 
 	"meme-video-gen/internal"
 	"meme-video-gen/internal/ai"
@@ -217,17 +218,11 @@ func (s *Service) GetSourcesCount(ctx context.Context) (int, error) {
 
 	// Cache miss - read from S3
 	s.log.Infof("GetSourcesCount: cache miss, reading from S3")
-	var sourcesIdx model.SourcesIndex
-	found, err := s.s3c.ReadJSON(ctx, s.cfg.SourcesJSONKey, &sourcesIdx)
+	count, err := s.countIndexItems(ctx, s.cfg.SourcesJSONKey)
 	if err != nil {
 		return 0, err
 	}
 
-	count := 0
-	if found {
-		count = len(sourcesIdx.Items)
-	}
-
 	// Update cache
 	s.cacheMux.Lock()
 	s.cachedCounts["sources"] = cachedValue{count: count, timestamp: time.Now()}
@@ -249,17 +244,11 @@ func (s *Service) GetMemesCount(ctx context.Context) (int, error) {
 
 	// Cache miss - read from S3
 	s.log.Infof("GetMemesCount: cache miss, reading from S3")
-	var memesIdx model.MemesIndex
-	found, err := s.s3c.ReadJSON(ctx, s.cfg.MemesJSONKey, &memesIdx)
+	count, err := s.countIndexItems(ctx, s.cfg.MemesJSONKey)
 	if err != nil {
 		return 0, err
 	}
 
-	count := 0
-	if found {
-		count = len(memesIdx.Items)
-	}
-
 	// Update cache
 	s.cacheMux.Lock()
 	s.cachedCounts["memes"] = cachedValue{count: count, timestamp: time.Now()}
@@ -281,17 +270,11 @@ func (s *Service) GetSongsCount(ctx context.Context) (int, error) {
 
 	// Cache miss - read from S3
 	s.log.Infof("GetSongsCount: cache miss, reading from S3")
-	var songsIdx model.SongsIndex
-	found, err := s.s3c.ReadJSON(ctx, s.cfg.SongsJSONKey, &songsIdx)
+	count, err := s.countIndexItems(ctx, s.cfg.SongsJSONKey)
 	if err != nil {
 		return 0, err
 	}
 
-	count := 0
-	if found {
-		count = len(songsIdx.Items)
-	}
-
 	// Update cache
 	s.cacheMux.Lock()
 	s.cachedCounts["songs"] = cachedValue{count: count, timestamp: time.Now()}
@@ -323,6 +306,18 @@ func (s *Service) GetMixtapesCount(ctx context.Context) (int, error) {
 	return count, nil
 }
 
+// countIndexItems returns len(items) of a JSON index in S3 without decoding it.
+// gjson walks the raw bytes, skipping the per-item struct and time.Time
+// decoding that a full json.Unmarshal would do just to take a length.
+func (s *Service) countIndexItems(ctx context.Context, key string) (int, error) {
+	var raw json.RawMessage
+	found, err := s.s3c.ReadJSON(ctx, key, &raw)
+	if err != nil || !found {
+		return 0, err
+	}
+	return int(gjson.GetBytes(raw, "items.#").Int()), nil
+}
+
 // ClearSources removes all sources from the index and deletes source files from S3
 func (s *Service) ClearSources(ctx context.Context) error {
 	s.log.Infof("clearing all sources")
@@ -340,10 +335,12 @@ func (s *Service) ClearSources(ctx context.Context) error {
 	}
 
 	// Delete all source files from S3
+	keys := make([]string, 0, len(sourcesIdx.Items))
 	for _, source := range sourcesIdx.Items {
-		if err := s.s3c.Delete(ctx, source.MediaKey); err != nil {
-			s.log.Errorf("failed to delete source %s: %v", source.ID, err)
-		}
+		keys = append(keys, source.MediaKey)
+	}
+	if err := s.s3c.DeleteMany(ctx, keys); err != nil {
+		s.log.Errorf("failed to delete some sources: %v", err)
 	}
 
 	// Clear the sources index
@@ -378,13 +375,12 @@ func (s *Service) ClearMemes(ctx context.Context) error {
 	}
 
 	// Delete all meme files from S3
+	keys := make([]string, 0, 2*len(memesIdx.Items))
 	for _, meme := range memesIdx.Items {
-		if err := s.s3c.Delete(ctx, meme.VideoKey); err != nil {
-			s.log.Errorf("failed to delete meme video %s: %v", meme.ID, err)
-		}
-		if err := s.s3c.Delete(ctx, meme.ThumbKey); err != nil {
-			s.log.Errorf("failed to delete meme thumbnail %s: %v", meme.ID, err)
-		}
+		keys = append(keys, meme.VideoKey, meme.ThumbKey)
+	}
+	if err := s.s3c.DeleteMany(ctx, keys); err != nil {
+		s.log.Errorf("failed to delete some meme files: %v", err)
 	}
 
 	// Clear the memes index
@@ -397,11 +393,20 @@ func (s *Service) ClearMemes(ctx context.Context) error {
 
 	// Invalidate cache
 	s.InvalidateCache("memes")
+	s.invalidateMemesIndex()
 
 	s.log.Infof("memes cleared successfully")
 	return nil
 }
 
+// invalidateMemesIndex drops the generator's cached memes.json after the
+// service rewrote the index directly.
+func (s *Service) invalidateMemesIndex() {
+	if impl, ok := s.impl.(*realImpl); ok {
+		impl.video.InvalidateMemesCache()
+	}
+}
+
 // SyncSources synchronizes sources.json with actual S3 sources/ folder
 func (s *Service) SyncSources(ctx context.Context) error {
 	s.log.Infof("syncing sources with S3")
@@ -577,7 +582,7 @@ func BuildService(ctx context.Context, log *logging.Logger) (*Service, error) {
 	// Load or create today's schedule at startup
 	go func() {
 		time.Sleep(2 * time.Second)
-		now := time.Now().In(time.FixedZone("Asia/Tomsk", 7*3600))
+		now := time.Now().In(Tomsk)
 		sched, err := GetOrCreateSchedule(context.Background(), s3c, &cfg, now)
 		if err != nil {
 			log.Errorf("failed to load schedule: %v", err)
@@ -592,7 +597,7 @@ func BuildService(ctx context.Context, log *logging.Logger) (*Service, error) {
 	// Load or create today's mixtape schedule at startup
 	go func() {
 		time.Sleep(3 * time.Second)
-		now := time.Now().In(time.FixedZone("Asia/Tomsk", 7*3600))
+		now := time.Now().In(Tomsk)
 		ms, err := GetOrCreateMixtapeSchedule(context.Background(), s3c, &cfg, now)
 		if err != nil {
 			log.Errorf("failed to load mixtape schedule: %v", err)
@@ -684,6 +689,7 @@ func (s *Service) DeleteMemesOlderThan(ctx context.Context, duration time.Durati
 		s.log.Errorf("failed to update memes index: %v", err)
 		return err
 	}
+	s.invalidateMemesIndex()
 
 	s.log.Infof("deleted %d old memes", deletedCount)
 	return nil
@@ -693,6 +699,10 @@ func (s *Service) DeleteMemesOlderThan(ctx context.Context, duration time.Durati
 func (s *Service) GetMemeByID(ctx context.Context, memeID string) (*model.Meme, error) {
 	s.log.Infof("GetMemeByID: searching for meme %s", memeID)
 
+	if impl, ok := s.impl.(*realImpl); ok {
+		return impl.video.GetMemeByID(ctx, memeID)
+	}
+
 	// Load memes index
 	var memesIdx model.MemesIndex
 	found, err := s.s3c.ReadJSON(ctx, s.cfg.MemesJSONKey, &memesIdx)
@@ -742,8 +752,8 @@ func (s *Service) DownloadFileToTemp(ctx context.Context, s3Key string, prefix s
 	}
 	defer reader.Reader.Close()
 
-	// Copy to temp file
-	_, err = tempFile.ReadFrom(reader.Reader)
+	// Copy to temp file through the reader's pooled 1 MiB buffer
+	_, err = reader.WriteTo(tempFile)
 	if err != nil {
 		os.Remove(tempPath)
 		return "", fmt.Errorf("failed to download file: %w", err)
@@ -844,13 +854,18 @@ func (s *Service) SearchSongs(ctx context.Context, query string) ([]*model.Song,
 	return results, nil
 }
 
-// filterSongsForIdea filters songs to only include eenfinit, excluding dee bill
-func (s *Service) filterSongsForIdea(songs []*model.Song) []*model.Song {
+// isIdeaSong reports whether song is by eenfinit and not dee bill. The author
+// is lowercased once and shared by both checks.
+func isIdeaSong(song *model.Song) bool {
+	author := strings.ToLower(song.Author)
+	return strings.Contains(author, "eenfinit") && !strings.Contains(author, "dee bill")
+}
+
+// FilterSongsForIdea filters songs to only include eenfinit, excluding dee bill
+func (s *Service) FilterSongsForIdea(songs []*model.Song) []*model.Song {
 	var filtered []*model.Song
 	for _, song := range songs {
-		// Only include eenfinit, exclude dee bill
-		author := strings.ToLower(song.Author)
-		if strings.Contains(author, "eenfinit") && !strings.Contains(author, "dee bill") {
+		if isIdeaSong(song) {
 			filtered = append(filtered, song)
 		}
 	}
@@ -864,7 +879,7 @@ func (s *Service) GetRandomSongForIdea(ctx context.Context) (*model.Song, error)
 		return nil, err
 	}
 
-	filtered := s.filterSongsForIdea(songs)
+	filtered := s.FilterSongsForIdea(songs)
 	if len(filtered) == 0 {
 		return nil, fmt.Errorf("no songs from eenfinit available (excluding dee bill)")
 	}
@@ -881,9 +896,7 @@ func (s *Service) GetSongByIDForIdea(ctx context.Context, songID string) (*model
 		return nil, err
 	}
 
-	// Check if song is from eenfinit and not dee bill
-	author := strings.ToLower(song.Author)
-	if !strings.Contains(author, "eenfinit") || strings.Contains(author, "dee bill") {
+	if !isIdeaSong(song) {
 		return nil, fmt.Errorf("song %s is not from eenfinit or is from dee bill", songID)
 	}
 
@@ -902,7 +915,7 @@ func (s *Service) SearchSongsForIdea(ctx context.Context, query string) ([]*mode
 		return nil, err
 	}
 
-	filtered := s.filterSongsForIdea(results)
+	filtered := s.FilterSongsForIdea(results)
 	if len(filtered) == 0 {
 		return nil, fmt.Errorf("no songs from eenfinit found matching query: %s (excluding dee bill)", query)
 	}
@@ -970,17 +983,8 @@ func (s *Service) InitializeYouTubeUploaderFromS3(ctx context.Context) error {
 		return fmt.Errorf("token.json not found in S3")
 	}
 
-	// Verify files exist and are readable
-	if _, err := os.Stat(clientSecretsPath); err != nil {
-		s.log.Errorf("InitializeYouTubeUploaderFromS3: client_secrets.json not accessible: %v", err)
-		return err
-	}
-	if _, err := os.Stat(tokenPath); err != nil {
-		s.log.Errorf("InitializeYouTubeUploaderFromS3: token.json not accessible: %v", err)
-		return err
-	}
-
-	// Try to read and validate token file
+	// Both files were just written by DownloadFileToTemp; reading the token
+	// below is the accessibility check, no separate stat needed.
 	tokenData, err := os.ReadFile(tokenPath)
 	if err != nil {
 		s.log.Errorf("InitializeYouTubeUploaderFromS3: failed to read token.json: %v", err)
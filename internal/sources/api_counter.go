@@ -46,21 +46,42 @@ func today() string {
 	return time.Now().UTC().Format("2006-01-02")
 }
 
+// callCountsTTL is how long the in-memory counters are trusted before
+// api_call_counts.json is read again, in case another process updated it.
+const callCountsTTL = time.Minute
+
+// loadCallCounts returns today's counters, from memory when the cached copy is
+// fresh instead of reading S3 on every API call. Callers must hold countsMux.
 func (sc *Scraper) loadCallCounts(ctx context.Context) (apiCallCounts, error) {
+	if c := sc.callCounts; c != nil && c.Date == today() && time.Now().Before(sc.callCountsExp) {
+		return *c, nil
+	}
 	var counts apiCallCounts
 	found, err := sc.s3.ReadJSON(ctx, apiCallCountsKey, &counts)
 	if err != nil || !found || counts.Date != today() {
-		return apiCallCounts{Date: today()}, nil
+		counts = apiCallCounts{Date: today()}
 	}
+	sc.storeCallCounts(counts)
 	return counts, nil
 }
 
+// saveCallCounts persists the counters and refreshes the cache. Callers must
+// hold countsMux.
 func (sc *Scraper) saveCallCounts(ctx context.Context, counts apiCallCounts) error {
+	sc.storeCallCounts(counts)
 	return sc.s3.WriteJSON(ctx, apiCallCountsKey, &counts)
 }
 
+func (sc *Scraper) storeCallCounts(counts apiCallCounts) {
+	sc.callCounts = &counts
+	sc.callCountsExp = time.Now().Add(callCountsTTL)
+}
+
 // checkAndIncrementHumorAPI returns true if the call is allowed (under limit), and increments the counter.
+// The load, check, increment and save all happen under countsMux.
 func (sc *Scraper) checkAndIncrementHumorAPI(ctx context.Context, limit int) bool {
+	sc.countsMux.Lock()
+	defer sc.countsMux.Unlock()
 	counts, err := sc.loadCallCounts(ctx)
 	if err != nil {
 		return false
@@ -74,7 +95,10 @@ func (sc *Scraper) checkAndIncrementHumorAPI(ctx context.Context, limit int) boo
 }
 
 // checkAndIncrementAPILeague returns true if the call is allowed (under limit), and increments the counter.
+// The load, check, increment and save all happen under countsMux.
 func (sc *Scraper) checkAndIncrementAPILeague(ctx context.Context, limit int) bool {
+	sc.countsMux.Lock()
+	defer sc.countsMux.Unlock()
 	counts, err := sc.loadCallCounts(ctx)
 	if err != nil {
 		return false
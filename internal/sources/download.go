@@ -1,9 +1,11 @@
 package sources
 
 import (
+	"bytes"
 	"context"
 	"crypto/sha256"
 	"encoding/hex"
+	"errors"
 	"fmt"
 	"io"
 	"net/http"
@@ -14,29 +16,149 @@ import (
 )
 
 // sharedHTTPClient is a package-level HTTP client reused across all scrapers
-// to allow TCP connection pooling.
-var sharedHTTPClient = &http.Client{Timeout: 60 * time.Second}
+// to allow TCP connection pooling. The default transport keeps only 2 idle
+// connections per host, which forces fresh TCP+TLS handshakes when several
+// downloads hit the same meme CDN back to back; keep a few more warm.
+var sharedHTTPClient = &http.Client{
+	Timeout:   60 * time.Second,
+	Transport: newSharedTransport(),
+}
+
+func newSharedTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 32
+	t.MaxIdleConnsPerHost = 8
+	t.IdleConnTimeout = 90 * time.Second
+	// Clone already carries this from DefaultTransport; pin it so a later
+	// custom DialContext or TLSClientConfig doesn't silently drop HTTP/2.
+	// Against HTTP/2 CDNs (pinimg.com, i.redd.it, twimg.com) concurrent
+	// fetches then share one multiplexed connection and a single handshake.
+	t.ForceAttemptHTTP2 = true
+	return t
+}
+
+// contentTypeExts maps a Content-Type substring to the file extension used for
+// the stored media; anything unmatched is stored as .jpg.
+var contentTypeExts = [...]struct{ sub, ext string }{
+	{"png", ".png"},
+	{"gif", ".gif"},
+	{"webp", ".webp"},
+}
+
+func extForContentType(contentType string) string {
+	contentType = strings.ToLower(contentType)
+	for _, e := range contentTypeExts {
+		if strings.Contains(contentType, e.sub) {
+			return e.ext
+		}
+	}
+	return ".jpg"
+}
+
+// mediaMagic lists the leading bytes of the media formats a source may be.
+var mediaMagic = [...]struct {
+	offset int
+	magic  string
+}{
+	{0, "\xff\xd8\xff"},      // JPEG
+	{0, "\x89PNG\r\n\x1a\n"}, // PNG
+	{0, "GIF87a"},            // GIF
+	{0, "GIF89a"},            // GIF
+	{8, "WEBP"},              // WebP (RIFF....WEBP)
+	{4, "ftyp"},              // MP4/MOV
+	{0, "\x1a\x45\xdf\xa3"},  // WebM/Matroska
+}
+
+// looksLikeMedia reports whether data starts like a supported image or video.
+// It catches HTML error and consent pages served with a 200 status before
+// they are decoded for hashing and uploaded as a source.
+func looksLikeMedia(data []byte) bool {
+	for _, m := range mediaMagic {
+		if len(data) >= m.offset+len(m.magic) && string(data[m.offset:m.offset+len(m.magic)]) == m.magic {
+			return true
+		}
+	}
+	return false
+}
+
+// maxMediaBytes caps how much of a media response is buffered.
+const maxMediaBytes = 20 * 1024 * 1024
+
+// readMediaBody reads a media response into a single buffer sized from
+// Content-Length, instead of io.ReadAll's repeated grow-and-copy, and stops
+// reading once the body exceeds maxMediaBytes. A response whose declared
+// Content-Length is already over the cap is rejected from the headers alone,
+// before any of the body is transferred.
+func readMediaBody(resp *http.Response) ([]byte, error) {
+	if resp.ContentLength > maxMediaBytes {
+		return nil, fmt.Errorf("media too large: %d bytes", resp.ContentLength)
+	}
+	var buf bytes.Buffer
+	if n := resp.ContentLength; n > 0 && n <= maxMediaBytes {
+		buf.Grow(int(n) + bytes.MinRead)
+	}
+	if _, err := buf.ReadFrom(io.LimitReader(resp.Body, maxMediaBytes+1)); err != nil {
+		return nil, err
+	}
+	if buf.Len() > maxMediaBytes {
+		return nil, fmt.Errorf("media too large: over %d bytes", maxMediaBytes)
+	}
+	return buf.Bytes(), nil
+}
+
+// sourceMediaKey names a stored source after its content rather than the download
+// time, so fetching the same image again maps to the same S3 object instead
+// of leaving a new orphan behind each time it is rejected as a duplicate.
+func sourceMediaKey(prefix, kind, sha256Hex, ext string) string {
+	return prefix + kind + "-" + sha256Hex[:16] + ext
+}
+
+// putMediaOnce uploads data to key unless an object is already there; with
+// content-derived keys an existing object holds the same bytes, so a HEAD
+// replaces re-sending up to maxMediaBytes.
+func (sc *Scraper) putMediaOnce(ctx context.Context, key string, data []byte, contentType string) error {
+	if exists, err := sc.s3.Exists(ctx, key); err == nil && exists {
+		return nil
+	}
+	return sc.s3.PutBytes(ctx, key, data, contentType)
+}
 
 func (sc *Scraper) downloadAsset(ctx context.Context, mediaURL string, kind model.SourceKind, sourceURL string) (*model.SourceAsset, error) {
+	data, contentType, err := fetchMedia(ctx, mediaURL)
+	if err != nil {
+		return nil, err
+	}
+	return sc.storeAsset(ctx, mediaURL, data, contentType, kind, sourceURL)
+}
+
+// fetchMedia downloads and sanity-checks a media file without storing it.
+func fetchMedia(ctx context.Context, mediaURL string) ([]byte, string, error) {
 	req, err := http.NewRequestWithContext(ctx, "GET", mediaURL, nil)
 	if err != nil {
-		return nil, fmt.Errorf("create request: %w", err)
+		return nil, "", fmt.Errorf("create request: %w", err)
 	}
 	resp, err := sharedHTTPClient.Do(req)
 	if err != nil {
-		return nil, err
+		return nil, "", err
 	}
 	defer resp.Body.Close()
 
 	if resp.StatusCode != 200 {
-		return nil, fmt.Errorf("http %d for %s", resp.StatusCode, mediaURL)
+		return nil, "", fmt.Errorf("http %d for %s", resp.StatusCode, mediaURL)
 	}
 
-	data, err := io.ReadAll(resp.Body)
+	data, err := readMediaBody(resp)
 	if err != nil {
-		return nil, err
+		return nil, "", err
 	}
+	if !looksLikeMedia(data) {
+		return nil, "", fmt.Errorf("not an image or video: %s", mediaURL)
+	}
+	return data, resp.Header.Get("Content-Type"), nil
+}
 
+// storeAsset hashes fetched media, uploads it and builds its SourceAsset.
+func (sc *Scraper) storeAsset(ctx context.Context, mediaURL string, data []byte, contentType string, kind model.SourceKind, sourceURL string) (*model.SourceAsset, error) {
 	h := sha256.Sum256(data)
 	hash := hex.EncodeToString(h[:])
 
@@ -48,20 +170,14 @@ func (sc *Scraper) downloadAsset(ctx context.Context, mediaURL string, kind mode
 		imageHash = 0
 	}
 
-	ext := ".jpg"
-	contentType := resp.Header.Get("Content-Type")
-	if strings.Contains(contentType, "png") {
-		ext = ".png"
-	} else if strings.Contains(contentType, "gif") {
-		ext = ".gif"
-	} else if strings.Contains(contentType, "webp") {
-		ext = ".webp"
-	}
+	ext := extForContentType(contentType)
 
-	id := fmt.Sprintf("%s-%d", kind, time.Now().UnixNano())
-	key := sc.cfg.SourcesPrefix + id + ext
+	// One clock read serves the ID and both timestamps.
+	now := time.Now()
+	id := fmt.Sprintf("%s-%d", kind, now.UnixNano())
+	key := sourceMediaKey(sc.cfg.SourcesPrefix, string(kind), hash, ext)
 
-	if err := sc.s3.PutBytes(ctx, key, data, contentType); err != nil {
+	if err := sc.putMediaOnce(ctx, key, data, contentType); err != nil {
 		return nil, fmt.Errorf("s3 upload: %w", err)
 	}
 
@@ -71,10 +187,53 @@ func (sc *Scraper) downloadAsset(ctx context.Context, mediaURL string, kind mode
 		SourceURL:  sourceURL,
 		MediaKey:   key,
 		MimeType:   contentType,
-		AddedAt:    time.Now(),
-		LastSeenAt: time.Now(),
+		AddedAt:    now,
+		LastSeenAt: now,
 		Used:       false,
 		SHA256:     hash,
 		ImageHash:  imageHash,
 	}, nil
 }
+
+// fetchedMedia is one result of fetchFirst.
+type fetchedMedia struct {
+	url         string
+	data        []byte
+	contentType string
+	err         error
+}
+
+// fetchFirst fetches urls concurrently, at most limit at a time, and returns
+// the first that succeeds. Scrapers need a single image, so trying candidates
+// in parallel costs the fastest download rather than the sum of the failed
+// ones; the rest are cancelled as soon as one wins.
+func fetchFirst(ctx context.Context, urls []string, limit int, fetch func(ctx context.Context, url string) ([]byte, string, error)) (fetchedMedia, error) {
+	fetchCtx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	results := make(chan fetchedMedia, len(urls))
+	sem := make(chan struct{}, limit)
+	for _, u := range urls {
+		go func(u string) {
+			select {
+			case sem <- struct{}{}:
+				defer func() { <-sem }()
+			case <-fetchCtx.Done():
+				results <- fetchedMedia{url: u, err: fetchCtx.Err()}
+				return
+			}
+			data, contentType, err := fetch(fetchCtx, u)
+			results <- fetchedMedia{url: u, data: data, contentType: contentType, err: err}
+		}(u)
+	}
+
+	lastErr := errors.New("no candidates")
+	for range urls {
+		r := <-results
+		if r.err == nil {
+			return r, nil
+		}
+		lastErr = r.err
+	}
+	return fetchedMedia{}, lastErr
+}
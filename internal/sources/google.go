@@ -6,13 +6,13 @@ import (
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
-	"io"
 	"math/rand"
 	"net/http"
 	"net/url"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"meme-video-gen/internal/model"
@@ -25,21 +25,47 @@ type GoogleKeywords []string
 func loadGoogleKeywords(filename string) (GoogleKeywords, error) {
 	data, err := os.ReadFile(filename)
 	if err != nil {
-		return getDefaultGoogleKeywords(), nil
+		return nil, err
 	}
 
 	var keywords GoogleKeywords
 	if err := json.Unmarshal(data, &keywords); err != nil {
-		return getDefaultGoogleKeywords(), nil
+		return nil, err
 	}
 
 	if len(keywords) == 0 {
-		return getDefaultGoogleKeywords(), nil
+		return nil, fmt.Errorf("%s: no keywords", filename)
 	}
 
 	return keywords, nil
 }
 
+// The keywords file is static for the lifetime of the process, so it is
+// resolved and parsed once rather than on every scrape.
+var (
+	googleKeywordsOnce   sync.Once
+	googleKeywordsCached GoogleKeywords
+	googleKeywordsPath   string
+)
+
+func cachedGoogleKeywords() (GoogleKeywords, string) {
+	googleKeywordsOnce.Do(func() {
+		keywordsPaths := []string{
+			"internal/sources/google_keywords.json",
+			"google_keywords.json",
+			filepath.Join("internal", "sources", "google_keywords.json"),
+		}
+		for _, path := range keywordsPaths {
+			if keywords, err := loadGoogleKeywords(path); err == nil {
+				googleKeywordsCached = keywords
+				googleKeywordsPath = path
+				return
+			}
+		}
+	})
+	return googleKeywordsCached, googleKeywordsPath
+}
+
 // getDefaultGoogleKeywords returns fallback keywords if file not found
 func getDefaultGoogleKeywords() GoogleKeywords {
 	return GoogleKeywords{
@@ -75,29 +101,14 @@ func (sc *Scraper) scrapeGoogleImages(ctx context.Context) (*model.SourceAsset,
 
 	sc.log.Infof("Google: starting Google Images scraping via SerpAPI")
 
-	// Load keywords - try both possible paths
-	keywordsPaths := []string{
-		"internal/sources/google_keywords.json",
-		"google_keywords.json",
-		filepath.Join("internal", "sources", "google_keywords.json"),
-	}
-
-	var keywords GoogleKeywords
-	var err error
-	loaded := false
-
-	for _, path := range keywordsPaths {
-		keywords, err = loadGoogleKeywords(path)
-		if err == nil && len(keywords) > 0 {
-			loaded = true
-			sc.log.Infof("Google: loaded keywords from %s", path)
-			break
-		}
-	}
-
-	if !loaded {
+	// Copy: the slice is shuffled below and the cached one must stay intact.
+	cached, path := cachedGoogleKeywords()
+	keywords := append(GoogleKeywords(nil), cached...)
+	if len(keywords) == 0 {
 		sc.log.Errorf("Google: failed to load keywords from any path, using defaults")
 		keywords = getDefaultGoogleKeywords()
+	} else {
+		sc.log.Infof("Google: using keywords from %s", path)
 	}
 
 	sc.log.Infof("Google: loaded %d keywords", len(keywords))
@@ -173,8 +184,8 @@ func (sc *Scraper) scrapeGoogleImages(ctx context.Context) (*model.SourceAsset,
 			maxImageAttempts = len(serpResp.ImagesResults)
 		}
 
-		for imgIdx := 0; imgIdx < maxImageAttempts; imgIdx++ {
-			img := serpResp.ImagesResults[imgIdx]
+		candidates := make([]string, 0, maxImageAttempts)
+		for _, img := range serpResp.ImagesResults[:maxImageAttempts] {
 			imageURL := img.Original
 
 			if imageURL == "" {
@@ -189,7 +200,7 @@ func (sc *Scraper) scrapeGoogleImages(ctx context.Context) (*model.SourceAsset,
 			// Check file extension
 			lowerURL := strings.ToLower(imageURL)
 			validExt := false
-			for _, ext := range []string{".jpg", ".jpeg", ".png", ".gif", ".webp"} {
+			for _, ext := range googleImageExts {
 				if strings.Contains(lowerURL, ext) {
 					validExt = true
 					break
@@ -199,17 +210,16 @@ func (sc *Scraper) scrapeGoogleImages(ctx context.Context) (*model.SourceAsset,
 				continue
 			}
 
-			sc.log.Infof("Google: attempting to download image %d/%d from %s", imgIdx+1, maxImageAttempts, imageURL)
+			candidates = append(candidates, imageURL)
+		}
 
-			// Download image
-			asset, err := sc.downloadGoogleImage(ctx, imageURL, img.Source, query)
-			if err != nil {
-				sc.log.Errorf("Google: failed to download image: %v", err)
-				continue
+		if len(candidates) > 0 {
+			asset, err := sc.downloadFirstGoogleImage(ctx, candidates)
+			if err == nil {
+				sc.log.Infof("Google: successfully downloaded image from Google Images")
+				return asset, nil
 			}
-
-			sc.log.Infof("Google: successfully downloaded image from Google Images")
-			return asset, nil
+			sc.log.Errorf("Google: failed to download image: %v", err)
 		}
 
 		sc.log.Errorf("Google: no valid images downloaded for keyword '%s'", query)
@@ -218,25 +228,56 @@ func (sc *Scraper) scrapeGoogleImages(ctx context.Context) (*model.SourceAsset,
 	return nil, fmt.Errorf("failed to download any image after %d keyword attempts", maxKeywordAttempts)
 }
 
-// downloadGoogleImage downloads an image from the given URL and creates a SourceAsset
-func (sc *Scraper) downloadGoogleImage(ctx context.Context, imageURL, source, query string) (*model.SourceAsset, error) {
-	// Retry logic for download attempts (to handle 403, 429, etc)
+// googleImageExts are the extensions a SerpAPI result URL must contain to be
+// tried as an image.
+var googleImageExts = [...]string{".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+// googleDownloadConcurrency bounds how many SerpAPI results are fetched at once.
+const googleDownloadConcurrency = 4
+
+// downloadFirstGoogleImage fetches the candidate URLs concurrently and stores
+// the first one that downloads and validates; the slow or hotlink-protected
+// hosts (each with its own retry backoff) no longer add up one after another,
+// and only the winner is uploaded to S3.
+func (sc *Scraper) downloadFirstGoogleImage(ctx context.Context, candidates []string) (*model.SourceAsset, error) {
+	img, err := fetchFirst(ctx, candidates, googleDownloadConcurrency, func(ctx context.Context, imageURL string) ([]byte, string, error) {
+		sc.log.Infof("Google: attempting to download image from %s", imageURL)
+		return sc.fetchGoogleImage(ctx, imageURL)
+	})
+	if err != nil {
+		return nil, err
+	}
+	return sc.storeGoogleImage(ctx, img.url, img.data, img.contentType)
+}
+
+// fetchGoogleImage downloads and validates an image from the given URL.
+func (sc *Scraper) fetchGoogleImage(ctx context.Context, imageURL string) ([]byte, string, error) {
+	// Retry logic for transient download failures (network errors, 429, 5xx)
 	maxRetries := 5
 	var lastErr error
 	var resp *http.Response
 
 	for attempt := 0; attempt < maxRetries; attempt++ {
 		if attempt > 0 {
-			// Exponential backoff: 2s, 5s, 10s, 20s, 40s
-			backoff := time.Duration((attempt*3)+2) * time.Second
+			// Exponential backoff with jitter (1s, 2s, 4s, 8s + up to 1s),
+			// so parallel scrapes don't retry in lockstep; cut short if the
+			// context is cancelled.
+			backoff := min(time.Duration(1<<(attempt-1))*time.Second, 8*time.Second) +
+				time.Duration(rand.Int63n(int64(time.Second)))
 			sc.log.Infof("Google: retry attempt %d/%d after %v", attempt+1, maxRetries, backoff)
-			time.Sleep(backoff)
+			t := time.NewTimer(backoff)
+			select {
+			case <-ctx.Done():
+				t.Stop()
+				return nil, "", ctx.Err()
+			case <-t.C:
+			}
 		}
 
 		// Download image
 		req, err := http.NewRequestWithContext(ctx, "GET", imageURL, nil)
 		if err != nil {
-			return nil, fmt.Errorf("create request: %w", err)
+			return nil, "", fmt.Errorf("create request: %w", err)
 		}
 
 		// Set comprehensive headers to mimic browser
@@ -259,65 +300,71 @@ func (sc *Scraper) downloadGoogleImage(ctx context.Context, imageURL, source, qu
 			sc.log.Errorf("Google: attempt %d failed: %v", attempt+1, lastErr)
 			continue
 		}
-		defer resp.Body.Close()
 
 		if resp.StatusCode == 200 {
 			// Success - continue with processing this response
 			lastErr = nil
 			break
 		}
+		// Release the connection now rather than when the function returns.
+		resp.Body.Close()
 
-		// For 403/429, retry; for others, fail immediately
-		if resp.StatusCode == 403 || resp.StatusCode == 429 {
+		// Only rate limits and server errors are worth retrying; a 403 from
+		// an image host is hotlink protection and won't change on retry, so
+		// it fails immediately and the caller moves on to the next result.
+		if resp.StatusCode == 429 || resp.StatusCode >= 500 {
 			lastErr = fmt.Errorf("download returned status %d", resp.StatusCode)
 			sc.log.Infof("Google: attempt %d got status %d, will retry", attempt+1, resp.StatusCode)
 			continue
 		}
 
 		// For other errors, fail immediately
-		return nil, fmt.Errorf("download returned status %d", resp.StatusCode)
+		return nil, "", fmt.Errorf("download returned status %d", resp.StatusCode)
 	}
 
 	if lastErr != nil {
-		return nil, lastErr
+		return nil, "", lastErr
 	}
+	defer resp.Body.Close()
 
 	// Read image data
-	imageData, err := io.ReadAll(resp.Body)
+	imageData, err := readMediaBody(resp)
 	if err != nil {
-		return nil, fmt.Errorf("read image data: %w", err)
+		return nil, "", fmt.Errorf("read image data: %w", err)
 	}
 
 	// Validate image size
 	if len(imageData) < 1024 {
-		return nil, fmt.Errorf("image too small: %d bytes", len(imageData))
+		return nil, "", fmt.Errorf("image too small: %d bytes", len(imageData))
 	}
 
 	if len(imageData) > 20*1024*1024 {
-		return nil, fmt.Errorf("image too large: %d bytes", len(imageData))
+		return nil, "", fmt.Errorf("image too large: %d bytes", len(imageData))
+	}
+
+	if !looksLikeMedia(imageData) {
+		return nil, "", fmt.Errorf("not an image: %s", imageURL)
 	}
 
+	return imageData, resp.Header.Get("Content-Type"), nil
+}
+
+// storeGoogleImage uploads a fetched image to S3 and creates a SourceAsset.
+func (sc *Scraper) storeGoogleImage(ctx context.Context, imageURL string, imageData []byte, contentType string) (*model.SourceAsset, error) {
 	// Calculate SHA256
 	hash := sha256.Sum256(imageData)
 	sha256Hash := hex.EncodeToString(hash[:])
 
 	// Determine file extension
-	ext := ".jpg"
-	contentType := resp.Header.Get("Content-Type")
-	if strings.Contains(contentType, "png") {
-		ext = ".png"
-	} else if strings.Contains(contentType, "gif") {
-		ext = ".gif"
-	} else if strings.Contains(contentType, "webp") {
-		ext = ".webp"
-	}
+	ext := extForContentType(contentType)
 
-	// Generate unique ID and filename
-	id := fmt.Sprintf("google_%d", time.Now().UnixNano())
-	mediaKey := sc.cfg.SourcesPrefix + id + ext
+	// Generate unique ID and filename; one clock read serves the ID and both timestamps
+	now := time.Now()
+	id := fmt.Sprintf("google_%d", now.UnixNano())
+	mediaKey := sourceMediaKey(sc.cfg.SourcesPrefix, "google", sha256Hash, ext)
 
 	// Upload to S3
-	if err := sc.s3.PutBytes(ctx, mediaKey, imageData, contentType); err != nil {
+	if err := sc.putMediaOnce(ctx, mediaKey, imageData, contentType); err != nil {
 		return nil, fmt.Errorf("upload to S3: %w", err)
 	}
 
@@ -328,8 +375,8 @@ func (sc *Scraper) downloadGoogleImage(ctx context.Context, imageURL, source, qu
 		SourceURL:  imageURL,
 		MediaKey:   mediaKey,
 		MimeType:   contentType,
-		AddedAt:    time.Now(),
-		LastSeenAt: time.Now(),
+		AddedAt:    now,
+		LastSeenAt: now,
 		Used:       false,
 		SHA256:     sha256Hash,
 	}
@@ -117,19 +117,22 @@ func (sc *Scraper) IsHashInBlacklist(ctx context.Context, hash uint64) (bool, er
 		if !found {
 			index = model.ImageHashIndex{Hashes: []uint64{}}
 		}
+		cached = index.Set()
 		sc.hashCacheMux.Lock()
-		sc.hashBlacklist = &index
+		sc.hashBlacklist = cached
 		sc.hashBlacklistExp = time.Now().Add(5 * time.Minute)
 		sc.hashCacheMux.Unlock()
-		cached = &index
 	}
 
-	return lo.Contains(cached.Hashes, hash), nil
+	_, ok := cached[hash]
+	return ok, nil
 }
 
-// AddHashToBlacklist adds a hash to the image hash blacklist and invalidates the cache.
-func (sc *Scraper) AddHashToBlacklist(ctx context.Context, hash uint64) error {
-	if hash == 0 {
+// AddHashToBlacklist adds hashes to the image hash blacklist and invalidates the cache.
+// Several hashes can be added in one read+write of the index.
+func (sc *Scraper) AddHashToBlacklist(ctx context.Context, hashes ...uint64) error {
+	hashes = lo.Filter(hashes, func(h uint64, _ int) bool { return h != 0 })
+	if len(hashes) == 0 {
 		return nil
 	}
 
@@ -144,9 +147,13 @@ func (sc *Scraper) AddHashToBlacklist(ctx context.Context, hash uint64) error {
 		index = model.ImageHashIndex{Hashes: []uint64{}}
 	}
 
-	if !lo.Contains(index.Hashes, hash) {
-		index.Hashes = append(index.Hashes, hash)
-		sc.log.Infof("image_hash: added hash %d to blacklist (total: %d)", hash, len(index.Hashes))
+	existing := index.Set()
+	for _, hash := range hashes {
+		if _, ok := existing[hash]; !ok {
+			existing[hash] = struct{}{}
+			index.Hashes = append(index.Hashes, hash)
+			sc.log.Infof("image_hash: added hash %d to blacklist (total: %d)", hash, len(index.Hashes))
+		}
 	}
 
 	err = sc.s3.WriteJSON(ctx, sc.cfg.ImageHashIndexKey, &index)
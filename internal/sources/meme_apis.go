@@ -4,7 +4,6 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	"io"
 	"net/http"
 
 	"meme-video-gen/internal/model"
@@ -31,15 +30,11 @@ func (sc *Scraper) scrapeMemeAPI(ctx context.Context) (*model.SourceAsset, error
 	if resp.StatusCode != 200 {
 		return nil, fmt.Errorf("meme-api: http %d", resp.StatusCode)
 	}
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	var result struct {
 		URL  string `json:"url"`
 		NSFW bool   `json:"nsfw"`
 	}
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
 		return nil, fmt.Errorf("meme-api: parse response: %w", err)
 	}
 	if result.URL == "" {
@@ -72,14 +67,10 @@ func (sc *Scraper) scrapeHumorAPI(ctx context.Context) (*model.SourceAsset, erro
 	if resp.StatusCode != 200 {
 		return nil, fmt.Errorf("humorapi: http %d", resp.StatusCode)
 	}
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	var result struct {
 		URL string `json:"url"`
 	}
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
 		return nil, fmt.Errorf("humorapi: parse response: %w", err)
 	}
 	if result.URL == "" {
@@ -109,14 +100,10 @@ func (sc *Scraper) scrapeAPILeague(ctx context.Context) (*model.SourceAsset, err
 	if resp.StatusCode != 200 {
 		return nil, fmt.Errorf("apileague: http %d", resp.StatusCode)
 	}
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	var result struct {
 		URL string `json:"url"`
 	}
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
 		return nil, fmt.Errorf("apileague: parse response: %w", err)
 	}
 	if result.URL == "" {
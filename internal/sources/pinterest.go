@@ -1,16 +1,19 @@
 package sources
 
 import (
+	"bytes"
 	"context"
 	"errors"
 	"fmt"
 	"math/rand"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/chromedp/chromedp"
 	"github.com/gocolly/colly"
 	"github.com/gocolly/colly/extensions"
+	"golang.org/x/net/html"
 
 	"meme-video-gen/internal/model"
 )
@@ -36,9 +39,9 @@ func (sc *Scraper) ScrapePinterest(ctx context.Context, boardURL string) (*model
 	return sc.scrapePinterestColly(ctx, boardURL)
 }
 
-// scrapePinterestChrome uses headless Chrome to properly load JavaScript-rendered content
-func (sc *Scraper) scrapePinterestChrome(boardURL string) (string, error) {
-	opts := append(chromedp.DefaultExecAllocatorOptions[:],
+// Static scraper setup, built once at package init instead of on every scrape.
+var (
+	chromeAllocatorOptions = append(chromedp.DefaultExecAllocatorOptions[:],
 		chromedp.Flag("headless", true),
 		chromedp.Flag("no-sandbox", true),
 		chromedp.Flag("disable-gpu", true),
@@ -46,20 +49,129 @@ func (sc *Scraper) scrapePinterestChrome(boardURL string) (string, error) {
 		chromedp.UserAgent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
 	)
 
-	sc.logfIfNotSilent("[CHROME] Starting Chrome instance...")
-	allocCtx, cancel := chromedp.NewExecAllocator(context.Background(), opts...)
-	defer cancel()
+	collyRequestHeaders = map[string]string{
+		"Accept":                    "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+		"DNT":                       "1",
+		"Connection":                "keep-alive",
+		"Upgrade-Insecure-Requests": "1",
+		"Referer":                   "https://www.pinterest.com/",
+	}
+)
+
+// chromeIdleTimeout is how long the shared Chrome may sit without an open
+// tab before it is shut down.
+const chromeIdleTimeout = 5 * time.Minute
+
+// chromeInstance is one launched headless Chrome and the tabs using it.
+type chromeInstance struct {
+	ctx    context.Context
+	cancel context.CancelFunc
+	tabs   int  // scrapes currently holding a tab; guarded by sharedChrome.mu
+	broken bool // a board navigation failed; don't hand out new tabs
+}
+
+// sharedChrome is a headless Chrome kept running across scrapes, so each
+// scrape opens a tab instead of paying browser startup and profile init.
+// It is started lazily and shut down after chromeIdleTimeout with no tabs.
+// A failed board navigation marks it broken: the next scrape launches a
+// fresh browser, and the old one is cancelled once its last tab closes, so
+// a failure never tears down a browser another scrape is still using.
+var sharedChrome struct {
+	mu   sync.Mutex
+	cur  *chromeInstance
+	idle *time.Timer
+}
+
+// acquireChrome returns the shared browser with a tab reserved on it,
+// launching Chrome if needed. Every call must be paired with releaseChrome.
+func acquireChrome() (*chromeInstance, error) {
+	sharedChrome.mu.Lock()
+	defer sharedChrome.mu.Unlock()
+	if sharedChrome.idle != nil {
+		sharedChrome.idle.Stop()
+		sharedChrome.idle = nil
+	}
+	if c := sharedChrome.cur; c != nil && !c.broken && c.ctx.Err() == nil {
+		c.tabs++
+		return c, nil
+	}
+
+	allocCtx, cancelAlloc := chromedp.NewExecAllocator(context.Background(), chromeAllocatorOptions...)
+	browserCtx, cancelBrowser := chromedp.NewContext(allocCtx)
+	cancel := func() {
+		cancelBrowser()
+		cancelAlloc()
+	}
+	// An empty Run starts the browser process.
+	if err := chromedp.Run(browserCtx); err != nil {
+		cancel()
+		return nil, fmt.Errorf("start chrome: %w", err)
+	}
+	if old := sharedChrome.cur; old != nil && old.tabs == 0 {
+		old.cancel()
+	}
+	c := &chromeInstance{ctx: browserCtx, cancel: cancel, tabs: 1}
+	sharedChrome.cur = c
+	return c, nil
+}
+
+// releaseChrome gives back a tab taken by acquireChrome. failed marks the
+// browser broken. The browser is cancelled when its last tab is released
+// if it is broken or has been replaced; otherwise the idle timer starts.
+func releaseChrome(c *chromeInstance, failed bool) {
+	sharedChrome.mu.Lock()
+	defer sharedChrome.mu.Unlock()
+	c.tabs--
+	if failed {
+		c.broken = true
+	}
+	if c.tabs > 0 {
+		return
+	}
+	if c.broken || sharedChrome.cur != c {
+		c.cancel()
+		if sharedChrome.cur == c {
+			sharedChrome.cur = nil
+		}
+		return
+	}
+	sharedChrome.idle = time.AfterFunc(chromeIdleTimeout, func() {
+		sharedChrome.mu.Lock()
+		defer sharedChrome.mu.Unlock()
+		if sharedChrome.cur == c && c.tabs == 0 {
+			c.cancel()
+			sharedChrome.cur = nil
+		}
+	})
+}
 
-	ctx, cancel := chromedp.NewContext(allocCtx)
+// scrapePinterestChrome uses headless Chrome to properly load JavaScript-rendered content
+func (sc *Scraper) scrapePinterestChrome(boardURL string) (string, error) {
+	sc.logfIfNotSilent("[CHROME] Opening tab in shared Chrome instance...")
+	browser, err := acquireChrome()
+	if err != nil {
+		return "", err
+	}
+	failed := false
+	defer func() { releaseChrome(browser, failed) }()
+
+	// A context derived from the browser context opens a new tab; cancelling
+	// it closes only that tab.
+	ctx, cancel := chromedp.NewContext(browser.ctx)
 	defer cancel()
 
 	ctx, cancel = context.WithTimeout(ctx, 180*time.Second)
 	defer cancel()
 
-	pinHref := ""
+	// pick is the chosen pin: its link and, when the board thumbnail's srcset
+	// already carries a high-res variant, that direct image URL.
+	var pick struct {
+		Href string `json:"href"`
+		Img  string `json:"img"`
+	}
 
 	sc.logfIfNotSilent("[CHROME] Navigating to board: %s", boardURL)
-	err := chromedp.Run(ctx,
+	err = chromedp.Run(ctx,
 		chromedp.Navigate(boardURL),
 		chromedp.Sleep(2*time.Second),
 		chromedp.Evaluate(`window.scrollTo(0, Math.random() * Math.max(document.body.scrollHeight, 2000))`, nil),
@@ -72,19 +184,34 @@ func (sc *Scraper) scrapePinterestChrome(boardURL string) (string, error) {
 					const randomPin = links[Math.floor(Math.random() * links.length)];
 					const href = randomPin.href || randomPin.getAttribute('href');
 					console.log('[DEBUG] Selected random pin:', href);
-					return href;
+					let img = '';
+					const thumb = randomPin.querySelector('img[srcset*="pinimg.com"]');
+					if (thumb) {
+						const urls = thumb.srcset.split(',').map(s => s.trim().split(/\s+/)[0]);
+						img = urls.find(u => u.includes('/originals/')) || urls.find(u => u.includes('/736x/')) || '';
+					}
+					return {href: href || '', img: img};
 				}
-				return null;
+				return {href: '', img: ''};
 			})()
-		`, &pinHref),
+		`, &pick),
 	)
 
 	if err != nil {
 		sc.logf("[CHROME] ❌ Failed to navigate board: %v", err)
+		// The browser itself may be the problem; start a fresh one next time.
+		failed = true
 		return "", fmt.Errorf("chrome scraping failed: %w", err)
 	}
 
-	if pinHref != "" {
+	// The board thumbnail already links the full-size image: skip loading
+	// the pin page just to find the same URL.
+	if pick.Img != "" {
+		sc.logfIfNotSilent("[CHROME] ✓ Using high-res image from board srcset")
+		return pick.Img, nil
+	}
+
+	if pinHref := pick.Href; pinHref != "" {
 		sc.logfIfNotSilent("[CHROME] ✓ Found pin link: %s", pinHref)
 		imgURL, err := sc.scrapePinPage(ctx, pinHref)
 		if err == nil && imgURL != "" {
@@ -294,65 +421,39 @@ func (sc *Scraper) scrapeBoardImages(ctx context.Context) (string, error) {
 
 // scrapePinterestColly uses Colly as fallback method
 func (sc *Scraper) scrapePinterestColly(ctx context.Context, boardURL string) (*model.SourceAsset, error) {
-	for attempt := 1; attempt <= 2; attempt++ {
-		sc.logfIfNotSilent("[COLLY] Attempt %d/2: Fetching %s", attempt, boardURL)
-
-		c := colly.NewCollector(
-			colly.UserAgent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"),
-		)
-		extensions.RandomUserAgent(c)
-		c.SetRequestTimeout(30 * time.Second)
-
-		c.OnRequest(func(r *colly.Request) {
-			r.Headers.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8")
-			r.Headers.Set("DNT", "1")
-			r.Headers.Set("Connection", "keep-alive")
-			r.Headers.Set("Upgrade-Insecure-Requests", "1")
-			r.Headers.Set("Referer", "https://www.pinterest.com/")
-		})
-
-		var bestImgURL string
-		var maxDimensions int
-
-		imgSelectors := []string{
-			"img[src*='pinimg.com']",
-			"img[data-src*='pinimg.com']",
-			"img[alt]",
-			"div[role='img'] img",
+	// One collector serves both attempts instead of being rebuilt with its
+	// RandomUserAgent hook for the retry; the hook still picks a fresh agent
+	// per request. Revisits must be allowed for the retry to fetch the board.
+	c := colly.NewCollector(
+		colly.UserAgent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"),
+		colly.AllowURLRevisit(),
+	)
+	extensions.RandomUserAgent(c)
+	// Reuse the package's pooled transport so the retry and other scrapes
+	// share kept-alive connections instead of a fresh handshake per scrape.
+	c.WithTransport(sharedHTTPClient.Transport)
+	c.SetRequestTimeout(30 * time.Second)
+
+	c.OnRequest(func(r *colly.Request) {
+		for k, v := range collyRequestHeaders {
+			r.Headers.Set(k, v)
 		}
+	})
 
-		for _, selector := range imgSelectors {
-			c.OnHTML(selector, func(e *colly.HTMLElement) {
-				src := e.Attr("src")
-				if src == "" {
-					src = e.Attr("data-src")
-				}
-				if src == "" {
-					src = e.Attr("data-lazy-src")
-				}
-
-				if src == "" || !strings.Contains(src, "pinimg.com") {
-					return
-				}
-
-				width, height := extractDimensions(src)
-				if width == 0 && height == 0 {
-					width, height = 1200, 1200
-				}
+	// Scan the raw body rather than registering OnHTML, which would
+	// have Colly build a full goquery DOM of the board page just to
+	// enumerate its <img> tags.
+	var bestImgURL string
+	c.OnResponse(func(r *colly.Response) {
+		bestImgURL = bestPinimgSrc(r.Body)
+	})
 
-				currentDimensions := width * height
-				if currentDimensions > maxDimensions {
-					maxDimensions = currentDimensions
-					bestImgURL = src
-				} else if bestImgURL == "" {
-					bestImgURL = src
-				}
-			})
-		}
+	c.OnError(func(_ *colly.Response, err error) {
+		_ = err
+	})
 
-		c.OnError(func(_ *colly.Response, err error) {
-			_ = err
-		})
+	for attempt := 1; attempt <= 2; attempt++ {
+		sc.logfIfNotSilent("[COLLY] Attempt %d/2: Fetching %s", attempt, boardURL)
 
 		if err := c.Visit(boardURL); err != nil {
 			sc.logf("[COLLY] ❌ Attempt %d failed: %v", attempt, err)
@@ -378,38 +479,104 @@ func (sc *Scraper) scrapePinterestColly(ctx context.Context, boardURL string) (*
 	return nil, errors.New("no pinterest image found using colly fallback")
 }
 
-// extractDimensions parses width and height from image URL
-func extractDimensions(src string) (int, int) {
-	var width, height int
-
-	if strings.Contains(src, "fit=") {
-		parts := strings.Split(src, "fit=")
-		if len(parts) > 1 {
-			dimStr := strings.Split(parts[1], "&")[0]
-			dimensions := strings.Split(dimStr, "x")
-			if len(dimensions) == 2 {
-				_, _ = fmt.Sscanf(dimensions[0], "%d", &width)
-				_, _ = fmt.Sscanf(dimensions[1], "%d", &height)
-				if width > 0 && height > 0 {
-					return width, height
+// bestPinimgSrc streams through an HTML page with the tokenizer and returns
+// the pinimg.com <img> source with the largest dimensions. Only <img> start
+// tags are inspected and nothing is retained between tokens.
+func bestPinimgSrc(body []byte) string {
+	z := html.NewTokenizer(bytes.NewReader(body))
+	var best string
+	var maxDimensions int
+	for {
+		switch z.Next() {
+		case html.ErrorToken:
+			return best
+		case html.StartTagToken, html.SelfClosingTagToken:
+			name, hasAttr := z.TagName()
+			if !hasAttr || string(name) != "img" {
+				continue
+			}
+
+			var src, dataSrc, lazySrc string
+			for more := true; more; {
+				var key, val []byte
+				key, val, more = z.TagAttr()
+				switch string(key) {
+				case "src":
+					src = string(val)
+				case "data-src":
+					dataSrc = string(val)
+				case "data-lazy-src":
+					lazySrc = string(val)
 				}
 			}
+			if src == "" {
+				src = dataSrc
+			}
+			if src == "" {
+				src = lazySrc
+			}
+
+			if src == "" || !strings.Contains(src, "pinimg.com") {
+				continue
+			}
+
+			width, height := extractDimensions(src)
+			if width == 0 && height == 0 {
+				width, height = 1200, 1200
+			}
+
+			if dims := width * height; dims > maxDimensions {
+				maxDimensions = dims
+				best = src
+			} else if best == "" {
+				best = src
+			}
 		}
 	}
+}
 
-	urlParts := strings.Split(src, "/")
-	for _, part := range urlParts {
-		if strings.Contains(part, "x") && !strings.Contains(part, ".") {
-			dimensions := strings.Split(part, "x")
-			if len(dimensions) == 2 {
-				_, _ = fmt.Sscanf(dimensions[0], "%d", &width)
-				_, _ = fmt.Sscanf(dimensions[1], "%d", &height)
-				if width > 0 && height > 0 {
-					return width, height
-				}
-			}
+// extractDimensions parses width and height from image URL, either from a
+// fit=WxH parameter or a WxH path segment. It runs for every candidate <img>
+// on the Colly path, so it scans with strings.Cut and a digit loop instead of
+// splitting the URL into slices and going through fmt.Sscanf.
+func extractDimensions(src string) (int, int) {
+	if _, fit, ok := strings.Cut(src, "fit="); ok {
+		fit, _, _ = strings.Cut(fit, "&")
+		if w, h, ok := parseDimensions(fit); ok {
+			return w, h
+		}
+	}
+
+	for rest := src; rest != ""; {
+		var part string
+		part, rest, _ = strings.Cut(rest, "/")
+		if strings.Contains(part, ".") {
+			continue
+		}
+		if w, h, ok := parseDimensions(part); ok {
+			return w, h
 		}
 	}
 
 	return 0, 0
 }
+
+// parseDimensions parses "WxH" where both sides start with a positive number.
+func parseDimensions(s string) (int, int, bool) {
+	ws, hs, ok := strings.Cut(s, "x")
+	if !ok || strings.Contains(hs, "x") {
+		return 0, 0, false
+	}
+	w, h := leadingInt(ws), leadingInt(hs)
+	return w, h, w > 0 && h > 0
+}
+
+// leadingInt returns the value of the digits at the start of s (0 if none),
+// capped well above any real image dimension.
+func leadingInt(s string) int {
+	n := 0
+	for i := 0; i < len(s) && s[i] >= '0' && s[i] <= '9' && n < 1<<20; i++ {
+		n = n*10 + int(s[i]-'0')
+	}
+	return n
+}
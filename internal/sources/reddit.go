@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"math/rand"
 "net/http"
 	"net/url"
 	"regexp"
@@ -58,7 +59,7 @@ func (sc *Scraper) scrapeReddit(ctx context.Context, subredditURL string) (*mode
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 
 	// Execute request
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := sharedHTTPClient.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("fetch reddit API: %w", err)
 	}
@@ -74,18 +75,50 @@ func (sc *Scraper) scrapeReddit(ctx context.Context, subredditURL string) (*mode
 		return nil, fmt.Errorf("parse reddit response: %w", err)
 	}
 
-	// Find first image post
+	// Collect the image posts and download one at random rather than always
+	// the newest, which would just be rejected as a duplicate on the next
+	// run. A failed download moves on to another candidate. Crossposts and
+	// reposts share a URL, so duplicates are dropped as they are collected
+	// rather than spending download attempts on the same image.
+	var imgURLs []string
+	seen := make(map[string]struct{}, len(listing.Data.Children))
 	for _, child := range listing.Data.Children {
-		post := child.Data
-		imgURL := extractImageURL(post.URL)
-		if imgURL != "" {
-			return sc.downloadAsset(ctx, imgURL, model.SourceKindReddit, fmt.Sprintf("r/%s", subredditName))
+		imgURL := extractImageURL(child.Data.URL)
+		if imgURL == "" {
+			continue
 		}
+		if _, dup := seen[imgURL]; dup {
+			continue
+		}
+		seen[imgURL] = struct{}{}
+		imgURLs = append(imgURLs, imgURL)
+	}
+	if len(imgURLs) == 0 {
+		return nil, errors.New("no reddit image found")
 	}
+	rand.Shuffle(len(imgURLs), func(i, j int) {
+		imgURLs[i], imgURLs[j] = imgURLs[j], imgURLs[i]
+	})
 
-	return nil, errors.New("no reddit image found")
+	sourceURL := fmt.Sprintf("r/%s", subredditName)
+	img, err := fetchFirst(ctx, imgURLs[:min(len(imgURLs), maxRedditDownloadAttempts)], redditDownloadConcurrency, fetchMedia)
+	if err != nil {
+		return nil, fmt.Errorf("download reddit image: %w", err)
+	}
+	return sc.storeAsset(ctx, img.url, img.data, img.contentType, model.SourceKindReddit, sourceURL)
 }
 
+const (
+	// maxRedditDownloadAttempts bounds how many image posts scrapeReddit tries.
+	maxRedditDownloadAttempts = 5
+	// redditDownloadConcurrency bounds how many of them download at once.
+	redditDownloadConcurrency = 3
+)
+
+// imgurIDRe pulls the image ID out of an imgur page URL. Compiled once
+// rather than on every post scanned.
+var imgurIDRe = regexp.MustCompile(`imgur\.com/([a-zA-Z0-9]+)`)
+
 // extractImageURL extracts image URL from various Reddit post types
 func extractImageURL(postURL string) string {
 	if postURL == "" {
@@ -94,7 +127,7 @@ func extractImageURL(postURL string) string {
 
 	// Direct image links from i.redd.it
 	if strings.Contains(postURL, "i.redd.it") {
-		if strings.HasSuffix(postURL, ".jpg") || strings.HasSuffix(postURL, ".png") || strings.HasSuffix(postURL, ".gif") {
+		if hasRedditImageExt(postURL) {
 			return postURL
 		}
 	}
@@ -102,10 +135,9 @@ func extractImageURL(postURL string) string {
 	// imgur links
 	if strings.Contains(postURL, "imgur.com") {
 		// Convert imgur page URLs to direct image URLs
-		if !strings.HasSuffix(postURL, ".jpg") && !strings.HasSuffix(postURL, ".png") && !strings.HasSuffix(postURL, ".gif") {
+		if !hasRedditImageExt(postURL) {
 			// Extract imgur ID and construct direct URL
-			re := regexp.MustCompile(`imgur\.com/([a-zA-Z0-9]+)`)
-			if matches := re.FindStringSubmatch(postURL); len(matches) > 1 {
+			if matches := imgurIDRe.FindStringSubmatch(postURL); len(matches) > 1 {
 				return fmt.Sprintf("https://i.imgur.com/%s.jpg", matches[1])
 			}
 		}
@@ -114,3 +146,13 @@ func extractImageURL(postURL string) string {
 
 	return ""
 }
+
+// redditImageExts maps the extensions extractImageURL treats as direct images.
+var redditImageExts = map[string]bool{".jpg": true, ".png": true, ".gif": true}
+
+// hasRedditImageExt reports whether the URL ends in a direct image extension;
+// one lookup on the final extension replaces a HasSuffix test per format.
+func hasRedditImageExt(u string) bool {
+	i := strings.LastIndexByte(u, '.')
+	return i >= 0 && redditImageExts[u[i:]]
+}
@@ -50,29 +50,66 @@ type Scraper struct {
 	s3  s3.Client
 	log *logging.Logger
 
-	// Image hash blacklist in-memory cache (5-minute TTL) to reduce S3 reads.
+	// Image hash blacklist in-memory cache (5-minute TTL) to reduce S3 reads,
+	// held as a set so lookups don't scan the whole list.
 	hashCacheMux     sync.RWMutex
-	hashBlacklist    *model.ImageHashIndex
+	hashBlacklist    map[uint64]struct{}
 	hashBlacklistExp time.Time
+
+	// countsMux serializes check-and-increment of the daily API counters:
+	// EnsureSources scrapes the primary sources concurrently, and two unlocked
+	// read-modify-writes of api_call_counts.json would lose an increment and
+	// let a paid API overrun its quota. It also guards the in-memory copy of
+	// the counters, which is trusted for callCountsTTL.
+	countsMux     sync.Mutex
+	callCounts    *apiCallCounts
+	callCountsExp time.Time
+
+	// Primary sources with daily limits, built once from the configured API
+	// keys. Sources without a key are left out instead of failing every round.
+	primary []sourceFunc
+}
+
+type sourceFunc struct {
+	name   string
+	scrape func(ctx context.Context) (*model.SourceAsset, error)
 }
 
 func NewScraper(cfg internal.Config, s3c s3.Client, log *logging.Logger) *Scraper {
-	return &Scraper{cfg: cfg, s3: s3c, log: log}
+	sc := &Scraper{cfg: cfg, s3: s3c, log: log}
+	if cfg.HumorAPIKey != "" {
+		sc.primary = append(sc.primary, sourceFunc{name: "humorapi", scrape: sc.scrapeHumorAPI})
+	}
+	if cfg.APILeagueKey != "" {
+		sc.primary = append(sc.primary, sourceFunc{name: "apileague", scrape: sc.scrapeAPILeague})
+	}
+	return sc
 }
 
-// logf logs a message to stdout for CLI usage
+// logf logs a message to stdout for CLI usage.
+// The logger already writes to stdout, so print directly only when there is
+// no logger — otherwise every line hits stdout twice.
 func (sc *Scraper) logf(format string, args ...interface{}) {
-	fmt.Println(fmt.Sprintf(format, args...))
 	if sc.log != nil {
 		sc.log.Infof(format, args...)
+		return
 	}
+	fmt.Println(fmt.Sprintf(format, args...))
 }
 
-// logfIfNotSilent logs to stdout only if Silent mode is disabled
+// logfIfNotSilent traces individual scraper steps, only if Silent mode is
+// disabled. With a logger they go out at debug level, so the per-step
+// Chrome/Colly chatter costs a flag check unless LOG_LEVEL=debug; failures
+// are still reported through logf.
 func (sc *Scraper) logfIfNotSilent(format string, args ...interface{}) {
-	if !sc.cfg.Silent {
-		sc.logf(format, args...)
+	if sc.cfg.Silent {
+		return
+	}
+	if sc.log != nil {
+		sc.log.Debugf(format, args...)
+		return
 	}
+	fmt.Println(fmt.Sprintf(format, args...))
 }
 
 // logIfNotSilent logs only if Silent mode is disabled
@@ -99,13 +136,18 @@ func (sc *Scraper) EnsureSources(ctx context.Context) error {
 		sourcesIdx = model.SourcesIndex{Items: []model.SourceAsset{}}
 	}
 
+	countBefore := len(sourcesIdx.Items)
 	sc.cleanupOld(ctx, &sourcesIdx)
 	sc.trimExcess(ctx, &sourcesIdx)
+	pruned := len(sourcesIdx.Items) != countBefore
 
 	if len(sourcesIdx.Items) >= sc.cfg.MaxSources {
 		sc.logIfNotSilent("sources: already at max capacity (%d/%d)", len(sourcesIdx.Items), sc.cfg.MaxSources)
-		sourcesIdx.UpdatedAt = time.Now()
-		_ = sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &sourcesIdx)
+		// Rewrite the index only if pruning changed it — not just to bump UpdatedAt.
+		if pruned {
+			sourcesIdx.UpdatedAt = time.Now()
+			_ = sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &sourcesIdx)
+		}
 		return nil
 	}
 
@@ -116,39 +158,35 @@ func (sc *Scraper) EnsureSources(ctx context.Context) error {
 
 	var newAssets []model.SourceAsset
 
-	type sourceFunc struct {
-		name   string
-		scrape func(ctx context.Context) (*model.SourceAsset, error)
+	// Shuffle for variety into a per-call copy; sc.primary is shared and
+	// never reordered.
+	primarySources := make([]sourceFunc, len(sc.primary))
+	for i, j := range rand.Perm(len(sc.primary)) {
+		primarySources[i] = sc.primary[j]
 	}
 
-	// Primary sources with daily limits — shuffle for variety.
-	primarySources := []sourceFunc{
-		{name: "humorapi", scrape: sc.scrapeHumorAPI},
-		{name: "apileague", scrape: sc.scrapeAPILeague},
-	}
-	rand.Shuffle(len(primarySources), func(i, j int) {
-		primarySources[i], primarySources[j] = primarySources[j], primarySources[i]
-	})
-
 	// memeapi is the fallback: unlimited but capped at 5 req/min.
 	fallbackSource := sourceFunc{name: "memeapi", scrape: sc.scrapeMemeAPI}
 
-	tryAdd := func(src sourceFunc) bool {
-		sc.logIfNotSilent("sources: trying %s", src.name)
-		asset, err := src.scrape(ctx)
+	// failed records sources whose scrape errored (daily limit, HTTP error);
+	// phase 1 stops calling them instead of re-checking limits every round.
+	failed := make(map[string]bool, len(primarySources))
+
+	accept := func(name string, asset *model.SourceAsset, err error) bool {
 		if err != nil {
-			sc.log.Warnf("sources: scrape %s failed: %v", src.name, err)
+			sc.log.Warnf("sources: scrape %s failed: %v", name, err)
+			failed[name] = true
 			return false
 		}
 		if asset == nil {
 			return false
 		}
 		if sc.assetExists(sourcesIdx, asset.SHA256) {
-			sc.logIfNotSilent("sources: ⚠️  duplicate detected! Skipping %s asset (SHA256 already exists)", src.name)
+			sc.logIfNotSilent("sources: ⚠️  duplicate detected! Skipping %s asset (SHA256 already exists)", name)
 			return false
 		}
 		if asset.ImageHash != 0 && sc.assetExistsByImageHash(sourcesIdx, asset.ImageHash) {
-			sc.logIfNotSilent("sources: ⚠️  visual duplicate detected! Skipping %s asset (ImageHash already exists)", src.name)
+			sc.logIfNotSilent("sources: ⚠️  visual duplicate detected! Skipping %s asset (ImageHash already exists)", name)
 			return false
 		}
 		if asset.ImageHash != 0 {
@@ -156,25 +194,63 @@ func (sc *Scraper) EnsureSources(ctx context.Context) error {
 			if err != nil {
 				sc.log.Warnf("sources: failed to check blacklist: %v", err)
 			} else if inBlacklist {
-				sc.logIfNotSilent("sources: ⚠️  blacklisted visual duplicate! Skipping %s asset (ImageHash in history)", src.name)
+				sc.logIfNotSilent("sources: ⚠️  blacklisted visual duplicate! Skipping %s asset (ImageHash in history)", name)
 				return false
 			}
 		}
 		newAssets = append(newAssets, *asset)
 		sourcesIdx.Items = append(sourcesIdx.Items, *asset)
 		sourcesIdx.UpdatedAt = time.Now()
-		sc.logIfNotSilent("sources: ✓ added %s asset (%d/%d, total=%d/%d)", src.name, len(newAssets), needed, len(sourcesIdx.Items), sc.cfg.MaxSources)
+		sc.logIfNotSilent("sources: ✓ added %s asset (%d/%d, total=%d/%d)", name, len(newAssets), needed, len(sourcesIdx.Items), sc.cfg.MaxSources)
 		return true
 	}
 
+	tryAdd := func(src sourceFunc) bool {
+		sc.logIfNotSilent("sources: trying %s", src.name)
+		asset, err := src.scrape(ctx)
+		return accept(src.name, asset, err)
+	}
+
+	type scrapeResult struct {
+		name  string
+		asset *model.SourceAsset
+		err   error
+	}
+
 	// Phase 1: try primary sources (humorapi, apileague) until depleted or enough.
+	// Each round queries the live sources concurrently and handles results in
+	// completion order, so a slow API no longer delays the faster one. Only as
+	// many sources as there are free slots are queried, to spare daily quotas.
 	for len(newAssets) < needed {
-		progressed := false
+		var round []sourceFunc
 		for _, src := range primarySources {
-			if len(newAssets) >= needed {
+			if len(round) >= needed-len(newAssets) {
 				break
 			}
-			if tryAdd(src) {
+			if !failed[src.name] {
+				round = append(round, src)
+			}
+		}
+		if len(round) == 0 {
+			break
+		}
+
+		results := make(chan scrapeResult, len(round))
+		for _, src := range round {
+			sc.logIfNotSilent("sources: trying %s", src.name)
+			go func(src sourceFunc) {
+				asset, err := src.scrape(ctx)
+				results <- scrapeResult{name: src.name, asset: asset, err: err}
+			}(src)
+		}
+
+		progressed := false
+		for range round {
+			r := <-results
+			if len(newAssets) >= needed {
+				continue
+			}
+			if accept(r.name, r.asset, r.err) {
 				progressed = true
 			}
 		}
@@ -195,7 +271,8 @@ func (sc *Scraper) EnsureSources(ctx context.Context) error {
 
 	// Write sources.json once at the end (instead of after every asset)
 	// — reduces S3 write traffic from O(N) to O(1).
-	if len(newAssets) > 0 {
+	if len(newAssets) > 0 || pruned {
+		sourcesIdx.UpdatedAt = time.Now()
 		if err := sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &sourcesIdx); err != nil {
 			sc.log.Errorf("sources: failed to update sources.json: %v", err)
 		}
@@ -254,13 +331,13 @@ func (sc *Scraper) SyncWithS3(ctx context.Context) error {
 	}
 
 	// Create map of existing keys in JSON
-	existingKeys := make(map[string]bool)
+	existingKeys := make(map[string]bool, len(sourcesIdx.Items))
 	for _, item := range sourcesIdx.Items {
 		existingKeys[item.MediaKey] = true
 	}
 
 	// Create map of actual keys in S3
-	actualKeys := make(map[string]bool)
+	actualKeys := make(map[string]bool, len(objects))
 	for _, obj := range objects {
 		actualKeys[obj.Key] = true
 	}
@@ -282,28 +359,30 @@ func (sc *Scraper) SyncWithS3(ctx context.Context) error {
 		sc.logIfNotSilent("sources: removed %d orphaned entries from JSON", removedCount)
 	}
 
-	// Delete orphaned files in S3 that are not tracked in JSON
-	orphanedFiles := 0
-	deletedFiles := 0
+	// Delete orphaned files in S3 that are not tracked in JSON, collected
+	// first and removed in one concurrent batch.
+	var orphaned []string
 	for key := range actualKeys {
 		if !existingKeys[key] {
-			orphanedFiles++
 			sc.logIfNotSilent("sources: deleting orphaned file from S3: %s", key)
-			if err := sc.s3.Delete(ctx, key); err != nil {
-				sc.log.Errorf("sources: failed to delete orphaned file %s: %v", key, err)
-			} else {
-				deletedFiles++
-			}
+			orphaned = append(orphaned, key)
 		}
 	}
+	orphanedFiles := len(orphaned)
 	if orphanedFiles > 0 {
-		sc.logIfNotSilent("sources: deleted %d/%d orphaned files from S3", deletedFiles, orphanedFiles)
+		err := sc.s3.DeleteMany(ctx, orphaned)
+		if err != nil {
+			sc.log.Errorf("sources: failed to delete orphaned files: %v", err)
+		}
+		sc.logIfNotSilent("sources: deleted %d/%d orphaned files from S3", orphanedFiles-s3.DeleteFailures(err), orphanedFiles)
 	}
 
-	// Update JSON
-	sourcesIdx.UpdatedAt = time.Now()
-	if err := sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &sourcesIdx); err != nil {
-		return fmt.Errorf("write sources.json: %w", err)
+	// Update JSON only when entries were dropped (or the index is new)
+	if removedCount > 0 || !found {
+		sourcesIdx.UpdatedAt = time.Now()
+		if err := sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &sourcesIdx); err != nil {
+			return fmt.Errorf("write sources.json: %w", err)
+		}
 	}
 
 	sc.logIfNotSilent("sources: sync complete - JSON entries: %d, S3 files: %d, removed: %d, orphaned: %d",
@@ -436,6 +515,55 @@ func (sc *Scraper) RemoveSourceFromIndex(ctx context.Context, id string) error {
 	return nil
 }
 
+// RemoveSourcesFromIndex removes several sources with a single read+write of
+// sources.json (and of the hash blacklist) instead of one cycle per source.
+// Unknown IDs are ignored; it returns how many sources were removed.
+func (sc *Scraper) RemoveSourcesFromIndex(ctx context.Context, ids []string) (int, error) {
+	if len(ids) == 0 {
+		return 0, nil
+	}
+	var idx model.SourcesIndex
+	found, err := sc.s3.ReadJSON(ctx, sc.cfg.SourcesJSONKey, &idx)
+	if err != nil || !found {
+		return 0, fmt.Errorf("no sources.json")
+	}
+
+	remove := make(map[string]bool, len(ids))
+	for _, id := range ids {
+		remove[id] = true
+	}
+
+	var hashes []uint64
+	newItems := make([]model.SourceAsset, 0, len(idx.Items))
+	for _, item := range idx.Items {
+		if remove[item.ID] {
+			hashes = append(hashes, item.ImageHash)
+			continue
+		}
+		newItems = append(newItems, item)
+	}
+
+	removed := len(idx.Items) - len(newItems)
+	if removed == 0 {
+		return 0, nil
+	}
+
+	idx.Items = newItems
+	idx.UpdatedAt = time.Now()
+
+	if err := sc.s3.WriteJSON(ctx, sc.cfg.SourcesJSONKey, &idx); err != nil {
+		return 0, fmt.Errorf("failed to update sources.json: %w", err)
+	}
+
+	// Add hashes to blacklist so we never re-upload these images
+	if err := sc.AddHashToBlacklist(ctx, hashes...); err != nil {
+		sc.log.Warnf("sources: failed to add hashes to blacklist: %v", err)
+	}
+
+	sc.logIfNotSilent("sources: removed %d sources from index", removed)
+	return removed, nil
+}
+
 func (sc *Scraper) MarkSourceUsed(ctx context.Context, id string) error {
 	var idx model.SourcesIndex
 	found, err := sc.s3.ReadJSON(ctx, sc.cfg.SourcesJSONKey, &idx)
@@ -462,19 +590,6 @@ func (sc *Scraper) MarkSourceUsed(ctx context.Context, id string) error {
 	return fmt.Errorf("source %s not found", id)
 }
 
-func (sc *Scraper) SourceExistsInS3(ctx context.Context, asset *model.SourceAsset) bool {
-	if asset == nil || asset.MediaKey == "" {
-		return false
-	}
-	// Use HeadObject (Exists) instead of GetBytes to avoid downloading the full file
-	exists, err := sc.s3.Exists(ctx, asset.MediaKey)
-	if err != nil {
-		sc.log.Warnf("sources: SourceExistsInS3 check failed for %s: %v", asset.MediaKey, err)
-		return false
-	}
-	return exists
-}
-
 func (sc *Scraper) DownloadSourceToTemp(ctx context.Context, asset *model.SourceAsset) (string, error) {
 	if asset == nil {
 		return "", fmt.Errorf("asset is nil")
@@ -491,43 +606,51 @@ func (sc *Scraper) DownloadSourceToTemp(ctx context.Context, asset *model.Source
 	defer reader.Reader.Close()
 
 	ext := filepath.Ext(asset.MediaKey)
-	tmpFile := filepath.Join(os.TempDir(), fmt.Sprintf("source-%s%s", asset.ID, ext))
+	// filepath.Base keeps a malformed ID from escaping the temp dir.
+	tmpFile := filepath.Join(os.TempDir(), fmt.Sprintf("source-%s%s", filepath.Base(asset.ID), ext))
 	f, err := os.Create(tmpFile)
 	if err != nil {
 		return "", fmt.Errorf("create temp file: %w", err)
 	}
 
-	if _, err := io.Copy(f, reader.Reader); err != nil {
+	// Capture the magic-byte header and the size while streaming, instead of
+	// re-stat'ing and re-opening the file afterwards.
+	hdr := make([]byte, 12)
+	n, err := io.ReadFull(reader.Reader, hdr)
+	if err != nil && err != io.ErrUnexpectedEOF && err != io.EOF {
 		f.Close()
 		os.Remove(tmpFile)
-		return "", fmt.Errorf("copy from S3 stream: %w", err)
+		return "", fmt.Errorf("read from S3 stream: %w", err)
 	}
-	f.Close()
-
-	// Validate file size
-	info, err := os.Stat(tmpFile)
+	hdr = hdr[:n]
+	size := int64(n)
+	if _, err := f.Write(hdr); err != nil {
+		f.Close()
+		os.Remove(tmpFile)
+		return "", fmt.Errorf("write temp file: %w", err)
+	}
+	copied, err := reader.WriteTo(f)
 	if err != nil {
+		f.Close()
 		os.Remove(tmpFile)
-		return "", fmt.Errorf("stat temp file: %w", err)
+		return "", fmt.Errorf("copy from S3 stream: %w", err)
 	}
-	if info.Size() < 1024 {
+	size += copied
+	if err := f.Close(); err != nil {
 		os.Remove(tmpFile)
-		return "", fmt.Errorf("downloaded source too small (key=%s id=%s size=%d)", asset.MediaKey, asset.ID, info.Size())
+		return "", fmt.Errorf("close temp file: %w", err)
 	}
 
-	// Validate magic bytes from file header (open + read 12 bytes)
-	hdr := make([]byte, 12)
-	hf, err := os.Open(tmpFile)
-	if err != nil {
+	// Validate file size
+	if size < 1024 {
 		os.Remove(tmpFile)
-		return "", fmt.Errorf("open temp for validation: %w", err)
+		return "", fmt.Errorf("downloaded source too small (key=%s id=%s size=%d)", asset.MediaKey, asset.ID, size)
 	}
-	n, _ := hf.Read(hdr)
-	hf.Close()
 
-	if _, ok := looksLikeImage(hdr[:n]); !ok {
+	// Validate magic bytes from file header
+	if _, ok := looksLikeImage(hdr); !ok {
 		os.Remove(tmpFile)
-		return "", fmt.Errorf("downloaded source is not a valid image (key=%s id=%s size=%d head=% x)", asset.MediaKey, asset.ID, info.Size(), hdr[:n])
+		return "", fmt.Errorf("downloaded source is not a valid image (key=%s id=%s size=%d head=% x)", asset.MediaKey, asset.ID, size, hdr)
 	}
 
 	return tmpFile, nil
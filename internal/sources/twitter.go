@@ -4,6 +4,7 @@ import (
 	"context"
 	"crypto/rand"
 	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
 	"errors"
 	"fmt"
@@ -63,6 +64,15 @@ type TwitterIncludes struct {
 	Media []TwitterMedia `json:"media"`
 }
 
+// twitterHTTPClient keeps the tighter 15s timeout for the X API but shares the
+// pooled transport, so the user-ID, timeline and media requests of one scrape
+// (and consecutive scrapes) reuse warm TCP+TLS connections instead of each
+// call building a client with its own empty pool.
+var twitterHTTPClient = &http.Client{
+	Timeout:   15 * time.Second,
+	Transport: sharedHTTPClient.Transport,
+}
+
 // scrapeTwitter extracts media from a Twitter profile URL.
 // Implements the interface expected by scraper.go
 func (sc *Scraper) scrapeTwitter(ctx context.Context, profileURL string) (*model.SourceAsset, error) {
@@ -76,7 +86,7 @@ func (sc *Scraper) scrapeTwitter(ctx context.Context, profileURL string) (*model
 		return nil, fmt.Errorf("invalid Twitter URL: %s", profileURL)
 	}
 
-	client := &http.Client{Timeout: 15 * time.Second}
+	client := twitterHTTPClient
 
 	// Get user ID
 	userID, err := sc.getTwitterUserID(ctx, client, bearerToken, username)
@@ -106,33 +116,48 @@ func (sc *Scraper) scrapeTwitter(ctx context.Context, profileURL string) (*model
 		return nil, err
 	}
 
-	for _, m := range media {
-		if m.Type != "photo" {
-			continue
-		}
-
-		mediaURL := m.URL
-		if mediaURL == "" && len(m.Variants) > 0 {
-			// Find best variant
-			for _, v := range m.Variants {
-				if strings.Contains(v.ContentType, "image") {
-					mediaURL = v.URL
-					break
-				}
-			}
-		}
+	asset, err := sc.downloadFirstTwitterPhoto(ctx, client, media, username, tmpDir)
+	if err != nil {
+		return nil, fmt.Errorf("no media successfully downloaded from @%s: %w", username, err)
+	}
+	return asset, nil
+}
 
+// downloadFirstTwitterPhoto downloads the first photo in media that succeeds.
+// Shared by scrapeTwitter and FetchFromTwitter so both pick media the same way.
+func (sc *Scraper) downloadFirstTwitterPhoto(ctx context.Context, client *http.Client, media []TwitterMedia, username, outputDir string) (*model.SourceAsset, error) {
+	lastErr := errors.New("no photos")
+	for _, m := range media {
+		mediaURL := twitterPhotoURL(m)
 		if mediaURL == "" {
 			continue
 		}
 
-		asset, err := sc.downloadTwitterMedia(ctx, client, mediaURL, username, tmpDir)
+		asset, err := sc.downloadTwitterMedia(ctx, client, mediaURL, username, outputDir)
 		if err == nil && asset != nil {
 			return asset, nil
 		}
+		sc.logf("Twitter: Failed to download media from @%s: %v", username, err)
+		lastErr = err
 	}
+	return nil, lastErr
+}
 
-	return nil, fmt.Errorf("no media successfully downloaded from @%s", username)
+// twitterPhotoURL returns the download URL of a photo, falling back to its
+// first image variant, or "" for anything that isn't a usable photo.
+func twitterPhotoURL(m TwitterMedia) string {
+	if m.Type != "photo" {
+		return ""
+	}
+	if m.URL != "" {
+		return m.URL
+	}
+	for _, v := range m.Variants {
+		if strings.Contains(v.ContentType, "image") {
+			return v.URL
+		}
+	}
+	return ""
 }
 
 // FetchFromTwitter fetches one image from Twitter sources
@@ -151,7 +176,7 @@ func (sc *Scraper) FetchFromTwitter(ctx context.Context, sources []string, outpu
 		return nil, errors.New("twitter: X_BEARER_TOKEN not configured")
 	}
 
-	client := &http.Client{Timeout: 15 * time.Second}
+	client := twitterHTTPClient
 
 	// Shuffle sources
 	shuffled := make([]string, len(sources))
@@ -196,31 +221,8 @@ func (sc *Scraper) FetchFromTwitter(ctx context.Context, sources []string, outpu
 		}
 
 		// Try to download one of the media
-		for _, m := range media {
-			if m.Type != "photo" {
-				continue
-			}
-
-			mediaURL := m.URL
-			if mediaURL == "" && len(m.Variants) > 0 {
-				// Find best variant
-				for _, v := range m.Variants {
-					if strings.Contains(v.ContentType, "image") {
-						mediaURL = v.URL
-						break
-					}
-				}
-			}
-
-			if mediaURL == "" {
-				continue
-			}
-
-			asset, err := sc.downloadTwitterMedia(ctx, client, mediaURL, username, outputDir)
-			if err == nil && asset != nil {
-				return asset, nil
-			}
-			sc.logf("Twitter: Failed to download media from @%s: %v", username, err)
+		if asset, err := sc.downloadFirstTwitterPhoto(ctx, client, media, username, outputDir); err == nil {
+			return asset, nil
 		}
 	}
 
@@ -235,12 +237,18 @@ func parseTwitterUsername(raw string) string {
 		return ""
 	}
 
-	// Remove protocol and domain
+	// Remove protocol and domain: the username is the last path segment that
+	// is neither host nor scheme. Segments are walked back from the end in one
+	// pass instead of splitting the whole URL into a slice first.
 	if strings.Contains(raw, "twitter.com") || strings.Contains(raw, "x.com") {
-		parts := strings.Split(raw, "/")
-		for i := len(parts) - 1; i >= 0; i-- {
-			part := strings.TrimSpace(parts[i])
-			if part != "" && !strings.Contains(part, ".") && !strings.Contains(part, ":") {
+		for rest := raw; rest != ""; {
+			part := rest
+			rest = ""
+			if i := strings.LastIndexByte(part, '/'); i >= 0 {
+				part, rest = part[i+1:], part[:i]
+			}
+			part = strings.TrimSpace(part)
+			if part != "" && !strings.ContainsAny(part, ".:") {
 				return part
 			}
 		}
@@ -363,46 +371,46 @@ func (sc *Scraper) downloadTwitterMedia(ctx context.Context, client *http.Client
 		return nil, fmt.Errorf("status %d", resp.StatusCode)
 	}
 
-	// Read content
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
-
-	if len(body) == 0 {
-		return nil, errors.New("empty response")
-	}
-
 	// Determine file extension from content type
 	contentType := resp.Header.Get("Content-Type")
-	ext := ".jpg"
-	if strings.Contains(contentType, "png") {
-		ext = ".png"
-	} else if strings.Contains(contentType, "gif") {
-		ext = ".gif"
-	} else if strings.Contains(contentType, "webp") {
-		ext = ".webp"
-	}
+	ext := extForContentType(contentType)
 
-	// Save file
-	filename := fmt.Sprintf("twitter_%s_%d%s", username, time.Now().UnixNano(), ext)
+	// Save file; the ID shares the filename's stamp so the two always match
+	now := time.Now()
+	id := fmt.Sprintf("twitter_%s_%d", username, now.UnixNano())
+	filename := id + ext
 	filepath := filepath.Join(outputDir, filename)
 
-	if err := os.WriteFile(filepath, body, 0644); err != nil {
+	// Stream the body to disk and through the hasher in one pass instead of
+	// holding the whole file in memory first.
+	f, err := os.Create(filepath)
+	if err != nil {
 		return nil, err
 	}
-
-	// Calculate SHA256
-	sha := sha256.Sum256(body)
-	shaStr := fmt.Sprintf("%x", sha)
+	h := sha256.New()
+	n, err := io.Copy(io.MultiWriter(f, h), io.LimitReader(resp.Body, maxMediaBytes+1))
+	if cerr := f.Close(); err == nil {
+		err = cerr
+	}
+	if err == nil && n == 0 {
+		err = errors.New("empty response")
+	}
+	if err == nil && n > maxMediaBytes {
+		err = fmt.Errorf("media exceeds %d bytes", maxMediaBytes)
+	}
+	if err != nil {
+		os.Remove(filepath)
+		return nil, err
+	}
+	shaStr := hex.EncodeToString(h.Sum(nil))
 
 	asset := &model.SourceAsset{
-		ID:        fmt.Sprintf("twitter_%s_%d", username, time.Now().UnixNano()),
+		ID:        id,
 		Kind:      model.SourceKindTwitter,
 		SourceURL: mediaURL,
 		MediaKey:  filename,
 		MimeType:  contentType,
-		AddedAt:   time.Now(),
+		AddedAt:   now,
 		SHA256:    shaStr,
 	}
 
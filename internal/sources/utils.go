@@ -3,15 +3,10 @@ package sources
 import (
 	"math/rand"
 	"sort"
-	"time"
 
 	"meme-video-gen/internal/model"
 )
 
-func init() {
-	rand.Seed(time.Now().UnixNano())
-}
-
 func randomIndex(n int) int {
 	if n <= 0 {
 		return 0
@@ -4,10 +4,14 @@ import (
 	"context"
 	"fmt"
 	"os"
+	"sync"
 )
 
 // Manager manages all uploaders
 type Manager struct {
+	// mu guards uploaders: YouTube is registered lazily from S3 while other
+	// publishes may be reading the map.
+	mu        sync.RWMutex
 	uploaders map[string]Uploader
 }
 
@@ -48,7 +52,9 @@ func NewManager() *Manager {
 
 // GetUploader returns an uploader for the specified platform
 func (m *Manager) GetUploader(platform string) (Uploader, error) {
+	m.mu.RLock()
 	uploader, ok := m.uploaders[platform]
+	m.mu.RUnlock()
 	if !ok {
 		return nil, fmt.Errorf("uploader not found for platform: %s", platform)
 	}
@@ -71,30 +77,41 @@ func (m *Manager) Upload(ctx context.Context, platform string, req *UploadReques
 
 // UploadToAll uploads to all configured platforms
 func (m *Manager) UploadToAll(ctx context.Context, req *UploadRequest) map[string]*UploadResult {
-	results := make(map[string]*UploadResult)
-
-	for platform := range m.uploaders {
-		result, _ := m.Upload(ctx, platform, req)
-		results[platform] = result
-	}
-
-	return results
+	return m.uploadParallel(ctx, m.AvailablePlatforms(), req)
 }
 
 // UploadToSelected uploads to selected platforms
 func (m *Manager) UploadToSelected(ctx context.Context, platforms []string, req *UploadRequest) map[string]*UploadResult {
-	results := make(map[string]*UploadResult)
+	return m.uploadParallel(ctx, platforms, req)
+}
+
+// uploadParallel runs the per-platform uploads concurrently. They are
+// independent network-bound calls, so a publish now takes as long as the
+// slowest platform instead of the sum of all of them.
+func (m *Manager) uploadParallel(ctx context.Context, platforms []string, req *UploadRequest) map[string]*UploadResult {
+	results := make(map[string]*UploadResult, len(platforms))
+	var mu sync.Mutex
+	var wg sync.WaitGroup
 
 	for _, platform := range platforms {
-		result, _ := m.Upload(ctx, platform, req)
-		results[platform] = result
+		wg.Add(1)
+		go func(platform string) {
+			defer wg.Done()
+			result, _ := m.Upload(ctx, platform, req)
+			mu.Lock()
+			results[platform] = result
+			mu.Unlock()
+		}(platform)
 	}
 
+	wg.Wait()
 	return results
 }
 
 // AvailablePlatforms returns list of available platforms
 func (m *Manager) AvailablePlatforms() []string {
+	m.mu.RLock()
+	defer m.mu.RUnlock()
 	platforms := make([]string, 0, len(m.uploaders))
 	for platform := range m.uploaders {
 		platforms = append(platforms, platform)
@@ -104,7 +121,7 @@ func (m *Manager) AvailablePlatforms() []string {
 
 // UpdateTelegramChatID updates the chat ID for Telegram uploader
 func (m *Manager) UpdateTelegramChatID(chatID string) {
-	if uploader, ok := m.uploaders["telegram"]; ok {
+	if uploader, err := m.GetUploader("telegram"); err == nil {
 		if tgUploader, ok := uploader.(*TelegramUploader); ok {
 			tgUploader.SetChatID(chatID)
 		}
@@ -113,5 +130,7 @@ func (m *Manager) UpdateTelegramChatID(chatID string) {
 
 // AddUploader adds or replaces an uploader for a platform
 func (m *Manager) AddUploader(platform string, uploader Uploader) {
+	m.mu.Lock()
 	m.uploaders[platform] = uploader
+	m.mu.Unlock()
 }
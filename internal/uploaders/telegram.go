@@ -68,8 +68,17 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 	}
 	defer videoFile.Close()
 
+	stat, err := videoFile.Stat()
+	if err != nil {
+		return &UploadResult{
+			Success:  false,
+			Platform: "telegram",
+			Error:    fmt.Sprintf("Failed to stat video: %v", err),
+		}, err
+	}
+
 	// Reject files that exceed Telegram's practical upload limit
-	if stat, err := videoFile.Stat(); err == nil && stat.Size() > 19*1024*1024 {
+	if stat.Size() > 19*1024*1024 {
 		sizeMB := float64(stat.Size()) / 1024 / 1024
 		return &UploadResult{
 			Success:  false,
@@ -84,29 +93,11 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 		caption = fmt.Sprintf("song is %s", req.Title)
 	}
 
-	// Create multipart form
+	// Build only the multipart envelope in memory; the video itself is streamed
+	// from disk as the request body instead of being copied into a buffer first.
 	body := &bytes.Buffer{}
 	writer := multipart.NewWriter(body)
 
-	// Add video file
-	part, err := writer.CreateFormFile("video", "video.mp4")
-	if err != nil {
-		return &UploadResult{
-			Success:  false,
-			Platform: "telegram",
-			Error:    fmt.Sprintf("Failed to create form file: %v", err),
-		}, err
-	}
-
-	_, err = io.Copy(part, videoFile)
-	if err != nil {
-		return &UploadResult{
-			Success:  false,
-			Platform: "telegram",
-			Error:    fmt.Sprintf("Failed to copy video data: %v", err),
-		}, err
-	}
-
 	// Add form fields
 	_ = writer.WriteField("chat_id", t.chatID)
 	_ = writer.WriteField("caption", caption)
@@ -115,6 +106,17 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 		_ = writer.WriteField("disable_notification", "true")
 	}
 
+	// Add video file header
+	if _, err := writer.CreateFormFile("video", "video.mp4"); err != nil {
+		return &UploadResult{
+			Success:  false,
+			Platform: "telegram",
+			Error:    fmt.Sprintf("Failed to create form file: %v", err),
+		}, err
+	}
+	head := append([]byte(nil), body.Bytes()...)
+	body.Reset()
+
 	err = writer.Close()
 	if err != nil {
 		return &UploadResult{
@@ -123,6 +125,7 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 			Error:    fmt.Sprintf("Failed to close writer: %v", err),
 		}, err
 	}
+	tail := body.Bytes()
 
 	// Send request
 	url := fmt.Sprintf("https://api.telegram.org/bot%s/sendVideo", t.botToken)
@@ -131,7 +134,8 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 		Timeout: 300 * time.Second, // 5 minutes
 	}
 
-	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, body)
+	payload := io.MultiReader(bytes.NewReader(head), videoFile, bytes.NewReader(tail))
+	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, payload)
 	if err != nil {
 		return &UploadResult{
 			Success:  false,
@@ -139,6 +143,7 @@ func (t *TelegramUploader) Upload(ctx context.Context, req *UploadRequest) (*Upl
 			Error:    fmt.Sprintf("Failed to create request: %v", err),
 		}, err
 	}
+	httpReq.ContentLength = int64(len(head)) + stat.Size() + int64(len(tail))
 
 	httpReq.Header.Set("Content-Type", writer.FormDataContentType())
 
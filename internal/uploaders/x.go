@@ -6,12 +6,14 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"log"
 	"mime/multipart"
 	"net/http"
 	"os"
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/dghubble/oauth1"
@@ -26,6 +28,20 @@ type XUploader struct {
 	httpClient        *http.Client
 }
 
+// xDebug gates the request/response traces below on LOG_LEVEL=debug. It is
+// resolved on first use rather than at package init, which runs before
+// cmd/main.go loads .env.
+var xDebug = sync.OnceValue(func() bool {
+	return strings.EqualFold(os.Getenv("LOG_LEVEL"), "debug")
+})
+
+func xDebugf(format string, args ...any) {
+	if !xDebug() {
+		return
+	}
+	log.Printf("DEBUG X: "+format, args...)
+}
+
 // NewXUploader creates a new X uploader
 func NewXUploader(consumerKey, consumerSecret, accessToken, accessTokenSecret string) *XUploader {
 	config := oauth1.NewConfig(consumerKey, consumerSecret)
@@ -291,7 +307,7 @@ func (x *XUploader) Upload(ctx context.Context, req *UploadRequest) (*UploadResu
 		}, fmt.Errorf("failed to upload media: %w", err)
 	}
 
-	fmt.Printf("[DEBUG] X: Media uploaded successfully, mediaID=%s, text=%s\n", mediaID, text)
+	xDebugf("media uploaded successfully, mediaID=%s, text=%s", mediaID, text)
 
 	// Create post with media
 	postURL := "https://api.x.com/2/tweets"
@@ -303,7 +319,7 @@ func (x *XUploader) Upload(ctx context.Context, req *UploadRequest) (*UploadResu
 	}
 
 	postJSON, _ := json.Marshal(postBody)
-	fmt.Printf("[DEBUG] X: Creating post with body: %s\n", string(postJSON))
+	xDebugf("creating post with body: %s", postJSON)
 
 	postReq, _ := http.NewRequestWithContext(ctx, "POST", postURL, bytes.NewBuffer(postJSON))
 	postReq.Header.Set("Content-Type", "application/json")
@@ -323,11 +339,11 @@ func (x *XUploader) Upload(ctx context.Context, req *UploadRequest) (*UploadResu
 	defer postResp.Body.Close()
 
 	postBodyBytes, _ := io.ReadAll(postResp.Body)
-	if len(postBodyBytes) > 200 {
-		fmt.Printf("[DEBUG] X: Response status=%d, body=%s\n", postResp.StatusCode, string(postBodyBytes[:200]))
-	} else {
-		fmt.Printf("[DEBUG] X: Response status=%d, body=%s\n", postResp.StatusCode, string(postBodyBytes))
+	trace := postBodyBytes
+	if len(trace) > 200 {
+		trace = trace[:200]
 	}
+	xDebugf("response status=%d, body=%s", postResp.StatusCode, trace)
 
 	if postResp.StatusCode != http.StatusCreated {
 		var postRes postCreateResponse
@@ -384,15 +400,24 @@ func (x *XUploader) Upload(ctx context.Context, req *UploadRequest) (*UploadResu
 	}, nil
 }
 
+// Compiled once at package init rather than on every caption.
+var (
+	shortsHashtagRe = regexp.MustCompile(`(?i)(?:^|\s)#shorts\b`)
+	multiSpaceRe    = regexp.MustCompile(`\s{2,}`)
+)
+
 // RemoveShortsHashtag removes #shorts hashtag from text
 func RemoveShortsHashtag(s string) string {
 	if s == "" {
 		return s
 	}
-	re := regexp.MustCompile(`(?i)(?:^|\s)#shorts\b`)
-	result := re.ReplaceAllString(s, " ")
-	re = regexp.MustCompile(`\s{2,}`)
-	result = re.ReplaceAllString(result, " ")
+	// Most captions carry no hashtag at all; a byte scan for '#' is far
+	// cheaper than running the case-insensitive regex over them.
+	result := s
+	if strings.IndexByte(s, '#') >= 0 {
+		result = shortsHashtagRe.ReplaceAllString(s, " ")
+	}
+	result = multiSpaceRe.ReplaceAllString(result, " ")
 	return strings.TrimSpace(result)
 }
 
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
+	"sync"
 
 	"golang.org/x/oauth2"
 	"golang.org/x/oauth2/google"
@@ -16,6 +17,12 @@ import (
 type YouTubeUploader struct {
 	credentialsPath string
 	tokenPath       string
+
+	// The authenticated service is built on first upload and reused, so each
+	// upload doesn't re-read and re-parse both files and refresh a new
+	// access token; it is dropped after a failed upload.
+	mu      sync.Mutex
+	service *youtube.Service
 }
 
 // NewYouTubeUploader creates a new YouTube uploader
@@ -47,7 +54,7 @@ func (y *YouTubeUploader) Platform() string {
 
 // Upload uploads a video to YouTube
 func (y *YouTubeUploader) Upload(ctx context.Context, req *UploadRequest) (*UploadResult, error) {
-	service, err := y.authenticate(ctx)
+	service, err := y.cachedService(ctx)
 	if err != nil {
 		return &UploadResult{
 			Success:  false,
@@ -97,6 +104,7 @@ func (y *YouTubeUploader) Upload(ctx context.Context, req *UploadRequest) (*Uplo
 	call := service.Videos.Insert([]string{"snippet", "status"}, video)
 	_, err = call.Media(videoFile).Do()
 	if err != nil {
+		y.resetService()
 		return &UploadResult{
 			Success:  false,
 			Platform: "youtube",
@@ -114,6 +122,29 @@ func (y *YouTubeUploader) Upload(ctx context.Context, req *UploadRequest) (*Uplo
 	}, nil
 }
 
+// cachedService returns the authenticated service, creating it on first use.
+// It outlives the request, so it is built on a context that isn't cancelled
+// with it — the OAuth client uses that context for later token refreshes.
+func (y *YouTubeUploader) cachedService(ctx context.Context) (*youtube.Service, error) {
+	y.mu.Lock()
+	defer y.mu.Unlock()
+	if y.service != nil {
+		return y.service, nil
+	}
+	service, err := y.authenticate(context.WithoutCancel(ctx))
+	if err != nil {
+		return nil, err
+	}
+	y.service = service
+	return service, nil
+}
+
+func (y *YouTubeUploader) resetService() {
+	y.mu.Lock()
+	y.service = nil
+	y.mu.Unlock()
+}
+
 // authenticate authenticates with YouTube API
 func (y *YouTubeUploader) authenticate(ctx context.Context) (*youtube.Service, error) {
 	// Read credentials file
@@ -5,12 +5,16 @@ import (
 	"fmt"
 	"time"
 
+	"github.com/samber/lo"
+
 	"meme-video-gen/internal/model"
 )
 
-// AddSourceToDislikedBlacklist temporarily blacklists a source so it won't be reused
-func (g *Generator) AddSourceToDislikedBlacklist(ctx context.Context, sourceID string) error {
-	if sourceID == "" {
+// AddSourceToDislikedBlacklist temporarily blacklists sources so they won't be reused.
+// Several sources can be added in one read+write of the index.
+func (g *Generator) AddSourceToDislikedBlacklist(ctx context.Context, sourceIDs ...string) error {
+	sourceIDs = lo.Compact(sourceIDs)
+	if len(sourceIDs) == 0 {
 		return nil
 	}
 
@@ -28,25 +32,34 @@ func (g *Generator) AddSourceToDislikedBlacklist(ctx context.Context, sourceID s
 		return fmt.Errorf("failed to read disliked sources: %w", err)
 	}
 
-	// Check if source is already blacklisted (don't add duplicates)
+	// Skip sources that are already blacklisted (don't add duplicates)
+	listed := make(map[string]bool, len(idx.Items))
 	for _, item := range idx.Items {
-		if item.SourceID == sourceID {
-			g.log.Infof("disliked: source %s already blacklisted, skipping", sourceID)
-			return nil
-		}
+		listed[item.SourceID] = true
 	}
 
-	// Add source to blacklist with grace period
+	// Add sources to blacklist with grace period
 	gracePeriodSeconds := int64(g.cfg.DislikedSourceGracePeriod.Seconds())
-	idx.Items = append(idx.Items, model.DislikedSource{
-		SourceID:   sourceID,
-		Duration:   gracePeriodSeconds,
-		DislikedAt: time.Now(),
-	})
+	added := 0
+	for _, sourceID := range sourceIDs {
+		if listed[sourceID] {
+			g.log.Infof("disliked: source %s already blacklisted, skipping", sourceID)
+			continue
+		}
+		listed[sourceID] = true
+		idx.Items = append(idx.Items, model.DislikedSource{
+			SourceID:   sourceID,
+			Duration:   gracePeriodSeconds,
+			DislikedAt: time.Now(),
+		})
+		added++
+		g.log.Infof("disliked: added source %s to blacklist for %.0f hours", sourceID, g.cfg.DislikedSourceGracePeriod.Hours())
+	}
+	if added == 0 {
+		return nil
+	}
 	idx.UpdatedAt = time.Now()
 
-	g.log.Infof("disliked: added source %s to blacklist for %.0f hours", sourceID, g.cfg.DislikedSourceGracePeriod.Hours())
-
 	if err := g.s3.WriteJSON(ctx, g.cfg.DislikedSourcesJSONKey, &idx); err != nil {
 		g.log.Errorf("disliked: failed to update blacklist: %v", err)
 		return fmt.Errorf("failed to update disliked sources: %w", err)
@@ -5,8 +5,10 @@ import (
 	"context"
 	"crypto/sha256"
 	"encoding/hex"
+	"errors"
 	"fmt"
-	"io"
+	"image/gif"
+	"image/jpeg"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -30,6 +32,9 @@ import (
 // "pthread_create() failed: Resource temporarily unavailable" under heavy load.
 var ffmpegSem = make(chan struct{}, 1)
 
+// errNoSources is returned by generateOne when sources.json has no items.
+var errNoSources = errors.New("no sources available")
+
 type Generator struct {
 	cfg          internal.Config
 	s3           s3.Client
@@ -41,13 +46,20 @@ type Generator struct {
 
 	// Video hash blacklist in-memory cache (5-minute TTL)
 	videoHashCacheMux     sync.RWMutex
-	videoHashBlacklist    *model.VideoHashIndex
+	videoHashBlacklist    map[uint64]struct{} // set of blacklisted hashes
 	videoHashBlacklistExp time.Time
 
 	// Disliked sources in-memory cache (5-minute TTL)
 	dislikedCacheMux sync.RWMutex
 	dislikedCache    *model.DislikedSourceIndex
 	dislikedCacheExp time.Time
+
+	// memes.json in-memory cache (5-minute TTL, refreshed on every write)
+	memesCacheMux sync.RWMutex
+	memesCache    *model.MemesIndex
+	memesByID     map[string]int // meme ID -> position in memesCache.Items
+	memesCacheExp time.Time
+	memesCacheGen uint64 // bumped by every write and invalidation
 }
 
 func NewGenerator(cfg internal.Config, s3c s3.Client, log *logging.Logger, audioIdx *audio.Indexer, sourcesScr *sources.Scraper, aiGen *ai.TitleGenerator) *Generator {
@@ -77,8 +89,6 @@ func (g *Generator) EnsureMemes(ctx context.Context) error {
 	currentCount := len(memesIdx.Items)
 	if currentCount >= g.cfg.MaxMemes {
 		g.log.Infof("video: already at max memes (%d)", currentCount)
-		memesIdx.UpdatedAt = time.Now()
-		_ = g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &memesIdx)
 		g.memesJSONMux.Unlock()
 		return nil
 	}
@@ -93,6 +103,11 @@ func (g *Generator) EnsureMemes(ctx context.Context) error {
 	for i := 0; i < needed; i++ {
 		g.log.Infof("video: generating meme %d/%d", i+1, needed)
 		meme, err := g.generateOne(ctx, &memesIdx)
+		if errors.Is(err, errNoSources) {
+			// Every remaining attempt would fail the same way.
+			g.log.Warnf("video: no sources available, stopping after %d/%d", i, needed)
+			break
+		}
 		if err != nil {
 			g.log.Errorf("video: failed to generate meme %d/%d: %v", i+1, needed, err)
 			continue
@@ -151,7 +166,7 @@ func (g *Generator) EnsureMemes(ctx context.Context) error {
 	// Update JSON first (while still holding lock)
 	memesIdx.UpdatedAt = time.Now()
 	g.log.Infof("video: saving memes.json with %d items", len(memesIdx.Items))
-	if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &memesIdx); err != nil {
+	if err := g.writeMemesIndex(ctx, &memesIdx); err != nil {
 		g.log.Errorf("video: CRITICAL ERROR - failed to save memes.json with %d items: %v", len(memesIdx.Items), err)
 		g.memesJSONMux.Unlock()
 		return fmt.Errorf("write memes.json: %w", err)
@@ -164,17 +179,18 @@ func (g *Generator) EnsureMemes(ctx context.Context) error {
 	// Delete old memes from S3 (outside the lock)
 	if len(toDelete) > 0 {
 		g.log.Infof("video: deleting %d old memes from S3", len(toDelete))
+		keys := make([]string, 0, 2*len(toDelete))
+		hashes := make([]uint64, 0, len(toDelete))
 		for _, m := range toDelete {
 			g.log.Infof("video: deleting old meme %s from S3", m.ID)
-			_ = g.s3.Delete(ctx, m.VideoKey)
-			_ = g.s3.Delete(ctx, m.ThumbKey)
+			keys = append(keys, m.VideoKey, m.ThumbKey)
+			hashes = append(hashes, m.ImageHash)
+		}
+		_ = g.s3.DeleteMany(ctx, keys)
 
-			// Add hash to blacklist so we never re-generate this meme
-			if m.ImageHash != 0 {
-				if err := g.AddVideoHashToBlacklist(ctx, m.ImageHash); err != nil {
-					g.log.Warnf("video: failed to add hash to blacklist for %s: %v", m.ID, err)
-				}
-			}
+		// Add hashes to blacklist so we never re-generate these memes
+		if err := g.AddVideoHashToBlacklist(ctx, hashes...); err != nil {
+			g.log.Warnf("video: failed to add hashes to blacklist: %v", err)
 		}
 	}
 
@@ -216,7 +232,7 @@ func (g *Generator) GenerateOneMeme(ctx context.Context) (*model.Meme, error) {
 	maxRetries := 3
 	var lastErr error
 	for retry := 0; retry < maxRetries; retry++ {
-		if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &memesIdx); err != nil {
+		if err := g.writeMemesIndex(ctx, &memesIdx); err != nil {
 			lastErr = err
 			g.log.Warnf("GenerateOneMeme: attempt %d/%d to update memes.json failed: %v, retrying...", retry+1, maxRetries, err)
 			time.Sleep(time.Duration(retry+1) * 500 * time.Millisecond)
@@ -235,6 +251,17 @@ func (g *Generator) GenerateOneMeme(ctx context.Context) (*model.Meme, error) {
 func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex) (*model.Meme, error) {
 	g.log.Infof("video: generateOne started")
 
+	// Load sources index ONCE before the retry loop to avoid N×ReadJSON(sources.json).
+	// It is loaded before the song is picked so an empty index bails out
+	// before any audio is fetched.
+	sourcesIdx, err := g.sourcesScr.LoadSourcesIndex(ctx)
+	if err != nil {
+		return nil, fmt.Errorf("load sources index: %w", err)
+	}
+	if len(sourcesIdx.Items) == 0 {
+		return nil, errNoSources
+	}
+
 	song, err := g.audioIdx.GetRandomSong(ctx)
 	if err != nil {
 		return nil, fmt.Errorf("get song: %w", err)
@@ -246,15 +273,32 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 	var sourcePath, audioPath, videoPath string
 	var videoCreated bool
 
-	// Load sources index ONCE before the retry loop to avoid N×ReadJSON(sources.json).
-	sourcesIdx, err := g.sourcesScr.LoadSourcesIndex(ctx)
-	if err != nil {
-		return nil, fmt.Errorf("load sources index: %w", err)
-	}
 	triedSourceIDs := make(map[string]bool)
 
+	// The song is fixed for all attempts, so its audio is downloaded once and
+	// removed once here rather than re-fetched and deleted on every retry.
+	// The download runs in the background while sources are picked, checked
+	// and downloaded — the two transfers are independent.
+	audioDone := make(chan struct{})
+	var audioErr error
+	go func() {
+		defer close(audioDone)
+		g.log.Debugf("video: downloading audio for song %s...", song.ID)
+		audioPath, audioErr = g.audioIdx.DownloadSongToTemp(ctx, song)
+	}()
+	// All temp files of this generation are removed in one background pass so
+	// the return — and an early failure in particular, which would otherwise
+	// block on the in-flight audio download — is not held up by cleanup.
+	defer func() {
+		paths := []string{sourcePath, videoPath}
+		go func() {
+			<-audioDone
+			removeFiles(append(paths, audioPath)...)
+		}()
+	}()
+
 	for attempt := 0; attempt < 10; attempt++ {
-		g.log.Infof("video: attempt %d/10 to create meme", attempt+1)
+		g.log.Debugf("video: attempt %d/10 to create meme", attempt+1)
 
 		// PickRandomUnused works on the in-memory index — no extra S3 read per attempt.
 		src, err := g.sourcesScr.PickRandomUnused(ctx, &sourcesIdx, triedSourceIDs)
@@ -262,7 +306,7 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 			return nil, fmt.Errorf("get source: %w", err)
 		}
 		triedSourceIDs[src.ID] = true
-		g.log.Infof("video: got random source %s (key=%s)", src.ID, src.MediaKey)
+		g.log.Debugf("video: got random source %s (key=%s)", src.ID, src.MediaKey)
 
 		// Check if source is disliked (avoid recently disliked sources)
 		isDisliked, err := g.IsSourceDisliked(ctx, src.ID)
@@ -274,65 +318,32 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 			continue
 		}
 
-		// Check if file exists in S3 — uses HeadObject, no data transfer.
-		g.log.Infof("video: checking if source exists in S3...")
-		exists := false
-		{
-			checkCtx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
-			exists = g.sourcesScr.SourceExistsInS3(checkCtx, src)
-			cancel()
-		}
-
-		if !exists {
-			g.log.Warnf("source %s file not found in S3 (%s), removing from index", src.ID, src.MediaKey)
-			if err := g.sourcesScr.RemoveSourceFromIndex(ctx, src.ID); err != nil {
-				g.log.Warnf("failed to remove source from index (may already be removed): %v", err)
-			}
-			continue
-		}
-
-		g.log.Infof("video: ✓ source %s exists in S3, using it", src.ID)
 		source = src
 
-		// Download audio
-		g.log.Infof("video: downloading audio for song %s...", song.ID)
-		audioPath, err = g.audioIdx.DownloadSongToTemp(ctx, song)
-		if err != nil {
-			return nil, fmt.Errorf("download song: %w", err)
-		}
-		g.log.Infof("video: ✓ downloaded audio to %s", audioPath)
-
-		// Download source
-		g.log.Infof("video: downloading source %s from S3...", source.ID)
+		// Download source directly instead of a HeadObject probe first: a
+		// missing object fails the GET just as well, and the failure path
+		// below already drops the source from the index.
+		g.log.Debugf("video: downloading source %s from S3...", source.ID)
 		sourcePath, err = g.sourcesScr.DownloadSourceToTemp(ctx, source)
 		if err != nil {
 			g.log.Warnf("video: failed to download source %s: %v, removing from index", source.ID, err)
 			_ = g.sourcesScr.RemoveSourceFromIndex(ctx, source.ID)
 			_ = g.s3.Delete(ctx, source.MediaKey)
-			os.Remove(audioPath)
 			continue
 		}
-		g.log.Infof("video: ✓ downloaded source to %s", sourcePath)
+		// DownloadSourceToTemp already validated size and image header.
+		g.log.Debugf("video: ✓ downloaded source to %s", sourcePath)
 
-		// Validate source file exists and has reasonable size
-		g.log.Infof("video: validating source file %s...", sourcePath)
-		srcInfo, err := os.Stat(sourcePath)
-		if err != nil {
-			g.log.Warnf("video: source file stat failed: %v", err)
-			os.Remove(sourcePath)
-			os.Remove(audioPath)
-			continue
-		}
-		if srcInfo.Size() < 1024 {
-			g.log.Warnf("source file too small: %d bytes, skipping", srcInfo.Size())
+		// Wait for the background audio download
+		<-audioDone
+		if audioErr != nil {
 			os.Remove(sourcePath)
-			os.Remove(audioPath)
-			continue
+			return nil, fmt.Errorf("download song: %w", audioErr)
 		}
-		g.log.Infof("video: ✓ source file is valid (%d bytes)", srcInfo.Size())
+		g.log.Debugf("video: ✓ downloaded audio to %s", audioPath)
 
-		videoPath = filepath.Join(os.TempDir(), fmt.Sprintf("meme-%d.mp4", time.Now().UnixNano()))
-		g.log.Infof("video: creating video at %s from image+audio...", videoPath)
+		videoPath = filepath.Join(os.TempDir(), fmt.Sprintf("meme-%s.mp4", tempSuffix()))
+		g.log.Debugf("video: creating video at %s from image+audio...", videoPath)
 
 		// Badge shows artist name and track title so viewers can find the music
 		artistName := strings.TrimSuffix(song.Author, " - Topic")
@@ -351,13 +362,11 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 				_ = g.s3.Delete(ctx, source.MediaKey)
 			}
 
-			os.Remove(sourcePath)
-			os.Remove(audioPath)
-			os.Remove(videoPath)
+			removeFiles(sourcePath, videoPath)
 			continue
 		}
 
-		g.log.Infof("video: ✓ ffmpeg completed successfully, video created at %s", videoPath)
+		g.log.Debugf("video: ✓ ffmpeg completed successfully, video created at %s", videoPath)
 		videoCreated = true
 		break
 	}
@@ -366,28 +375,25 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 		return nil, fmt.Errorf("failed to create video after 10 attempts")
 	}
 
-	defer os.Remove(audioPath)
-	defer os.Remove(sourcePath)
-	defer os.Remove(videoPath)
-
-	g.log.Infof("video: reading video file from %s...", videoPath)
+	g.log.Debugf("video: reading video file from %s...", videoPath)
 	videoData, err := os.ReadFile(videoPath)
 	if err != nil {
 		return nil, err
 	}
-	g.log.Infof("video: ✓ read video file %s (%d bytes)", videoPath, len(videoData))
+	g.log.Debugf("video: ✓ read video file %s (%d bytes)", videoPath, len(videoData))
 
-	g.log.Infof("video: computing SHA256 hash...")
+	g.log.Debugf("video: computing SHA256 hash...")
 	h := sha256.Sum256(videoData)
 	hash := hex.EncodeToString(h[:])
-	g.log.Infof("video: ✓ computed SHA256: %s", hash)
+	g.log.Debugf("video: ✓ computed SHA256: %s", hash)
 
 	if g.memeExists(*memesIdx, hash) {
 		g.log.Warnf("video: duplicate meme detected (SHA256: %s), skipping", hash)
 		return nil, fmt.Errorf("duplicate sha256")
 	}
 
-	memeID := fmt.Sprintf("meme-%d", time.Now().UnixNano())
+	createdAt := time.Now()
+	memeID := fmt.Sprintf("meme-%d", createdAt.UnixNano())
 	videoKey := g.cfg.MemesPrefix + memeID + ".mp4"
 	thumbKey := g.cfg.MemesPrefix + memeID + "_thumb.jpg"
 
@@ -402,14 +408,22 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 
 	g.log.Infof("video: [S3 UPLOAD SUCCESS] ✓ successfully uploaded video to S3: %s (%d bytes)", videoKey, len(videoData))
 
+	// The source file is read once here and reused for the thumbnail and the
+	// image hash below, instead of being read from disk for each.
+	sourceData, sourceErr := os.ReadFile(sourcePath)
+
 	// Use source as thumbnail; GIFs need first-frame extraction to produce a valid JPEG.
-	g.log.Infof("video: using source as thumbnail...")
+	g.log.Debugf("video: using source as thumbnail...")
 	var thumbData []byte
 	var thumbErr error
 	if strings.HasSuffix(strings.ToLower(sourcePath), ".gif") {
-		thumbData, thumbErr = extractGIFFrame(ctx, sourcePath)
+		thumbData, thumbErr = gifFirstFrameJPEG(sourceData)
+		if thumbErr != nil {
+			g.log.Debugf("video: in-process GIF frame decode failed (%v), using ffmpeg", thumbErr)
+			thumbData, thumbErr = extractGIFFrame(ctx, sourcePath)
+		}
 	} else {
-		thumbData, thumbErr = os.ReadFile(sourcePath)
+		thumbData, thumbErr = sourceData, sourceErr
 	}
 	if thumbErr != nil {
 		g.log.Warnf("video: failed to get thumbnail: %v", thumbErr)
@@ -423,19 +437,19 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 	}
 
 	// Mark source as used (non-critical)
-	g.log.Infof("video: marking source %s as used...", source.ID)
+	g.log.Debugf("video: marking source %s as used...", source.ID)
 	if err := g.sourcesScr.MarkSourceUsed(ctx, source.ID); err != nil {
 		g.log.Warnf("video: failed to mark source as used: %v", err)
 	} else {
-		g.log.Infof("video: ✓ source marked as used")
+		g.log.Debugf("video: ✓ source marked as used")
 	}
 
 	// Delete source file from S3 (non-critical)
-	g.log.Infof("video: deleting source file from S3: %s", source.MediaKey)
+	g.log.Debugf("video: deleting source file from S3: %s", source.MediaKey)
 	if err := g.s3.Delete(ctx, source.MediaKey); err != nil {
 		g.log.Warnf("video: failed to delete source from S3: %v", err)
 	} else {
-		g.log.Infof("video: ✓ source deleted from S3")
+		g.log.Debugf("video: ✓ source deleted from S3")
 	}
 
 	// Generate teaser caption for the meme; falls back to "Author — Title" if AI is unavailable.
@@ -447,10 +461,11 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 		title = fmt.Sprintf("%s — %s", author, song.Title)
 	}
 
-	// Compute image hash for thumbnail (visual uniqueness of memes)
-	var imageHash uint64
-	if thumbData, err := os.ReadFile(sourcePath); err == nil {
-		if hash, err := g.sourcesScr.ComputeImageHash(thumbData); err != nil {
+	// Compute image hash for thumbnail (visual uniqueness of memes). The
+	// scraper already hashed these same bytes when it stored the source.
+	imageHash := source.ImageHash
+	if imageHash == 0 && sourceErr == nil {
+		if hash, err := g.sourcesScr.ComputeImageHash(sourceData); err != nil {
 			g.log.Warnf("video: failed to compute image hash for thumbnail: %v", err)
 		} else {
 			imageHash = hash
@@ -465,7 +480,7 @@ func (g *Generator) generateOne(ctx context.Context, memesIdx *model.MemesIndex)
 		ThumbKey:  thumbKey,
 		SongID:    song.ID,
 		SourceID:  source.ID,
-		CreatedAt: time.Now(),
+		CreatedAt: createdAt,
 		SHA256:    hash,
 		ImageHash: imageHash,
 	}
@@ -485,8 +500,7 @@ func (g *Generator) memeExistsByImageHash(idx model.MemesIndex, imageHash uint64
 }
 
 func (g *Generator) GetRandomMeme(ctx context.Context) (*model.Meme, error) {
-	var idx model.MemesIndex
-	found, err := g.s3.ReadJSON(ctx, g.cfg.MemesJSONKey, &idx)
+	idx, found, err := g.loadMemesIndexCached(ctx)
 	if err != nil {
 		g.log.Errorf("failed to read memes.json from S3 (key=%s): %v", g.cfg.MemesJSONKey, err)
 		return nil, fmt.Errorf("read memes.json: %w", err)
@@ -505,8 +519,7 @@ func (g *Generator) GetRandomMeme(ctx context.Context) (*model.Meme, error) {
 }
 
 func (g *Generator) GetRandomMemes(ctx context.Context, count int) ([]*model.Meme, error) {
-	var idx model.MemesIndex
-	found, err := g.s3.ReadJSON(ctx, g.cfg.MemesJSONKey, &idx)
+	idx, found, err := g.loadMemesIndexCached(ctx)
 	if err != nil {
 		g.log.Errorf("failed to read memes.json from S3 (key=%s): %v", g.cfg.MemesJSONKey, err)
 		return nil, fmt.Errorf("read memes.json: %w", err)
@@ -547,23 +560,31 @@ func (g *Generator) GetRandomMemes(ctx context.Context, count int) ([]*model.Mem
 }
 
 func (g *Generator) DownloadMemeToTemp(ctx context.Context, meme *model.Meme) (string, error) {
-	// Stream directly from S3 to avoid loading full video (5-20 MB) into heap.
-	reader, err := g.s3.GetReader(ctx, meme.VideoKey)
-	if err != nil {
+	tmpFile := filepath.Join(os.TempDir(), fmt.Sprintf("meme-%s.mp4", meme.ID))
+	if err := g.downloadToFile(ctx, meme.VideoKey, tmpFile); err != nil {
 		return "", err
 	}
+	return tmpFile, nil
+}
+
+// downloadToFile streams an S3 object straight into path, avoiding loading
+// the full video (5-20 MB) into heap. Removes the partial file on failure.
+func (g *Generator) downloadToFile(ctx context.Context, key, path string) error {
+	reader, err := g.s3.GetReader(ctx, key)
+	if err != nil {
+		return err
+	}
 	defer reader.Reader.Close()
-	tmpFile := filepath.Join(os.TempDir(), fmt.Sprintf("meme-%s.mp4", meme.ID))
-	f, err := os.Create(tmpFile)
+	f, err := os.Create(path)
 	if err != nil {
-		return "", fmt.Errorf("create temp file: %w", err)
+		return fmt.Errorf("create temp file: %w", err)
 	}
 	defer f.Close()
-	if _, err := io.Copy(f, reader.Reader); err != nil {
-		os.Remove(tmpFile)
-		return "", fmt.Errorf("stream meme from S3: %w", err)
+	if _, err := reader.WriteTo(f); err != nil {
+		os.Remove(path)
+		return fmt.Errorf("stream %s from S3: %w", key, err)
 	}
-	return tmpFile, nil
+	return nil
 }
 
 // ReplaceAudioInMeme replaces the audio track in an existing meme with a new random audio
@@ -588,22 +609,16 @@ func (g *Generator) ReplaceAudioInMeme(ctx context.Context, memeID string) (*mod
 	}
 
 	// Find the meme
-	memeIndex := -1
-	var oldMeme *model.Meme
-	for i, m := range idx.Items {
-		if m.ID == memeID {
-			memeIndex = i
-			oldMeme = &idx.Items[i]
-			g.log.Infof("ReplaceAudioInMeme: found meme at index %d", i)
-			break
-		}
-	}
-
+	memeIndex := memePosition(idx.Items, memeID)
 	if memeIndex == -1 {
 		g.log.Errorf("ReplaceAudioInMeme: meme not found in JSON: %s", memeID)
 		g.memesJSONMux.Unlock()
 		return nil, fmt.Errorf("meme not found")
 	}
+	// Copy: idx is re-read into below, which would overwrite the pointee.
+	oldMemeCopy := idx.Items[memeIndex]
+	oldMeme := &oldMemeCopy
+	g.log.Infof("ReplaceAudioInMeme: found meme at index %d", memeIndex)
 
 	g.log.Infof("ReplaceAudioInMeme: found meme - ID=%s, VideoKey=%s, old SongID=%s",
 		oldMeme.ID, oldMeme.VideoKey, oldMeme.SongID)
@@ -620,39 +635,45 @@ func (g *Generator) ReplaceAudioInMeme(ctx context.Context, memeID string) (*mod
 	}
 	g.log.Infof("ReplaceAudioInMeme: got new song %s (%s - %s)", newSong.ID, newSong.Author, newSong.Title)
 
-	// Download the existing video from S3
+	// Download the new audio in the background while the old video streams
+	// in — the two S3 transfers are independent (same pattern as generateOne).
+	g.log.Infof("ReplaceAudioInMeme: downloading audio for song %s...", newSong.ID)
+	var audioPath string
+	var audioErr error
+	audioDone := make(chan struct{})
+	go func() {
+		defer close(audioDone)
+		audioPath, audioErr = g.audioIdx.DownloadSongToTemp(ctx, newSong)
+	}()
+	defer func() {
+		<-audioDone
+		removeFiles(audioPath)
+	}()
+
+	// Stream the existing video from S3 straight into a temp file
 	g.log.Infof("ReplaceAudioInMeme: downloading existing video from S3 (key=%s)...", oldMeme.VideoKey)
-	videoData, _, err := g.s3.GetBytes(ctx, oldMeme.VideoKey)
-	if err != nil {
+	// One suffix names both temp files of this call, so they group together.
+	stamp := tempSuffix()
+	oldVideoPath := filepath.Join(os.TempDir(), fmt.Sprintf("meme-old-%s.mp4", stamp))
+	if err := g.downloadToFile(ctx, oldMeme.VideoKey, oldVideoPath); err != nil {
 		g.log.Errorf("ReplaceAudioInMeme: failed to download video from S3: %v", err)
 		return nil, fmt.Errorf("download video: %w", err)
 	}
-	g.log.Infof("ReplaceAudioInMeme: ✓ downloaded video (%d bytes)", len(videoData))
-
-	// Write video to temp file
-	oldVideoPath := filepath.Join(os.TempDir(), fmt.Sprintf("meme-old-%d.mp4", time.Now().UnixNano()))
-	if err := os.WriteFile(oldVideoPath, videoData, 0o644); err != nil {
-		g.log.Errorf("ReplaceAudioInMeme: failed to write old video to temp: %v", err)
-		return nil, fmt.Errorf("write video: %w", err)
-	}
 	defer os.Remove(oldVideoPath)
-	g.log.Infof("ReplaceAudioInMeme: ✓ wrote old video to %s", oldVideoPath)
+	g.log.Infof("ReplaceAudioInMeme: ✓ downloaded old video to %s", oldVideoPath)
 
-	// Download new audio
-	g.log.Infof("ReplaceAudioInMeme: downloading audio for song %s...", newSong.ID)
-	audioPath, err := g.audioIdx.DownloadSongToTemp(ctx, newSong)
-	if err != nil {
-		g.log.Errorf("ReplaceAudioInMeme: failed to download song: %v", err)
-		return nil, fmt.Errorf("download song: %w", err)
+	<-audioDone
+	if audioErr != nil {
+		g.log.Errorf("ReplaceAudioInMeme: failed to download song: %v", audioErr)
+		return nil, fmt.Errorf("download song: %w", audioErr)
 	}
-	defer os.Remove(audioPath)
 	g.log.Infof("ReplaceAudioInMeme: ✓ downloaded audio to %s", audioPath)
 
 	// Create new video by replacing audio in the old video
-	newVideoPath := filepath.Join(os.TempDir(), fmt.Sprintf("meme-replace-%d.mp4", time.Now().UnixNano()))
+	newVideoPath := filepath.Join(os.TempDir(), fmt.Sprintf("meme-replace-%s.mp4", stamp))
 	g.log.Infof("ReplaceAudioInMeme: replacing audio in video using ffmpeg...")
 
-	if err := replaceAudioInVideo(ctx, oldVideoPath, audioPath, newVideoPath, g.log); err != nil {
+	if err := replaceAudioInVideo(ctx, oldVideoPath, audioPath, newVideoPath, newSong.DurationS, g.log); err != nil {
 		g.log.Errorf("ReplaceAudioInMeme: failed to replace audio in video: %v", err)
 		os.Remove(newVideoPath)
 		return nil, fmt.Errorf("replace audio: %w", err)
@@ -688,14 +709,7 @@ func (g *Generator) ReplaceAudioInMeme(ctx context.Context, memeID string) (*mod
 	}
 
 	// Find the meme again
-	memeIndex = -1
-	for i, m := range idx.Items {
-		if m.ID == memeID {
-			memeIndex = i
-			break
-		}
-	}
-
+	memeIndex = memePosition(idx.Items, memeID)
 	if memeIndex == -1 {
 		g.log.Warnf("ReplaceAudioInMeme: meme not found in updated JSON: %s (might have been deleted)", memeID)
 		return nil, fmt.Errorf("meme was deleted")
@@ -712,8 +726,9 @@ func (g *Generator) ReplaceAudioInMeme(ctx context.Context, memeID string) (*mod
 
 	idx.Items[memeIndex].SongID = newSong.ID
 	idx.Items[memeIndex].Title = newTitle
-	idx.Items[memeIndex].CreatedAt = time.Now()
-	idx.UpdatedAt = time.Now()
+	now := time.Now()
+	idx.Items[memeIndex].CreatedAt = now
+	idx.UpdatedAt = now
 
 	g.log.Infof("ReplaceAudioInMeme: updating meme in index - old title=%s, new title=%s",
 		oldMeme.Title, newTitle)
@@ -723,7 +738,7 @@ func (g *Generator) ReplaceAudioInMeme(ctx context.Context, memeID string) (*mod
 	var lastErr error
 	for retry := 0; retry < maxRetries; retry++ {
 		g.log.Infof("ReplaceAudioInMeme: attempt %d/%d to update memes.json", retry+1, maxRetries)
-		if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &idx); err != nil {
+		if err := g.writeMemesIndex(ctx, &idx); err != nil {
 			lastErr = err
 			g.log.Errorf("ReplaceAudioInMeme: attempt %d/%d FAILED to update memes.json - err=%v", retry+1, maxRetries, err)
 			time.Sleep(time.Duration(retry+1) * 500 * time.Millisecond)
@@ -762,22 +777,14 @@ func (g *Generator) DeleteMeme(ctx context.Context, memeID string) error {
 	g.log.Infof("deleteMemeb: loaded memes.json with %d items", len(idx.Items))
 
 	// Find and remove the meme
-	memeIndex := -1
-	var memeToDelete *model.Meme
-	for i, m := range idx.Items {
-		g.log.Infof("deleteMemeb: comparing id=%s with target=%s", m.ID, memeID)
-		if m.ID == memeID {
-			memeIndex = i
-			memeToDelete = &m
-			g.log.Infof("deleteMemeb: found meme at index %d", i)
-			break
-		}
-	}
-
+	memeIndex := memePosition(idx.Items, memeID)
 	if memeIndex == -1 {
 		g.log.Warnf("deleteMemeb: meme not found in JSON: %s (already deleted or doesn't exist)", memeID)
 		return nil // Not an error - meme might have been already deleted
 	}
+	m := idx.Items[memeIndex]
+	memeToDelete := &m
+	g.log.Infof("deleteMemeb: found meme at index %d", memeIndex)
 
 	g.log.Infof("deleteMemeb: deleting meme - ID=%s, VideoKey=%s, ThumbKey=%s",
 		memeToDelete.ID, memeToDelete.VideoKey, memeToDelete.ThumbKey)
@@ -833,7 +840,7 @@ func (g *Generator) DeleteMeme(ctx context.Context, memeID string) error {
 	var lastErr error
 	for retry := 0; retry < maxRetries; retry++ {
 		g.log.Infof("deleteMemeb: attempt %d/%d to update memes.json", retry+1, maxRetries)
-		if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &idx); err != nil {
+		if err := g.writeMemesIndex(ctx, &idx); err != nil {
 			lastErr = err
 			g.log.Errorf("deleteMemeb: attempt %d/%d FAILED to update memes.json - err=%v", retry+1, maxRetries, err)
 			time.Sleep(time.Duration(retry+1) * 500 * time.Millisecond)
@@ -904,28 +911,26 @@ func (g *Generator) DeleteMemes(ctx context.Context, memeIDs []string) error {
 	idx.Items = remaining
 	idx.UpdatedAt = time.Now()
 
-	if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &idx); err != nil {
+	if err := g.writeMemesIndex(ctx, &idx); err != nil {
 		return fmt.Errorf("write memes.json: %w", err)
 	}
 
-	// Delete S3 files and run side-effects outside the lock (already released by defer)
+	// Delete S3 files and run side-effects outside the lock (already released by defer).
+	// Each index is updated once for the whole batch instead of once per meme.
 	go func() {
 		bgCtx := context.Background()
+		keys := make([]string, 0, 2*len(toDelete))
+		hashes := make([]uint64, 0, len(toDelete))
+		sourceIDs := make([]string, 0, len(toDelete))
 		for _, m := range toDelete {
-			if m.VideoKey != "" {
-				_ = g.s3.Delete(bgCtx, m.VideoKey)
-			}
-			if m.ThumbKey != "" {
-				_ = g.s3.Delete(bgCtx, m.ThumbKey)
-			}
-			if m.ImageHash != 0 {
-				_ = g.AddVideoHashToBlacklist(bgCtx, m.ImageHash)
-			}
-			if m.SourceID != "" {
-				_ = g.AddSourceToDislikedBlacklist(bgCtx, m.SourceID)
-				_ = g.sourcesScr.RemoveSourceFromIndex(bgCtx, m.SourceID)
-			}
+			keys = append(keys, m.VideoKey, m.ThumbKey)
+			hashes = append(hashes, m.ImageHash)
+			sourceIDs = append(sourceIDs, m.SourceID)
 		}
+		_ = g.s3.DeleteMany(bgCtx, keys)
+		_ = g.AddVideoHashToBlacklist(bgCtx, hashes...)
+		_ = g.AddSourceToDislikedBlacklist(bgCtx, sourceIDs...)
+		_, _ = g.sourcesScr.RemoveSourcesFromIndex(bgCtx, lo.Compact(sourceIDs))
 		g.log.Infof("DeleteMemes: cleaned up %d memes from S3", len(toDelete))
 	}()
 
@@ -938,6 +943,11 @@ func (g *Generator) DeleteMemes(ctx context.Context, memeIDs []string) error {
 func (g *Generator) SyncWithS3(ctx context.Context) error {
 	g.log.Infof("memes: starting sync with S3 folder")
 
+	// Held across the read-filter-write so a concurrent writer's update to
+	// memes.json isn't overwritten with the filtered older copy.
+	g.memesJSONMux.Lock()
+	defer g.memesJSONMux.Unlock()
+
 	// Read current index
 	var memesIdx model.MemesIndex
 	found, err := g.s3.ReadJSON(ctx, g.cfg.MemesJSONKey, &memesIdx)
@@ -954,20 +964,8 @@ func (g *Generator) SyncWithS3(ctx context.Context) error {
 		return fmt.Errorf("list S3 memes: %w", err)
 	}
 
-	// Create maps for tracking
-	existingVideoKeys := make(map[string]bool)
-	existingThumbKeys := make(map[string]bool)
-	for _, item := range memesIdx.Items {
-		if item.VideoKey != "" {
-			existingVideoKeys[item.VideoKey] = true
-		}
-		if item.ThumbKey != "" {
-			existingThumbKeys[item.ThumbKey] = true
-		}
-	}
-
 	// Create map of actual keys in S3
-	actualKeys := make(map[string]bool)
+	actualKeys := make(map[string]bool, len(objects))
 	for _, obj := range objects {
 		actualKeys[obj.Key] = true
 	}
@@ -978,6 +976,9 @@ func (g *Generator) SyncWithS3(ctx context.Context) error {
 	filtered := make([]model.Meme, 0)
 	seenSHA256 := make(map[string]bool)
 	duplicateCount := 0
+	// tracked collects the video and thumbnail keys of kept memes while they
+	// are filtered, so the orphan pass below does one lookup per S3 key.
+	tracked := make(map[string]bool, 2*len(memesIdx.Items))
 
 	for _, item := range memesIdx.Items {
 		videoExists := actualKeys[item.VideoKey]
@@ -994,9 +995,8 @@ func (g *Generator) SyncWithS3(ctx context.Context) error {
 		if item.SHA256 != "" && seenSHA256[item.SHA256] {
 			g.log.Warnf("memes: removing duplicate meme detected (SHA256: %s, id: %s, existing id will be kept)",
 				item.SHA256, item.ID)
-			// Delete the duplicate video and thumbnail from S3
-			_ = g.s3.Delete(ctx, item.VideoKey)
-			_ = g.s3.Delete(ctx, item.ThumbKey)
+			// The duplicate's video and thumbnail are not tracked, so the
+			// orphan pass below deletes them with the rest.
 			duplicateCount++
 			continue
 		}
@@ -1005,6 +1005,8 @@ func (g *Generator) SyncWithS3(ctx context.Context) error {
 			seenSHA256[item.SHA256] = true
 		}
 
+		tracked[item.VideoKey] = true
+		tracked[item.ThumbKey] = true
 		filtered = append(filtered, item)
 	}
 
@@ -1016,40 +1018,32 @@ func (g *Generator) SyncWithS3(ctx context.Context) error {
 			removedCount, removedCount-duplicateCount, duplicateCount)
 	}
 
-	// Update lists of existing keys based on filtered memes
-	filteredVideoKeys := make(map[string]bool)
-	filteredThumbKeys := make(map[string]bool)
-	for _, item := range filtered {
-		if item.VideoKey != "" {
-			filteredVideoKeys[item.VideoKey] = true
-		}
-		if item.ThumbKey != "" {
-			filteredThumbKeys[item.ThumbKey] = true
-		}
-	}
-
-	// Delete orphaned files in S3 that are not tracked in filtered JSON
-	orphanedFiles := 0
-	deletedFiles := 0
+	// Delete orphaned files in S3 that are not tracked in filtered JSON,
+	// collected first and removed in one concurrent batch.
+	var orphaned []string
 	for key := range actualKeys {
-		if !filteredVideoKeys[key] && !filteredThumbKeys[key] {
-			orphanedFiles++
+		if !tracked[key] {
 			g.log.Infof("memes: deleting orphaned file from S3: %s", key)
-			if err := g.s3.Delete(ctx, key); err != nil {
-				g.log.Errorf("memes: failed to delete orphaned file %s: %v", key, err)
-			} else {
-				deletedFiles++
-			}
+			orphaned = append(orphaned, key)
 		}
 	}
+	orphanedFiles := len(orphaned)
+	deletedFiles := 0
 	if orphanedFiles > 0 {
+		err := g.s3.DeleteMany(ctx, orphaned)
+		if err != nil {
+			g.log.Errorf("memes: failed to delete orphaned files: %v", err)
+		}
+		deletedFiles = orphanedFiles - s3.DeleteFailures(err)
 		g.log.Infof("memes: deleted %d/%d orphaned files from S3", deletedFiles, orphanedFiles)
 	}
 
-	// Update JSON
-	memesIdx.UpdatedAt = time.Now()
-	if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, &memesIdx); err != nil {
-		return fmt.Errorf("write memes.json: %w", err)
+	// Update JSON only when entries were dropped (or the index is new)
+	if removedCount > 0 || !found {
+		memesIdx.UpdatedAt = time.Now()
+		if err := g.writeMemesIndex(ctx, &memesIdx); err != nil {
+			return fmt.Errorf("write memes.json: %w", err)
+		}
 	}
 
 	g.log.Infof("memes: sync complete - JSON entries: %d, S3 files: %d, removed: %d (duplicates: %d), orphaned files deleted: %d",
@@ -1076,7 +1070,7 @@ func createVideoFromImageAndAudio(ctx context.Context, imagePath, audioPath, out
 	ctxProbe, cancelProbe := context.WithTimeout(ctx, 30*time.Second)
 	defer cancelProbe()
 
-	probeCmd := exec.CommandContext(ctxProbe, "ffprobe", "-v", "error", "-show_entries", "format=duration",
+	probeCmd := exec.CommandContext(ctxProbe, ffprobeBin(), "-v", "error", "-show_entries", "format=duration",
 		"-of", "default=noprint_wrappers=1:nokey=1", audioPath)
 	durationBytes, err := probeCmd.Output()
 	if err != nil {
@@ -1131,20 +1125,12 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 	log.Infof("[FFMPEG] audio: %s", audioPath)
 	log.Infof("[FFMPEG] output: %s", outputPath)
 
-	// Validate input files exist before running ffmpeg
-	if _, err := os.Stat(imagePath); err != nil {
-		return fmt.Errorf("image file not found: %s (%w)", imagePath, err)
-	}
-	if _, err := os.Stat(audioPath); err != nil {
-		return fmt.Errorf("audio file not found: %s (%w)", audioPath, err)
-	}
-
 	plainFilter := "[0:v]scale=1080:1920:force_original_aspect_ratio=decrease,pad=1080:1920:(ow-iw)/2:(oh-ih)/2:black[v];[v]setsar=1[out]"
 
 	// Build badge filter: semi-transparent full-width bar with artist + track name.
 	badgeFilter := plainFilter
 	var artistFile, trackFile string
-	stamp := time.Now().UnixNano()
+	stamp := tempSuffix()
 
 	hasBadge := artistName != "" || trackName != ""
 	if hasBadge {
@@ -1164,7 +1150,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 			parts = append(parts, "drawbox=x=0:y=ih-300:w=iw:h=3:color=0xffffff@0.40:t=fill")
 
 			artistFS := fitFontSize(artistName, 52, videoWidth-badgePad, 18)
-			artistFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-artist-%d.txt", stamp))
+			artistFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-artist-%s.txt", stamp))
 			if err := os.WriteFile(artistFile, []byte(artistName), 0o644); err != nil {
 				artistFile = ""
 			} else {
@@ -1177,7 +1163,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 			}
 
 			trackFS := fitFontSize(trackName, 36, videoWidth-badgePad, 18)
-			trackFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-track-%d.txt", stamp))
+			trackFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-track-%s.txt", stamp))
 			if err := os.WriteFile(trackFile, []byte(trackName), 0o644); err != nil {
 				trackFile = ""
 			} else {
@@ -1195,7 +1181,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 				text = trackName
 			}
 			singleFS := fitFontSize(text, 50, videoWidth-badgePad, 18)
-			artistFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-artist-%d.txt", stamp))
+			artistFile = filepath.Join(os.TempDir(), fmt.Sprintf("wm-artist-%s.txt", stamp))
 			if err := os.WriteFile(artistFile, []byte(text), 0o644); err != nil {
 				artistFile = ""
 			} else {
@@ -1217,12 +1203,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 	ffmpegSem <- struct{}{}
 	defer func() {
 		<-ffmpegSem
-		if artistFile != "" {
-			os.Remove(artistFile)
-		}
-		if trackFile != "" {
-			os.Remove(trackFile)
-		}
+		removeFiles(artistFile, trackFile)
 	}()
 
 	fadeOutStart := duration - 0.5
@@ -1270,6 +1251,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 			"-pix_fmt", "yuv420p",
 			"-r", "30",
 			"-t", fmt.Sprintf("%.2f", duration),
+			"-movflags", "+faststart",
 			"-y",
 			"-strict", "-2",
 			outputPath,
@@ -1278,7 +1260,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 
 	runFFmpeg := func(filter string) error {
 		var stderr bytes.Buffer
-		cmd := exec.Command("ffmpeg", buildArgs(filter)...)
+		cmd := exec.Command(ffmpegBin(), buildArgs(filter)...)
 		cmd.Stderr = &stderr
 		if err := cmd.Run(); err != nil {
 			errMsg := stderr.String()
@@ -1288,10 +1270,7 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 			log.Errorf("[FFMPEG] ✗ ffmpeg failed (exit code: %v): %s", err, errMsg)
 			return fmt.Errorf("ffmpeg error: %s", errMsg)
 		}
-		if _, err := os.Stat(outputPath); err != nil {
-			return fmt.Errorf("ffmpeg did not create output file: %s (%w)", outputPath, err)
-		}
-		return nil
+		return checkOutputFile(outputPath)
 	}
 
 	log.Infof("[FFMPEG] executing ffmpeg with filter_complex (duration=%.2fs, offset=%.2fs)", duration, startOffset)
@@ -1312,8 +1291,10 @@ func createVideoWithDuration(ctx context.Context, imagePath, audioPath, outputPa
 	return nil
 }
 
-// replaceAudioInVideo replaces the audio track in an existing video with a new audio file
-func replaceAudioInVideo(ctx context.Context, videoPath, audioPath, outputPath string, log *logging.Logger) error {
+// replaceAudioInVideo replaces the audio track in an existing video with a new audio file.
+// audioDuration is the known track length (0 if unknown); when set, the audio
+// ffprobe pass is skipped and only the video is probed.
+func replaceAudioInVideo(ctx context.Context, videoPath, audioPath, outputPath string, audioDuration float64, log *logging.Logger) error {
 	log.Infof("[FFMPEG] replacing audio in video")
 	log.Infof("[FFMPEG] video: %s", videoPath)
 	log.Infof("[FFMPEG] audio: %s", audioPath)
@@ -1322,7 +1303,7 @@ func replaceAudioInVideo(ctx context.Context, videoPath, audioPath, outputPath s
 	probeFile := func(path, label string) float64 {
 		ctxP, cancel := context.WithTimeout(ctx, 30*time.Second)
 		defer cancel()
-		out, err := exec.CommandContext(ctxP, "ffprobe", "-v", "error", "-show_entries", "format=duration",
+		out, err := exec.CommandContext(ctxP, ffprobeBin(), "-v", "error", "-show_entries", "format=duration",
 			"-of", "default=noprint_wrappers=1:nokey=1", path).Output()
 		if err != nil {
 			log.Infof("[FFMPEG] ffprobe %s failed: %v", label, err)
@@ -1339,7 +1320,9 @@ func replaceAudioInVideo(ctx context.Context, videoPath, audioPath, outputPath s
 	}
 	log.Infof("[FFMPEG] ✓ video duration: %.2fs", videoDuration)
 
-	audioDuration := probeFile(audioPath, "audio")
+	if audioDuration <= 0 {
+		audioDuration = probeFile(audioPath, "audio")
+	}
 	startOffset := 0.0
 	if audioDuration > 0 {
 		startOffset = randomAudioOffset(audioDuration, videoDuration)
@@ -1353,14 +1336,6 @@ func replaceAudioInVideo(ctx context.Context, videoPath, audioPath, outputPath s
 func replaceAudioWithDuration(ctx context.Context, videoPath, audioPath, outputPath string, duration, startOffset float64, log *logging.Logger) error {
 	log.Infof("[FFMPEG] replacing audio (offset=%.2fs, clip=%.2fs)", startOffset, duration)
 
-	// Validate input files exist
-	if _, err := os.Stat(videoPath); err != nil {
-		return fmt.Errorf("video file not found: %s (%w)", videoPath, err)
-	}
-	if _, err := os.Stat(audioPath); err != nil {
-		return fmt.Errorf("audio file not found: %s (%w)", audioPath, err)
-	}
-
 	// Acquire semaphore – only one ffmpeg process at a time.
 	ffmpegSem <- struct{}{}
 	defer func() { <-ffmpegSem }()
@@ -1391,13 +1366,16 @@ func replaceAudioWithDuration(ctx context.Context, videoPath, audioPath, outputP
 		"-map", "1:a:0",
 		"-af", audioFilter,
 		"-t", fmt.Sprintf("%.2f", duration),
+		// moov atom up front so Telegram/YouTube can start playback before
+		// the whole file has arrived; cheap since the video is stream-copied.
+		"-movflags", "+faststart",
 		"-y",
 		"-strict", "-2",
 		outputPath,
 	)
 
 	var stderr bytes.Buffer
-	cmd := exec.Command("ffmpeg", args...)
+	cmd := exec.Command(ffmpegBin(), args...)
 	cmd.Stderr = &stderr
 
 	log.Infof("[FFMPEG] executing ffmpeg to replace audio (duration=%.2fs, offset=%.2fs)", duration, startOffset)
@@ -1411,21 +1389,38 @@ func replaceAudioWithDuration(ctx context.Context, videoPath, audioPath, outputP
 		return fmt.Errorf("ffmpeg error: %s", errMsg)
 	}
 
-	// Verify output file was created
-	if _, err := os.Stat(outputPath); err != nil {
-		return fmt.Errorf("ffmpeg did not create output file: %s (%w)", outputPath, err)
+	if err := checkOutputFile(outputPath); err != nil {
+		return err
 	}
 
 	log.Infof("[FFMPEG] ✓ audio replaced successfully (offset=%.2fs), output file: %s", startOffset, outputPath)
 	return nil
 }
 
+// gifFirstFrameJPEG decodes the first frame of an in-memory GIF and encodes it
+// as JPEG, so the common case needs no ffmpeg process or temp file.
+func gifFirstFrameJPEG(data []byte) ([]byte, error) {
+	if len(data) == 0 {
+		return nil, fmt.Errorf("empty gif")
+	}
+	frame, err := gif.Decode(bytes.NewReader(data))
+	if err != nil {
+		return nil, err
+	}
+	var buf bytes.Buffer
+	if err := jpeg.Encode(&buf, frame, &jpeg.Options{Quality: 90}); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
 // extractGIFFrame extracts the first frame of a GIF as a JPEG-encoded byte slice.
+// Fallback for GIFs the standard decoder rejects.
 func extractGIFFrame(ctx context.Context, gifPath string) ([]byte, error) {
 	tmpJPG := gifPath + "_frame.jpg"
 	defer os.Remove(tmpJPG)
 
-	cmd := exec.CommandContext(ctx, "ffmpeg",
+	cmd := exec.CommandContext(ctx, ffmpegBin(),
 		"-hide_banner", "-loglevel", "error",
 		"-i", gifPath,
 		"-vframes", "1",
@@ -0,0 +1,137 @@
+package video
+
+import (
+	"context"
+	"fmt"
+	"time"
+
+	"meme-video-gen/internal/model"
+)
+
+const memesCacheTTL = 5 * time.Minute
+
+// loadMemesIndexCached returns memes.json for read-only callers.
+// Uses an in-memory cache with 5-minute TTL; writers refresh it via
+// writeMemesIndex, and a load that raced with a write or invalidation is
+// not cached, so the cache never regresses to an older index. Changes made
+// by other processes can still take up to the TTL to show up.
+// The returned index is a copy and may be modified by the caller.
+func (g *Generator) loadMemesIndexCached(ctx context.Context) (model.MemesIndex, bool, error) {
+	cached, _, err := g.memesSnapshot(ctx)
+	if err != nil || cached == nil {
+		return model.MemesIndex{}, false, err
+	}
+	return copyMemesIndex(cached), true, nil
+}
+
+// memesSnapshot returns the cached index together with its ID map, taken in
+// one critical section so an invalidation in between can't split the pair,
+// loading memes.json when the cache is empty or expired. Both are shared and
+// must not be modified; the index is nil if memes.json doesn't exist.
+func (g *Generator) memesSnapshot(ctx context.Context) (*model.MemesIndex, map[string]int, error) {
+	g.memesCacheMux.RLock()
+	cached, byID, exp, gen := g.memesCache, g.memesByID, g.memesCacheExp, g.memesCacheGen
+	g.memesCacheMux.RUnlock()
+
+	if cached != nil && time.Now().Before(exp) {
+		return cached, byID, nil
+	}
+
+	var idx model.MemesIndex
+	found, err := g.s3.ReadJSON(ctx, g.cfg.MemesJSONKey, &idx)
+	if err != nil || !found {
+		return nil, nil, err
+	}
+
+	// Cache what was read only if nothing was written or invalidated while
+	// the read was in flight; otherwise it may predate that change and is
+	// returned to this caller alone.
+	cached, byID = indexMemes(&idx)
+	g.memesCacheMux.Lock()
+	if g.memesCacheGen == gen {
+		g.setMemesCache(cached, byID)
+	}
+	g.memesCacheMux.Unlock()
+	return cached, byID, nil
+}
+
+// writeMemesIndex persists memes.json and refreshes the in-memory cache with
+// the written state. Callers must hold memesJSONMux.
+func (g *Generator) writeMemesIndex(ctx context.Context, idx *model.MemesIndex) error {
+	if err := g.s3.WriteJSON(ctx, g.cfg.MemesJSONKey, idx); err != nil {
+		return err
+	}
+	g.storeMemesCache(idx)
+	return nil
+}
+
+// InvalidateMemesCache drops the cached memes.json; used by code that writes
+// the index without going through the Generator.
+func (g *Generator) InvalidateMemesCache() {
+	g.memesCacheMux.Lock()
+	g.memesCache = nil
+	g.memesByID = nil
+	g.memesCacheGen++
+	g.memesCacheMux.Unlock()
+}
+
+// GetMemeByID looks a meme up by ID through the cached index — an O(1) map
+// lookup instead of decoding memes.json and scanning it on every request.
+func (g *Generator) GetMemeByID(ctx context.Context, memeID string) (*model.Meme, error) {
+	cached, byID, err := g.memesSnapshot(ctx)
+	if err != nil {
+		return nil, fmt.Errorf("read memes.json: %w", err)
+	}
+	if cached == nil {
+		return nil, fmt.Errorf("no memes found in index")
+	}
+	i, ok := byID[memeID]
+	if !ok {
+		return nil, fmt.Errorf("meme not found: %s", memeID)
+	}
+	meme := cached.Items[i]
+	return &meme, nil
+}
+
+// storeMemesCache caches a copy of idx as the latest state of memes.json.
+func (g *Generator) storeMemesCache(idx *model.MemesIndex) {
+	cached, byID := indexMemes(idx)
+	g.memesCacheMux.Lock()
+	g.setMemesCache(cached, byID)
+	g.memesCacheMux.Unlock()
+}
+
+// setMemesCache installs a cache entry. Callers must hold memesCacheMux.
+func (g *Generator) setMemesCache(cached *model.MemesIndex, byID map[string]int) {
+	g.memesCache = cached
+	g.memesByID = byID
+	g.memesCacheExp = time.Now().Add(memesCacheTTL)
+	g.memesCacheGen++
+}
+
+// indexMemes copies idx and maps each meme ID to its position in the copy.
+func indexMemes(idx *model.MemesIndex) (*model.MemesIndex, map[string]int) {
+	cp := copyMemesIndex(idx)
+	byID := make(map[string]int, len(cp.Items))
+	for i, m := range cp.Items {
+		byID[m.ID] = i
+	}
+	return &cp, byID
+}
+
+// memePosition returns the position of memeID in items, or -1.
+func memePosition(items []model.Meme, memeID string) int {
+	for i := range items {
+		if items[i].ID == memeID {
+			return i
+		}
+	}
+	return -1
+}
+
+func copyMemesIndex(idx *model.MemesIndex) model.MemesIndex {
+	return model.MemesIndex{
+		UpdatedAt: idx.UpdatedAt,
+		Items:     append([]model.Meme(nil), idx.Items...),
+	}
+}
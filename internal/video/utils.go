@@ -1,12 +1,56 @@
 package video
 
 import (
+	"fmt"
 	"math/rand/v2"
+	"os"
+	"os/exec"
 	"sort"
+	"strconv"
+	"sync"
 
 	"meme-video-gen/internal/model"
 )
 
+// exec.Command searches PATH on every call; the ffmpeg/ffprobe binaries are
+// resolved once per process instead. If the lookup fails the bare name is
+// kept so exec reports the usual "not found" error at run time.
+var (
+	ffmpegBin  = sync.OnceValue(func() string { return lookBin("ffmpeg") })
+	ffprobeBin = sync.OnceValue(func() string { return lookBin("ffprobe") })
+)
+
+func lookBin(name string) string {
+	if p, err := exec.LookPath(name); err == nil {
+		return p
+	}
+	return name
+}
+
+// removeFiles deletes temp files, skipping empty paths. A missing file is
+// fine — os.Remove does the existence check itself.
+func removeFiles(paths ...string) {
+	for _, p := range paths {
+		if p != "" {
+			os.Remove(p)
+		}
+	}
+}
+
+// checkOutputFile verifies ffmpeg left a non-empty file at path with a single
+// stat. Inputs are not pre-checked: ffmpeg reports a missing input itself, and
+// a stat before the run could go stale before ffmpeg opens the file anyway.
+func checkOutputFile(path string) error {
+	st, err := os.Stat(path)
+	if err != nil {
+		return fmt.Errorf("ffmpeg did not create output file: %s (%w)", path, err)
+	}
+	if st.Size() == 0 {
+		return fmt.Errorf("ffmpeg produced an empty output file: %s", path)
+	}
+	return nil
+}
+
 func randomIndex(n int) int {
 	if n <= 0 {
 		return 0
@@ -14,6 +58,13 @@ func randomIndex(n int) int {
 	return rand.IntN(n)
 }
 
+// tempSuffix returns a random suffix for temp file names. Unlike a
+// time.Now().UnixNano() stamp it cannot collide between concurrent
+// generations, and it needs no clock read or syscall.
+func tempSuffix() string {
+	return strconv.FormatUint(rand.Uint64(), 16)
+}
+
 // randomAudioOffset returns a start time (in seconds) for sampling a clip from a song.
 // It avoids the first and last ~10% of the track (clamped to [5s, 30s]) so the
 // generated meme never starts right at the intro or fades out at the very end.
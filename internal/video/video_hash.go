@@ -31,19 +31,22 @@ func (g *Generator) IsVideoHashInBlacklist(ctx context.Context, hash uint64) (bo
 		if !found {
 			index = model.VideoHashIndex{Hashes: []uint64{}}
 		}
+		cached = index.Set()
 		g.videoHashCacheMux.Lock()
-		g.videoHashBlacklist = &index
+		g.videoHashBlacklist = cached
 		g.videoHashBlacklistExp = time.Now().Add(5 * time.Minute)
 		g.videoHashCacheMux.Unlock()
-		cached = &index
 	}
 
-	return lo.Contains(cached.Hashes, hash), nil
+	_, ok := cached[hash]
+	return ok, nil
 }
 
-// AddVideoHashToBlacklist adds a hash to the video hash blacklist and invalidates the cache.
-func (g *Generator) AddVideoHashToBlacklist(ctx context.Context, hash uint64) error {
-	if hash == 0 {
+// AddVideoHashToBlacklist adds hashes to the video hash blacklist and invalidates the cache.
+// Several hashes can be added in one read+write of the index.
+func (g *Generator) AddVideoHashToBlacklist(ctx context.Context, hashes ...uint64) error {
+	hashes = lo.Filter(hashes, func(h uint64, _ int) bool { return h != 0 })
+	if len(hashes) == 0 {
 		return nil
 	}
 
@@ -58,9 +61,13 @@ func (g *Generator) AddVideoHashToBlacklist(ctx context.Context, hash uint64) er
 		index = model.VideoHashIndex{Hashes: []uint64{}}
 	}
 
-	if !lo.Contains(index.Hashes, hash) {
-		index.Hashes = append(index.Hashes, hash)
-		g.log.Infof("video_hash: added hash %d to blacklist (total: %d)", hash, len(index.Hashes))
+	existing := index.Set()
+	for _, hash := range hashes {
+		if _, ok := existing[hash]; !ok {
+			existing[hash] = struct{}{}
+			index.Hashes = append(index.Hashes, hash)
+			g.log.Infof("video_hash: added hash %d to blacklist (total: %d)", hash, len(index.Hashes))
+		}
 	}
 
 	err = g.s3.WriteJSON(ctx, g.cfg.VideoHashIndexKey, &index)